@@ -2,37 +2,114 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
+from functools import partial
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any, cast, get_type_hints
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_at
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusIOException
 
+from .aggregation import PhaseAggregator
+from .allocation import FleetCurrentAllocator, async_join_current_budget
 from .const import (
+    BURST_SCAN_DURATION,
+    BURST_SCAN_INTERVAL,
+    CONF_AGGREGATION_WINDOWS,
+    CONF_CHARGING_PRIORITY,
+    CONF_CONNECTION_IDLE_TIMEOUT,
+    CONF_FLEET_CURRENT_BUDGET,
+    CONF_GRID_EXPORT_ENTITY,
+    CONF_GRID_PHASES,
+    CONF_GRID_POWER_ENTITY,
     CONF_HOST,
+    CONF_MAIN_FUSE_LIMIT,
+    CONF_PIPELINE_DEPTH,
+    CONF_IDLE_SCAN_INTERVAL,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_UNIT_ID,
+    CONF_WRITE_COALESCE_WINDOW,
+    DEFAULT_AGGREGATION_WINDOWS,
+    DEFAULT_CHARGING_PRIORITY,
+    DEFAULT_GRID_PHASES,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_PIPELINE_DEPTH,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_UNIT_ID,
+    DEFAULT_WRITE_COALESCE_WINDOW,
     DOMAIN,
+    KEY_LAST_COMMAND,
     MODBUS_READ_TIMEOUT,
     PLATFORMS,
     AbbTerraAcData,
 )
-from .modbus import async_close_client, async_modbus_call
-from .modbus_write import async_write_register, async_write_registers
+from .load_balancing import AbbTerraAcLoadBalancer
+from .pv_surplus import AbbTerraAcPvSurplus
+from .modbus import (
+    CircuitBreaker,
+    CircuitState,
+    ModbusPollStats,
+    ModbusRequestDropped,
+    ModbusRequestQueue,
+    PooledModbusConnection,
+    RequestPriority,
+    async_get_connection_pool,
+    async_modbus_call,
+    modbus_client_stats,
+)
+from .modbus_write import (
+    CoalescingRegisterWriter,
+    async_write_register,
+    async_write_registers,
+)
+from .energy_statistics import HourlyEnergyStatistics
+from .registers import (
+    REGISTER_BLOCK_ADDRESS,
+    REGISTER_BLOCK_COUNT,
+    REGISTER_GROUP_CONFIG,
+    REGISTER_GROUP_IDENTITY,
+    REGISTER_GROUPS,
+    RegisterGroup,
+    decode_register_block,
+    field_span,
+    fields_in_span,
+    pack_registers_into,
+    register_span,
+)
+from .scheduler import AbbTerraAcPollScheduler, async_join_fleet
 from .session_state import LastCommand, SessionState, derive_session_state
+from .sessions import SessionLog, SessionRecorder
+from .store import AbbTerraAcStore
 
 _LOGGER = logging.getLogger(__name__)
 
 _ISSUE_ID_INVALID_FALLBACK_LIMIT = "invalid_fallback_limit"
 _ISSUE_ID_INVALID_CURRENT_LIMIT = "invalid_current_limit"
 
+# Sessions in these states poll at the (slower) idle interval.
+_IDLE_SESSION_STATES = frozenset({SessionState.IDLE, SessionState.COMPLETED})
+
+# A snapshot must carry every coordinator data key to be used for warm start.
+_DATA_KEYS = frozenset(get_type_hints(AbbTerraAcData))
+
+# Status block slices read back after writing the current and fallback limits.
+_LIMIT_READBACK = {
+    16640: field_span("charging_current_limit_modbus"),
+    16649: field_span("fallback_limit"),
+}
+
 
 @dataclass
 class AbbTerraAcRuntimeData:
@@ -47,15 +124,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    client = AsyncModbusTcpClient(
-        host=host,
-        port=port,
-        timeout=MODBUS_READ_TIMEOUT,
+    # Chargers behind one Modbus TCP gateway share its socket (by unit id).
+    pool = async_get_connection_pool(hass)
+    connection = pool.acquire(
+        host,
+        port,
+        entry.entry_id,
+        lambda: AsyncModbusTcpClient(
+            host=host,
+            port=port,
+            timeout=MODBUS_READ_TIMEOUT,
+        ),
+        unit_id=int(entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)),
+        pipeline_depth=int(
+            entry.options.get(CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH)
+        ),
+        idle_timeout=int(entry.options.get(CONF_CONNECTION_IDLE_TIMEOUT, 0)),
+    )
+    entry.async_on_unload(partial(pool.async_release, host, port, entry.entry_id))
+
+    scheduler = async_join_fleet(hass, entry)
+    store = AbbTerraAcStore(hass, entry.entry_id)
+    coordinator = AbbTerraAcDataUpdateCoordinator(
+        hass, connection, entry, scheduler, store
+    )
+    # Import the hours that closed since the last batch when the entry unloads.
+    entry.async_on_unload(coordinator.energy_statistics.async_flush)
+
+    # The auto-fix needs the last valid limits before the first poll, which
+    # may already see a charger that rebooted while Home Assistant was down.
+    if (limits := await store.async_load_limits()) is not None:
+        coordinator.async_restore_limits(limits)
+    snapshot = await store.async_load()
+    if snapshot is not None and coordinator.async_restore_snapshot(snapshot):
+        # Warm start: entities come up from the snapshot at once and the first
+        # live poll runs in the background instead of blocking setup.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} first refresh {entry.entry_id}",
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    entry.runtime_data = AbbTerraAcRuntimeData(
+        coordinator=coordinator, client=connection.client
     )
-    coordinator = AbbTerraAcDataUpdateCoordinator(hass, client, entry)
 
-    await coordinator.async_config_entry_first_refresh()
-    entry.runtime_data = AbbTerraAcRuntimeData(coordinator=coordinator, client=client)
+    grid_phases = int(entry.options.get(CONF_GRID_PHASES, DEFAULT_GRID_PHASES))
+    power_entity_id = entry.options.get(CONF_GRID_POWER_ENTITY)
+    fuse_limit = float(entry.options.get(CONF_MAIN_FUSE_LIMIT, 0))
+    if fleet_budget := int(entry.options.get(CONF_FLEET_CURRENT_BUDGET, 0)):
+        # The shared budget owns the limit of every charger that joins it.
+        entry.async_on_unload(
+            async_join_current_budget(
+                hass,
+                coordinator,
+                fleet_budget,
+                int(
+                    entry.options.get(
+                        CONF_CHARGING_PRIORITY, DEFAULT_CHARGING_PRIORITY
+                    )
+                ),
+            )
+        )
+    elif export_entity_id := entry.options.get(CONF_GRID_EXPORT_ENTITY):
+        # Charging on surplus never imports, so it replaces load balancing.
+        coordinator.pv_surplus = AbbTerraAcPvSurplus(
+            hass, coordinator, export_entity_id, grid_phases, power_entity_id
+        )
+        entry.async_on_unload(coordinator.pv_surplus.async_start())
+    elif power_entity_id and fuse_limit > 0:
+        coordinator.load_balancer = AbbTerraAcLoadBalancer(
+            hass, coordinator, power_entity_id, fuse_limit, grid_phases
+        )
+        entry.async_on_unload(coordinator.load_balancer.async_start())
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -84,14 +226,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        client = entry.runtime_data.client
-        if client.connected:
-            await async_close_client(client)
+        # The pooled client is closed by the entry's unload callback once no
+        # other entry shares it.
         entry.runtime_data = None
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored state and session history of a removed config entry."""
+    await AbbTerraAcStore(hass, entry.entry_id).async_remove()
+    await SessionLog(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
@@ -103,18 +250,113 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
     """Coordinator for fetching data from the charger."""
 
     def __init__(
-        self, hass: HomeAssistant, client: AsyncModbusTcpClient, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        connection: PooledModbusConnection,
+        entry: ConfigEntry,
+        scheduler: AbbTerraAcPollScheduler | None = None,
+        store: AbbTerraAcStore | None = None,
     ) -> None:
         """Initialize the DataUpdateCoordinator."""
-        self.client = client
+        self.client = connection.client
+        self.unit_id = int(entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID))
+        self._connection = connection
+        self._connection_generation = connection.generation
+        # Fleet mode: polls run in this entry's staggered slot and count
+        # against the domain-wide cap on concurrent Modbus polls.
+        self.scheduler = scheduler
+        # Warm-start snapshot on disk, saved write-behind as data changes.
+        self._store = store
+        self.warm_started = False
+        # True once data came from the charger rather than the snapshot.
+        self.polled = False
+        # Charging sessions: the one in progress, and finished ones on disk.
+        self.session_recorder = SessionRecorder()
+        self.session_log = SessionLog(hass, entry.entry_id)
+        # Hourly energy and power, imported into long-term statistics.
+        self.energy_statistics = HourlyEnergyStatistics(
+            hass, entry.entry_id, entry.title
+        )
         self.config_entry = entry
         self.entry_id = entry.entry_id
-        self._modbus_lock = asyncio.Lock()
+        # Shared with every entry on the same host:port.
+        self._modbus_lock = connection.queue
+        # This charger's own poll round trips, apart from the shared client.
+        self.poll_stats = ModbusPollStats()
+        # Circuit breaker transitions of the connection are reported like
+        # availability changes.
+        entry.async_on_unload(
+            modbus_client_stats(self.client).breaker.add_listener(
+                self._async_breaker_changed
+            )
+        )
         scan_s = int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        idle_s = int(
+            entry.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)
+        )
+        # Adaptive polling: fast while a session is running, slow while idle,
+        # sub-second for a few seconds after a control action. Polls are
+        # timed by this class, not by the base class' update_interval.
+        self._active_update_interval = timedelta(seconds=scan_s)
+        self._idle_update_interval = timedelta(seconds=max(idle_s, scan_s))
+        self.poll_interval = self._active_update_interval
+        self._burst_until = 0.0
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._polling_stopped = False
+
         self.serial_number: str | None = None
         self._is_available = True
         self.last_command: str = LastCommand.NONE
 
+        # Change tracking: keys that differ from the data last published to
+        # listeners (None: everything changed), so entities can skip state
+        # writes for unchanged inputs.
+        self.changed_keys: frozenset[str] | None = None
+        self._published_data: dict[str, object] | None = None
+        self._published_last_command: str = self.last_command
+        self._published_update_success = True
+
+        # Register-group scheduler: last raw value of every register in the
+        # 4000h block (packed big-endian) and when each group was last read.
+        self._raw_registers = bytearray(REGISTER_BLOCK_COUNT * 2)
+        self._register_group_read_at: dict[str, float] = {}
+
+        # Current/fallback limit writes from the number entities: bursts are
+        # merged and each register is verified by reading back its mirror.
+        window_ms = int(
+            entry.options.get(CONF_WRITE_COALESCE_WINDOW, DEFAULT_WRITE_COALESCE_WINDOW)
+        )
+        self.limit_writer = CoalescingRegisterWriter(
+            hass,
+            entry,
+            self.client,
+            lock=self._modbus_lock,
+            unit_id=self.unit_id,
+            window=window_ms / 1000,
+            readback=_LIMIT_READBACK,
+            on_readback=self._async_apply_limit_readback,
+        )
+
+        # Per-phase voltage/current statistics over the configured windows
+        # (minutes), kept in memory and published by the window sensors.
+        self.aggregation_windows: tuple[int, ...] = tuple(
+            sorted(
+                int(window)
+                for window in entry.options.get(
+                    CONF_AGGREGATION_WINDOWS, DEFAULT_AGGREGATION_WINDOWS
+                )
+            )
+        )
+        self.phase_aggregator = PhaseAggregator(
+            horizon=max(self.aggregation_windows, default=0) * 60
+        )
+        # Set up by async_setup_entry when a grid meter and fuse are configured.
+        self.load_balancer: AbbTerraAcLoadBalancer | None = None
+        # Set up instead of the load balancer when a grid export sensor is set.
+        self.pv_surplus: AbbTerraAcPvSurplus | None = None
+        # Set while the charger shares a fleet current budget.
+        self.current_allocator: FleetCurrentAllocator | None = None
+
         # Firmware bug auto-fix: fallback limit
         self._last_valid_fallback_limit: int | None = None
         self._fallback_fix_attempted = False
@@ -122,12 +364,14 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
         # Firmware bug auto-fix: charging current limit
         self._last_valid_current_limit: int | None = None
         self._current_limit_fix_attempted = False
+        # Limits as last handed to the store, to write only on change.
+        self._persisted_limits: tuple[int | None, int | None] = (None, None)
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_s),
+            update_interval=None,
         )
 
     def _async_create_limit_issue(
@@ -157,73 +401,75 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
         """Delete a previously created invalid charger limit issue."""
         ir.async_delete_issue(self.hass, DOMAIN, f"{issue_id}_{self.entry_id}")
 
+    def invalidate_register_groups(self, *groups: RegisterGroup) -> None:
+        """Force the given register groups (default: all) to be read on the next poll."""
+        if not groups:
+            self._register_group_read_at.clear()
+            return
+        for group in groups:
+            self._register_group_read_at.pop(group.name, None)
+
+    def _due_register_groups(self, now: float) -> list[RegisterGroup]:
+        """Return the register groups whose cadence has elapsed."""
+        due: list[RegisterGroup] = []
+        for group in REGISTER_GROUPS:
+            read_at = self._register_group_read_at.get(group.name)
+            if read_at is None or (
+                group.interval is not None and now - read_at >= group.interval
+            ):
+                due.append(group)
+        return due
+
     async def _async_update_data(self) -> AbbTerraAcData:
         """Fetch the latest data from the charger."""
         try:
+            connection = self._connection
+            # A new TCP session may follow a charger reboot or firmware
+            # update, so identity and configuration are re-read as well.
+            new_session = (
+                not self.client.connected
+                or connection.generation != self._connection_generation
+            )
+            if new_session:
+                self.invalidate_register_groups()
+
+            now = monotonic()
+            groups = self._due_register_groups(now)
+            offset, count = register_span(groups)
             result = await async_modbus_call(
                 self.client,
                 "read_holding_registers",
                 lock=self._modbus_lock,
+                priority=self._poll_priority(),
+                max_wait=self._poll_max_wait(),
                 retry=True,
-                address=16384,
-                count=37,
+                transaction=self._async_poll_transaction(),
+                poll_stats=self.poll_stats,
+                address=REGISTER_BLOCK_ADDRESS + offset,
+                count=count,
+                device_id=self.unit_id,
             )
 
             if result.isError():
                 self._async_log_unavailable(f"Error reading registers: {result}")
                 raise UpdateFailed(f"Error reading registers: {result}")
 
-            data: AbbTerraAcData = {
-                "serial_number": "",
-                "firmware_version": "",
-                "user_settable_max_current": 0.0,
-                "error_code": 0,
-                "socket_lock_state": 0,
-                "charging_state": 0,
-                "charging_current_limit": 0.0,
-                "charging_current_l1": 0.0,
-                "charging_current_l2": 0.0,
-                "charging_current_l3": 0.0,
-                "voltage_l1": 0.0,
-                "voltage_l2": 0.0,
-                "voltage_l3": 0.0,
-                "active_power": 0.0,
-                "energy_delivered": 0.0,
-                "communication_timeout": 0,
-                "charging_current_limit_modbus": 0.0,
-                "fallback_limit": 0,
-            }
-            registers = result.registers
-
-            # Serial number - read only once
-            if self.serial_number is None:
-                self.serial_number = self._decode_serial_number(registers[0:4])
-            data["serial_number"] = self.serial_number
-
-            data["firmware_version"] = self._decode_firmware_version(registers[4:6])
-            data["user_settable_max_current"] = self._decode_32bit_value(registers[6:8], 0.001)
-            data["error_code"] = registers[8]
-            data["socket_lock_state"] = int(self._decode_32bit_value(registers[10:12]))
-
-            # Charging state: per testing, actual state is in register 400Dh (index 13),
-            # encoded in the high byte. Documentation states 400Ch but it always returns 0.
-            charging_state_register = registers[13]
-            high_byte = (charging_state_register >> 8) & 0xFF
-            state_code = high_byte & 0x0F
-            data["charging_state"] = state_code
-
-            data["charging_current_limit"] = self._decode_32bit_value(registers[14:16], 0.001)
-            data["charging_current_l1"] = self._decode_32bit_value(registers[16:18], 0.001)
-            data["charging_current_l2"] = self._decode_32bit_value(registers[18:20], 0.001)
-            data["charging_current_l3"] = self._decode_32bit_value(registers[20:22], 0.001)
-            data["voltage_l1"] = self._decode_32bit_value(registers[22:24], 0.1)
-            data["voltage_l2"] = self._decode_32bit_value(registers[24:26], 0.1)
-            data["voltage_l3"] = self._decode_32bit_value(registers[26:28], 0.1)
-            data["active_power"] = self._decode_32bit_value(registers[28:30])
-            data["energy_delivered"] = self._decode_32bit_value(registers[30:32])
-            data["communication_timeout"] = registers[32]
-            data["charging_current_limit_modbus"] = self._decode_32bit_value(registers[34:36], 0.001)
-            data["fallback_limit"] = registers[36]
+            pack_registers_into(
+                self._raw_registers, offset, result.registers[:count]
+            )
+            for group in groups:
+                self._register_group_read_at[group.name] = now
+            if new_session:
+                # Every group was read on the new session. A reconnect in
+                # the retry path of an ordinary poll stays unacknowledged,
+                # so the next poll re-reads every group.
+                self._connection_generation = connection.generation
+
+            if REGISTER_GROUP_IDENTITY in groups:
+                # Re-decode the serial number whenever identity was re-read.
+                self.serial_number = None
+            data = decode_register_block(self._raw_registers, self.serial_number)
+            self.serial_number = data["serial_number"]
 
             # --- Firmware bug fix: Fallback Limit ---
             # Known firmware bug: fallback limit resets to 256 after unexpected reboot.
@@ -240,6 +486,9 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
                     "Invalid fallback limit detected: %sA (max allowed: %sA). Attempting to restore.",
                     fallback_limit, user_max
                 )
+                # A reset-to-default limit means the charger rebooted behind
+                # our back: re-read every group (firmware may have changed).
+                self.invalidate_register_groups()
                 if not self._fallback_fix_attempted:
                     self._fallback_fix_attempted = True
                     restore_value = self._last_valid_fallback_limit if self._last_valid_fallback_limit is not None else user_max
@@ -249,6 +498,8 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
                             16649,
                             int(restore_value),
                             lock=self._modbus_lock,
+                            unit_id=self.unit_id,
+                            priority=RequestPriority.FIRMWARE_FIX,
                         )
                         _LOGGER.info("Fallback limit restored to %sA.", restore_value)
                         data["fallback_limit"] = restore_value
@@ -276,6 +527,7 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
                     "Invalid charging current limit detected: %sA (max allowed: %sA). Attempting to restore.",
                     current_limit, user_max
                 )
+                self.invalidate_register_groups()
                 if not self._current_limit_fix_attempted:
                     self._current_limit_fix_attempted = True
                     restore_value = self._last_valid_current_limit if self._last_valid_current_limit is not None else user_max
@@ -288,6 +540,8 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
                             16640,
                             [high_word, low_word],
                             lock=self._modbus_lock,
+                            unit_id=self.unit_id,
+                            priority=RequestPriority.FIRMWARE_FIX,
                         )
                         _LOGGER.info("Charging current limit restored to %sA.", restore_value)
                         data["charging_current_limit_modbus"] = restore_value
@@ -301,12 +555,20 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
                             user_max,
                         )
 
-            if not self._is_available:
-                _LOGGER.info("ABB Terra AC charger is available again")
-            self._is_available = True
+            self._async_persist_limits()
+
+            self._async_log_available()
             self._sync_last_command_after_poll(data)
+            self.polled = True
+            self._record_poll(data)
+            self._adapt_update_interval(data)
             return data
 
+        except ModbusRequestDropped as err:
+            if self.data is None:
+                raise UpdateFailed(f"Poll dropped: {err}") from err
+            _LOGGER.debug("Skipping stale poll: %s", err)
+            return self.data
         except (ConnectionException, asyncio.TimeoutError, ModbusIOException) as err:
             self._async_log_unavailable(f"Connection error: {err}")
             raise UpdateFailed(f"Connection error: {err}")
@@ -315,6 +577,82 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
             _LOGGER.error("Unexpected error: %s", err, exc_info=True)
             raise UpdateFailed(err)
 
+    def _poll_priority(self) -> RequestPriority:
+        """Queue priority of the next poll: idle chargers yield to busy ones."""
+        if self.poll_interval == self._idle_update_interval:
+            return RequestPriority.SLOW_POLL
+        return RequestPriority.FAST_POLL
+
+    def _poll_max_wait(self) -> float | None:
+        """Queue wait after which a poll is stale: one poll interval."""
+        return self.poll_interval.total_seconds()
+
+    def _async_poll_transaction(self) -> AbstractAsyncContextManager[None]:
+        """Fleet poll slot for one register read (no-op outside fleet mode).
+
+        Entered once the connection's queue granted the read, so polls
+        waiting on a slow gateway do not hold slots other chargers need.
+        """
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.async_poll_transaction()
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Schedule the next poll after every refresh, scheduled or not."""
+        self._async_schedule_poll()
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll on this entry's slot at ``poll_interval``.
+
+        In fleet mode the poll lands on the entry's staggered slot, otherwise
+        one interval from now. Loop time is kept to the sub-second, so the
+        0.5 s burst cadence holds.
+        """
+        self._async_cancel_poll()
+        if (
+            self._polling_stopped
+            or self.hass.is_stopping
+            or self.config_entry is None
+            or self.config_entry.pref_disable_polling
+        ):
+            return
+        interval = self.poll_interval.total_seconds()
+        now = self.hass.loop.time()
+        if self.scheduler is not None:
+            next_at = self.scheduler.next_poll_at(self.entry_id, now, interval)
+        else:
+            next_at = now + interval
+        self._unsub_poll = async_call_at(self.hass, self._async_handle_poll, next_at)
+
+    @callback
+    def _async_cancel_poll(self) -> None:
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    @callback
+    def _async_handle_poll(self, _now: datetime) -> None:
+        self._unsub_poll = None
+        if self.config_entry is None:
+            return
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN} poll {self.entry_id}"
+        )
+
+    @callback
+    def async_set_updated_data(self, data: AbbTerraAcData) -> None:
+        """Publish pushed data and restart the poll interval, as polls do."""
+        super().async_set_updated_data(data)
+        self._async_schedule_poll()
+
+    async def async_shutdown(self) -> None:
+        """Stop polling along with the base class' scheduled calls."""
+        self._polling_stopped = True
+        self._async_cancel_poll()
+        await super().async_shutdown()
+
     def _sync_last_command_after_poll(self, data: AbbTerraAcData) -> None:
         """Clear last_command when the cable is unplugged or the session ends."""
         if data["socket_lock_state"] == 0:
@@ -331,75 +669,227 @@ class AbbTerraAcDataUpdateCoordinator(DataUpdateCoordinator[AbbTerraAcData]):
             else:
                 self.last_command = LastCommand.NONE
 
+    def _record_poll(self, data: AbbTerraAcData) -> None:
+        """Feed a poll to the session recorder and the statistics aggregators."""
+        if self.aggregation_windows:
+            self.phase_aggregator.add(monotonic(), data)
+        now = dt_util.utcnow()
+        completed = self.session_recorder.update(
+            now, data, self._derive_session_state(data)
+        )
+        if completed:
+            self.hass.async_create_background_task(
+                self.session_log.async_append(completed),
+                f"{DOMAIN} session log {self.entry_id}",
+            )
+        if self.energy_statistics.async_add(now, data):
+            self.hass.async_create_background_task(
+                self.energy_statistics.async_flush(),
+                f"{DOMAIN} energy statistics {self.entry_id}",
+            )
+
+    async def async_get_sessions(self, count: int) -> list[dict[str, Any]]:
+        """Return the last ``count`` finished sessions, oldest first."""
+        return [
+            record.as_dict()
+            for record in await self.session_log.async_get_sessions(count)
+        ]
+
+    def _derive_session_state(self, data: AbbTerraAcData) -> SessionState:
+        """Session state for one poll result and the current last_command."""
+        return derive_session_state(
+            charging_state_raw=data["charging_state"],
+            current_limit_modbus=float(data["charging_current_limit_modbus"]),
+            last_command=self.last_command,
+            charging_current_l1=float(data["charging_current_l1"]),
+            charging_current_l2=float(data["charging_current_l2"]),
+            charging_current_l3=float(data["charging_current_l3"]),
+        )
+
     @property
     def session_state(self) -> SessionState:
         """Derived session state from the latest poll and last_command."""
         if not self.data:
             return SessionState.UNKNOWN
-        return derive_session_state(
-            charging_state_raw=self.data["charging_state"],
-            current_limit_modbus=float(self.data["charging_current_limit_modbus"]),
-            last_command=self.last_command,
-            charging_current_l1=float(self.data["charging_current_l1"]),
-            charging_current_l2=float(self.data["charging_current_l2"]),
-            charging_current_l3=float(self.data["charging_current_l3"]),
+        return self._derive_session_state(self.data)
+
+    def _adapt_update_interval(self, data: AbbTerraAcData) -> None:
+        """Pick the next poll interval from the session state of ``data``."""
+        if monotonic() < self._burst_until:
+            self.poll_interval = BURST_SCAN_INTERVAL
+        elif (
+            data["socket_lock_state"] == 0
+            or self._derive_session_state(data) in _IDLE_SESSION_STATES
+        ):
+            self.poll_interval = self._idle_update_interval
+        else:
+            self.poll_interval = self._active_update_interval
+
+    @callback
+    def _async_start_burst(self) -> None:
+        """Poll at sub-second cadence for a few seconds."""
+        self._burst_until = monotonic() + BURST_SCAN_DURATION
+        self.poll_interval = BURST_SCAN_INTERVAL
+        self._async_schedule_poll()
+
+    async def async_request_burst_refresh(self) -> None:
+        """Refresh now and keep polling at sub-second cadence for a few seconds.
+
+        The regular interval resumes once the burst expires.
+        """
+        self._async_start_burst()
+        await self.async_request_refresh()
+
+    async def async_apply_readback(
+        self, offset: int, registers: Sequence[int] | None
+    ) -> None:
+        """Publish status registers read back right after a control write.
+
+        Only the fields stored in the read-back slice are patched into the
+        data; the charger's further reaction is followed by a short burst of
+        regular polls. Without a read-back (it failed, or there is no data
+        yet), fall back to a full burst refresh.
+        """
+        if registers is None or self.data is None:
+            await self.async_request_burst_refresh()
+            return
+        pack_registers_into(self._raw_registers, offset, registers)
+        decoded = decode_register_block(self._raw_registers, self.serial_number)
+        data = self.data.copy()
+        for name in fields_in_span(offset, len(registers)):
+            data[name] = decoded[name]  # type: ignore[literal-required]
+        self._sync_last_command_after_poll(data)
+        self._async_start_burst()
+        self.async_set_updated_data(data)
+
+    async def _async_apply_limit_readback(
+        self, offset: int, registers: Sequence[int] | None
+    ) -> None:
+        """Publish a limit read-back; the next poll re-reads the config group.
+
+        The read-back patches only the fields in its slice, so the config
+        group would otherwise wait for its 60 s cadence to catch up (or stay
+        stale altogether when the read-back failed).
+        """
+        self.invalidate_register_groups(REGISTER_GROUP_CONFIG)
+        await self.async_apply_readback(offset, registers)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Publish which data keys changed since the last update, then notify."""
+        data = self.data
+        previous = self._published_data
+        if (
+            data is None
+            or previous is None
+            or self.last_update_success != self._published_update_success
+        ):
+            # First data or an availability flip: every entity must write.
+            self.changed_keys = None
+        else:
+            changed = {key for key, value in data.items() if previous.get(key) != value}
+            if self.last_command != self._published_last_command:
+                changed.add(KEY_LAST_COMMAND)
+            self.changed_keys = frozenset(changed)
+        self._published_data = dict(data) if data is not None else None
+        self._published_last_command = self.last_command
+        self._published_update_success = self.last_update_success
+        if self._store is not None and data is not None and (
+            self.changed_keys is None or self.changed_keys
+        ):
+            self._store.async_schedule_save(self._snapshot)
+        super().async_update_listeners()
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Warm-start snapshot of the latest data and remembered limits."""
+        return {
+            "data": dict(self.data) if self.data is not None else None,
+            "serial_number": self.serial_number,
+        }
+
+    def _limits(self) -> dict[str, Any]:
+        """Last valid limits as persisted for the firmware auto-fix."""
+        return {
+            "fallback_limit": self._last_valid_fallback_limit,
+            "current_limit": self._last_valid_current_limit,
+        }
+
+    @callback
+    def _async_persist_limits(self) -> None:
+        """Schedule a save of the last valid limits if they changed."""
+        limits = (self._last_valid_fallback_limit, self._last_valid_current_limit)
+        if self._store is None or limits == self._persisted_limits:
+            return
+        self._persisted_limits = limits
+        self._store.async_schedule_save_limits(self._limits)
+
+    @callback
+    def async_restore_limits(self, limits: dict[str, Any]) -> None:
+        """Seed the auto-fix with limits saved before a restart."""
+        fallback_limit = limits.get("fallback_limit")
+        current_limit = limits.get("current_limit")
+        if isinstance(fallback_limit, int):
+            self._last_valid_fallback_limit = fallback_limit
+        if isinstance(current_limit, int):
+            self._last_valid_current_limit = current_limit
+        self._persisted_limits = (
+            self._last_valid_fallback_limit,
+            self._last_valid_current_limit,
         )
 
-    def _async_log_unavailable(self, reason: str) -> None:
-        """Log when the charger becomes unavailable without spamming logs."""
+    @callback
+    def async_restore_snapshot(self, snapshot: dict[str, Any]) -> bool:
+        """Seed data from a saved snapshot; False if it is unusable."""
+        data = snapshot.get("data")
+        if not isinstance(data, dict) or not _DATA_KEYS <= data.keys():
+            return False
+        self.data = cast(AbbTerraAcData, {key: data[key] for key in _DATA_KEYS})
+        self.serial_number = snapshot.get("serial_number")
+        self.warm_started = True
+        return True
+
+    def _async_log_unavailable(self, reason: str, *, transition: bool = False) -> None:
+        """Log when the charger becomes unavailable without spamming logs.
+
+        Repeated failures while down are logged at debug level; circuit
+        breaker ``transition`` reports at info level.
+        """
         if self._is_available:
             _LOGGER.warning("ABB Terra AC charger became unavailable: %s", reason)
+        elif transition:
+            _LOGGER.info("ABB Terra AC charger still unavailable: %s", reason)
+        else:
+            _LOGGER.debug("ABB Terra AC charger still unavailable: %s", reason)
         self._is_available = False
 
-    @property
-    def modbus_lock(self) -> asyncio.Lock:
-        """Shared lock used to serialize Modbus reads and writes."""
-        return self._modbus_lock
-
-    def _decode_32bit_value(self, regs: list[int], resolution: float = 1) -> float:
-        """Decode a 32-bit value from two registers."""
-        value = (regs[0] << 16) | regs[1]
-        return value * resolution
+    def _async_log_available(self) -> None:
+        """Log once when the charger answers again."""
+        if not self._is_available:
+            _LOGGER.info("ABB Terra AC charger is available again")
+        self._is_available = True
 
-    def _decode_serial_number(self, regs: list[int]) -> str:
-        """Decode serial number from registers."""
-        try:
-            connector_type = {0x47: "G", 0x50: "P", 0x53: "S", 0x54: "T"}
-            rated_power_map = {0x07: "7", 0x11: "11", 0x22: "22"}
-
-            byte7 = (regs[0] >> 8) & 0xFF
-            byte6 = regs[0] & 0xFF
-            byte5 = (regs[1] >> 8) & 0xFF
-            byte3 = (regs[2] >> 8) & 0xFF
-            byte2 = regs[2] & 0xFF
-            byte1 = (regs[3] >> 8) & 0xFF
-            byte0 = regs[3] & 0xFF
-
-            connector = connector_type.get(byte7, f"Unknown (0x{byte7:02X})")
-            rated_power = rated_power_map.get(byte6, str(byte6))
-            plant_id = byte5
-            prod_week = ((byte3 >> 4) & 0xF) * 10 + (byte3 & 0xF)
-            prod_year = ((byte2 >> 4) & 0xF) * 10 + (byte2 & 0xF)
-            serial_num = (
-                ((byte1 >> 4) & 0xF) * 1000 +
-                (byte1 & 0xF) * 100 +
-                ((byte0 >> 4) & 0xF) * 10 +
-                (byte0 & 0xF)
+    @callback
+    def _async_breaker_changed(self, breaker: CircuitBreaker) -> None:
+        """Report circuit breaker transitions of the charger's connection."""
+        if breaker.state is CircuitState.CLOSED:
+            self._async_log_available()
+        elif breaker.state is CircuitState.HALF_OPEN:
+            self._async_log_unavailable(
+                "connection circuit half-open, probing the charger", transition=True
+            )
+        else:
+            self._async_log_unavailable(
+                "connection circuit open, next connect attempt in "
+                f"{max(breaker.retry_at - monotonic(), 0):.0f}s",
+                transition=True,
             )
 
-            return f"TACW{rated_power}-{plant_id}-{prod_week:02d}{prod_year:02d}-{connector}{serial_num:04d}"
-        except Exception as err:
-            _LOGGER.warning("Failed to decode serial number: %s", err)
-            return f"Decode error: {regs}"
+    @property
+    def connection(self) -> PooledModbusConnection:
+        """Pooled Modbus connection this entry polls through."""
+        return self._connection
 
-    def _decode_firmware_version(self, regs: list[int]) -> str:
-        """Decode firmware version from registers."""
-        try:
-            major = (regs[0] >> 8) & 0xFF
-            minor = regs[0] & 0xFF
-            patch = (regs[1] >> 8) & 0xFF
-            patch_bcd = ((patch >> 4) & 0xF) * 10 + (patch & 0xF)
-            return f"v{major}.{minor}.{patch_bcd}"
-        except Exception as err:
-            _LOGGER.warning("Failed to decode firmware version: %s", err)
-            return f"Decode error: {regs}"
+    @property
+    def modbus_lock(self) -> ModbusRequestQueue:
+        """Priority queue serializing Modbus requests on this entry's connection."""
+        return self._modbus_lock
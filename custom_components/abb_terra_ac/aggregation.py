@@ -0,0 +1,97 @@
+"""In-memory windowed statistics of the per-phase voltages and currents."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from .const import MAX_AGGREGATION_SAMPLES, AbbTerraAcData
+
+# Order of the values in every buffered row.
+PHASE_KEYS: tuple[str, ...] = (
+    "voltage_l1",
+    "voltage_l2",
+    "voltage_l3",
+    "charging_current_l1",
+    "charging_current_l2",
+    "charging_current_l3",
+)
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Summary of one key over one window."""
+
+    samples: int
+    mean: float
+    minimum: float
+    maximum: float
+    stddev: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Attributes published next to the mean."""
+        return {
+            "min": round(self.minimum, 2),
+            "max": round(self.maximum, 2),
+            "stddev": round(self.stddev, 3),
+            "samples": self.samples,
+        }
+
+
+class PhaseAggregator:
+    """Ring buffer of poll samples, summarized over trailing windows.
+
+    Samples older than ``horizon`` seconds are evicted on every add, and the
+    buffer never holds more than ``max_samples`` rows however fast polls come.
+    Timestamps are monotonic seconds.
+    """
+
+    def __init__(
+        self, horizon: float, max_samples: int = MAX_AGGREGATION_SAMPLES
+    ) -> None:
+        """Initialize an empty buffer covering ``horizon`` seconds."""
+        self.horizon = horizon
+        self._rows: deque[tuple[float, tuple[float, ...]]] = deque(
+            maxlen=max_samples
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, now: float, data: AbbTerraAcData) -> None:
+        """Append the phase values of one poll."""
+        values = (
+            data["voltage_l1"],
+            data["voltage_l2"],
+            data["voltage_l3"],
+            data["charging_current_l1"],
+            data["charging_current_l2"],
+            data["charging_current_l3"],
+        )
+        self._rows.append((now, tuple(float(value) for value in values)))
+        cutoff = now - self.horizon
+        while self._rows and self._rows[0][0] < cutoff:
+            self._rows.popleft()
+
+    def stats(self, key: str, window: float, now: float) -> WindowStats | None:
+        """Statistics of ``key`` over the last ``window`` seconds, if any samples."""
+        index = PHASE_KEYS.index(key)
+        cutoff = now - window
+        values = []
+        for timestamp, row in reversed(self._rows):
+            if timestamp < cutoff:
+                break
+            values.append(row[index])
+        if not values:
+            return None
+        mean = math.fsum(values) / len(values)
+        variance = math.fsum((v - mean) ** 2 for v in values) / len(values)
+        return WindowStats(
+            samples=len(values),
+            mean=mean,
+            minimum=min(values),
+            maximum=max(values),
+            stddev=math.sqrt(variance),
+        )
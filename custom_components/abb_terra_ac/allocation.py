@@ -0,0 +1,297 @@
+"""Domain-level split of one feeder's current budget across chargers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+from .load_balancing import MIN_CHARGING_CURRENT, async_write_current_limit
+from .session_state import SessionState, vehicle_connected_from_socket_lock
+
+if TYPE_CHECKING:
+    from . import AbbTerraAcDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sessions that hold a share of the budget. A charger paused by current may
+# be paused for lack of budget and must get its share back; an unknown state
+# (e.g. unreachable charger) keeps its share rather than risk an overload.
+_DEMANDING_STATES = frozenset(
+    {SessionState.ACTIVE, SessionState.PAUSED_BY_CURRENT, SessionState.UNKNOWN}
+)
+
+
+@dataclass(frozen=True)
+class ChargerDemand:
+    """One charger's claim on the budget."""
+
+    entry_id: str
+    state: SessionState
+    maximum: float
+    priority: int = 1
+    vehicle_connected: bool = False
+
+
+def _demand_cap(demand: ChargerDemand) -> float:
+    """Most ``demand`` may get (A); 0 when it claims no share at all."""
+    if demand.state in _DEMANDING_STATES:
+        return demand.maximum
+    if demand.state is SessionState.IDLE and demand.vehicle_connected:
+        # Plugged in but not drawing yet: the minimum lets the vehicle start,
+        # and the next pass gives it a full share once it is charging.
+        return min(demand.maximum, MIN_CHARGING_CURRENT)
+    return 0
+
+
+def allocate_current(
+    budget: float, demands: Sequence[ChargerDemand]
+) -> dict[str, int]:
+    """Split ``budget`` (A) into whole-amp limits, one per charger.
+
+    Unplugged, completed and stopped chargers get 0 A; a plugged-in vehicle
+    that has not started yet gets just the 6 A minimum. Every other charger
+    gets the 6 A minimum first, dropping the lowest priorities when the
+    budget cannot cover that. The rest is shared in proportion to priority,
+    never above a charger's maximum; what a capped charger cannot use goes
+    to the others.
+    """
+    allocation = {demand.entry_id: 0 for demand in demands}
+    caps = {demand.entry_id: _demand_cap(demand) for demand in demands}
+    eligible = sorted(
+        (
+            demand
+            for demand in demands
+            if caps[demand.entry_id] >= MIN_CHARGING_CURRENT
+        ),
+        key=lambda demand: (-demand.priority, demand.entry_id),
+    )
+    while eligible and len(eligible) * MIN_CHARGING_CURRENT > budget:
+        eligible.pop()
+
+    shares = {demand.entry_id: float(MIN_CHARGING_CURRENT) for demand in eligible}
+    remaining = budget - len(eligible) * MIN_CHARGING_CURRENT
+    open_demands = list(eligible)
+    while open_demands and remaining > 0:
+        weight = sum(demand.priority for demand in open_demands)
+        capped = [
+            demand
+            for demand in open_demands
+            if caps[demand.entry_id] - shares[demand.entry_id]
+            <= remaining * demand.priority / weight
+        ]
+        if not capped:
+            for demand in open_demands:
+                shares[demand.entry_id] += remaining * demand.priority / weight
+            break
+        for demand in capped:
+            remaining -= caps[demand.entry_id] - shares[demand.entry_id]
+            shares[demand.entry_id] = caps[demand.entry_id]
+            open_demands.remove(demand)
+
+    for entry_id, share in shares.items():
+        allocation[entry_id] = math.floor(share)
+    return allocation
+
+
+@dataclass
+class _Member:
+    coordinator: AbbTerraAcDataUpdateCoordinator
+    budget: float
+    priority: int
+
+
+@dataclass
+class AllocatorStats:
+    """Counters for diagnostics."""
+
+    passes: int = 0
+    writes: int = 0
+    failed_writes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "passes": self.passes,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+        }
+
+
+class FleetCurrentAllocator:
+    """Keep the sum of the chargers' current limits within a shared budget.
+
+    Every coordinator update of a member triggers one allocation pass over
+    the whole fleet; updates arriving during a pass are folded into the next
+    one. A pass writes only the limits that changed, reductions first and
+    then increases, each batch concurrently, so the feeder is never
+    over-committed between two writes. When members configure different
+    budgets, the smallest one applies.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an allocator without chargers."""
+        self._hass = hass
+        self._members: dict[str, _Member] = {}
+        self.targets: dict[str, int] = {}
+        self._pending = False
+        self._task: asyncio.Task[None] | None = None
+        self.stats = AllocatorStats()
+
+    @property
+    def budget(self) -> float:
+        """Budget (A) shared by the members."""
+        return min((member.budget for member in self._members.values()), default=0)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @callback
+    def async_add_charger(
+        self,
+        coordinator: AbbTerraAcDataUpdateCoordinator,
+        budget: float,
+        priority: int,
+    ) -> CALLBACK_TYPE:
+        """Share the budget with ``coordinator``; return a callback that leaves."""
+        entry_id = coordinator.entry_id
+        self._members[entry_id] = _Member(coordinator, budget, priority)
+        unsubscribe = coordinator.async_add_listener(self._async_request_pass)
+        self._async_request_pass()
+
+        @callback
+        def _async_remove_charger() -> None:
+            unsubscribe()
+            self._members.pop(entry_id, None)
+            self.targets.pop(entry_id, None)
+            # The share of the charger that left goes to the others.
+            if self._members:
+                self._async_request_pass()
+
+        return _async_remove_charger
+
+    @callback
+    def _async_request_pass(self) -> None:
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} current allocation"
+            )
+
+    async def _async_run(self) -> None:
+        """Allocate until no update arrived during the last pass."""
+        while self._pending:
+            self._pending = False
+            await self._async_allocate()
+
+    async def _async_allocate(self) -> None:
+        members = {
+            entry_id: member
+            for entry_id, member in self._members.items()
+            if member.coordinator.data
+        }
+        if not members:
+            return
+        self.stats.passes += 1
+        allocation = allocate_current(
+            self.budget,
+            [
+                ChargerDemand(
+                    entry_id=entry_id,
+                    state=(
+                        member.coordinator.session_state
+                        if member.coordinator.last_update_success
+                        else SessionState.UNKNOWN
+                    ),
+                    maximum=float(
+                        member.coordinator.data["user_settable_max_current"]
+                    ),
+                    priority=member.priority,
+                    vehicle_connected=vehicle_connected_from_socket_lock(
+                        member.coordinator.data["socket_lock_state"]
+                    ),
+                )
+                for entry_id, member in members.items()
+            ],
+        )
+        changes: dict[str, int] = {}
+        for entry_id, current in allocation.items():
+            target = self.targets.get(entry_id)
+            if target is None:
+                target = int(
+                    members[entry_id].coordinator.data["charging_current_limit_modbus"]
+                )
+                self.targets[entry_id] = target
+            if current != target:
+                changes[entry_id] = current
+
+        decreases = {k: v for k, v in changes.items() if v < self.targets[k]}
+        increases = {k: v for k, v in changes.items() if v > self.targets[k]}
+        for batch in (decreases, increases):
+            if not batch:
+                continue
+            results = await asyncio.gather(
+                *(
+                    async_write_current_limit(members[entry_id].coordinator, current)
+                    for entry_id, current in batch.items()
+                ),
+                return_exceptions=True,
+            )
+            for (entry_id, current), result in zip(
+                batch.items(), results, strict=True
+            ):
+                if isinstance(result, HomeAssistantError):
+                    self.stats.failed_writes += 1
+                    _LOGGER.warning(
+                        "Could not set the current limit of %s to %sA: %s",
+                        members[entry_id].coordinator.name,
+                        current,
+                        result,
+                    )
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self.stats.writes += 1
+                    self.targets[entry_id] = current
+
+    def as_dict(self) -> dict[str, Any]:
+        """Budget, set-points and counters for diagnostics."""
+        return {
+            "budget": self.budget,
+            "chargers": len(self._members),
+            "allocated": sum(self.targets.values()),
+            **self.stats.as_dict(),
+        }
+
+
+_DATA_CURRENT_ALLOCATOR = f"{DOMAIN}_current_allocator"
+
+
+@callback
+def async_join_current_budget(
+    hass: HomeAssistant,
+    coordinator: AbbTerraAcDataUpdateCoordinator,
+    budget: float,
+    priority: int,
+) -> CALLBACK_TYPE:
+    """Add ``coordinator`` to the domain's allocator; return the leave callback."""
+    allocator: FleetCurrentAllocator | None = hass.data.get(_DATA_CURRENT_ALLOCATOR)
+    if allocator is None:
+        allocator = hass.data[_DATA_CURRENT_ALLOCATOR] = FleetCurrentAllocator(hass)
+    coordinator.current_allocator = allocator
+    remove = allocator.async_add_charger(coordinator, budget, priority)
+
+    @callback
+    def _async_leave() -> None:
+        remove()
+        coordinator.current_allocator = None
+        if not allocator and hass.data.get(_DATA_CURRENT_ALLOCATOR) is allocator:
+            hass.data.pop(_DATA_CURRENT_ALLOCATOR)
+
+    return _async_leave
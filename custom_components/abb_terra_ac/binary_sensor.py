@@ -34,6 +34,8 @@ async def async_setup_entry(
 class AbbTerraAcIsChargingBinarySensor(AbbTerraAcEntity, BinarySensorEntity):
     """True when raw charging state is C2 (actively charging)."""
 
+    _coordinator_keys = frozenset({"charging_state"})
+
     _attr_has_entity_name = True
     _attr_translation_key = "is_charging"
 
@@ -10,7 +10,8 @@ from pymodbus.client import AsyncModbusTcpClient
 
 from . import AbbTerraAcDataUpdateCoordinator, AbbTerraAcRuntimeData
 from .entity import AbbTerraAcEntity
-from .modbus_write import async_write_register
+from .modbus_write import async_write_and_read_back
+from .registers import field_span
 from .session_state import LastCommand
 
 PARALLEL_UPDATES = 0
@@ -18,6 +19,7 @@ PARALLEL_UPDATES = 0
 REG_START_STOP_SESSION = 16645
 VAL_START_SESSION = 0
 VAL_STOP_SESSION = 1
+_READBACK_CHARGING_STATE = field_span("charging_state")
 
 
 async def async_setup_entry(
@@ -42,6 +44,9 @@ async def async_setup_entry(
 class AbbTerraAcBaseButton(AbbTerraAcEntity, ButtonEntity):
     """Base class for charger buttons."""
 
+    # Buttons render no coordinator data; only availability changes matter.
+    _coordinator_keys: frozenset[str] = frozenset()
+
     def __init__(
         self,
         coordinator: AbbTerraAcDataUpdateCoordinator,
@@ -51,6 +56,20 @@ class AbbTerraAcBaseButton(AbbTerraAcEntity, ButtonEntity):
         AbbTerraAcEntity.__init__(self, coordinator, entry.entry_id)
         self.client = client
 
+    async def _async_write_session(self, value: int) -> None:
+        """Write the start/stop register and publish the read-back state."""
+        registers = await async_write_and_read_back(
+            self.client,
+            REG_START_STOP_SESSION,
+            [value],
+            _READBACK_CHARGING_STATE,
+            lock=self.coordinator.modbus_lock,
+            unit_id=self.coordinator.unit_id,
+        )
+        await self.coordinator.async_apply_readback(
+            _READBACK_CHARGING_STATE[0], registers
+        )
+
 
 class AbbTerraAcStartChargingButton(AbbTerraAcBaseButton):
     """Start a charging session (register 4105h, value 0)."""
@@ -66,16 +85,10 @@ class AbbTerraAcStartChargingButton(AbbTerraAcBaseButton):
         self._attr_unique_id = f"{self._config_entry_id}_start_charging"
 
     async def async_press(self) -> None:
-        """Start charging; retry once with a full refresh between attempts."""
+        """Start charging; retry once if the charging state did not move."""
         self.coordinator.last_command = LastCommand.START
         for _ in range(2):
-            await async_write_register(
-                self.client,
-                REG_START_STOP_SESSION,
-                VAL_START_SESSION,
-                lock=self.coordinator.modbus_lock,
-            )
-            await self.coordinator.async_request_refresh()
+            await self._async_write_session(VAL_START_SESSION)
             data = self.coordinator.data
             if not data or data["charging_state"] not in (0, 1):
                 break
@@ -97,10 +110,4 @@ class AbbTerraAcStopChargingButton(AbbTerraAcBaseButton):
     async def async_press(self) -> None:
         """Stop charging session."""
         self.coordinator.last_command = LastCommand.STOP
-        await async_write_register(
-            self.client,
-            REG_START_STOP_SESSION,
-            VAL_STOP_SESSION,
-            lock=self.coordinator.modbus_lock,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_write_session(VAL_STOP_SESSION)
@@ -15,8 +15,10 @@ from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 from .const import (
     CONF_SCAN_INTERVAL,
+    CONF_UNIT_ID,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_UNIT_ID,
     DOMAIN,
     MODBUS_READ_TIMEOUT,
 )
@@ -26,6 +28,23 @@ from .options_flow import AbbTerraAcOptionsFlow
 _LOGGER = logging.getLogger(__name__)
 
 
+def _unique_id(user_input: dict[str, str | int]) -> str:
+    """Unique id ``host:port``, suffixed with the unit id behind a gateway."""
+    unique_id = f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
+    unit_id = int(user_input.get(CONF_UNIT_ID, DEFAULT_UNIT_ID))
+    if unit_id != DEFAULT_UNIT_ID:
+        unique_id = f"{unique_id}:{unit_id}"
+    return unique_id
+
+
+def _title(user_input: dict[str, str | int]) -> str:
+    """Entry title; names the unit id when it is not the default."""
+    unit_id = int(user_input.get(CONF_UNIT_ID, DEFAULT_UNIT_ID))
+    if unit_id != DEFAULT_UNIT_ID:
+        return f"ABB Terra AC ({user_input[CONF_HOST]}, unit {unit_id})"
+    return f"ABB Terra AC ({user_input[CONF_HOST]})"
+
+
 class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ABB Terra AC."""
 
@@ -45,6 +64,9 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return vol.Schema({
             vol.Required(CONF_HOST): str,
             vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+            vol.Optional(CONF_UNIT_ID, default=DEFAULT_UNIT_ID): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=247)
+            ),
         })
 
     def _show_form(
@@ -61,6 +83,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             suggested_values = {
                 CONF_HOST: entry.data[CONF_HOST],
                 CONF_PORT: entry.data[CONF_PORT],
+                CONF_UNIT_ID: entry.data.get(CONF_UNIT_ID, DEFAULT_UNIT_ID),
             }
 
         return self.async_show_form(
@@ -89,6 +112,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 retry=False,
                 address=16384,
                 count=1,
+                device_id=int(user_input.get(CONF_UNIT_ID, DEFAULT_UNIT_ID)),
             )
             if result.isError():
                 msg = "invalid_response"
@@ -110,9 +134,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self._show_form(step_id="reconfigure")
 
         errors = {}
-        host = user_input[CONF_HOST]
-        port = user_input[CONF_PORT]
-        new_unique_id = f"{host}:{port}"
+        new_unique_id = _unique_id(user_input)
 
         try:
             await self._async_validate_input(user_input)
@@ -128,7 +150,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_update_reload_and_abort(
                 entry,
                 unique_id=new_unique_id,
-                title=f"ABB Terra AC ({host})",
+                title=_title(user_input),
                 data_updates=user_input,
             )
         except ValueError as err:
@@ -151,9 +173,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self._show_form(step_id="user")
 
         errors = {}
-        host = user_input[CONF_HOST]
-        port = user_input[CONF_PORT]
-        new_unique_id = f"{host}:{port}"
+        new_unique_id = _unique_id(user_input)
 
         try:
             await self._async_validate_input(user_input)
@@ -162,7 +182,7 @@ class AbbTerraAcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             return self.async_create_entry(
-                title=f"ABB Terra AC ({host})",
+                title=_title(user_input),
                 data=user_input,
                 options={CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL},
             )
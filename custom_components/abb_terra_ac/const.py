@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Final, TypedDict
 
 from homeassistant.const import Platform
@@ -14,10 +15,60 @@ SESSION_STATE_OPTIONS: Final[list[str]] = [s.value for s in SessionState]
 DOMAIN: Final = "abb_terra_ac"
 DEFAULT_PORT: Final = 502
 DEFAULT_SCAN_INTERVAL: Final = 15
+DEFAULT_IDLE_SCAN_INTERVAL: Final = 60
 MIN_SCAN_INTERVAL: Final = 5
 MAX_SCAN_INTERVAL: Final = 300
+# Sub-second polling right after a start/stop press or a limit write so the UI
+# follows the charger's reaction instead of waiting for the next regular poll.
+BURST_SCAN_INTERVAL: Final = timedelta(milliseconds=500)
+BURST_SCAN_DURATION: Final = 5.0
+# Limit writes within this window (milliseconds) are merged into one write.
+DEFAULT_WRITE_COALESCE_WINDOW: Final = 250
+MAX_WRITE_COALESCE_WINDOW: Final = 2000
+# Write-behind delay (seconds) for the warm-start snapshot on disk.
+SNAPSHOT_SAVE_DELAY: Final = 300
+# Write-behind delay (seconds) for the last valid limits used by the auto-fix.
+LIMITS_SAVE_DELAY: Final = 10
+# Windows (minutes) offered for the per-phase min/max/mean/stddev sensors.
+AGGREGATION_WINDOW_CHOICES: Final = (1, 5, 15, 60)
+DEFAULT_AGGREGATION_WINDOWS: Final = (1, 15)
+# Ring buffer bound: one hour of samples at the burst polling rate.
+MAX_AGGREGATION_SAMPLES: Final = 7200
+# Load balancing: amps kept free below the main fuse, smallest increase
+# worth a write, and how long (seconds) headroom must last before raising.
+LOAD_BALANCING_MARGIN: Final = 1.0
+LOAD_BALANCING_MIN_CHANGE: Final = 1
+LOAD_BALANCING_INCREASE_DELAY: Final = 10.0
+# Solar surplus mode: time constant (seconds) of the low-pass filter on the
+# export reading, shortest interval between two limit writes, and how long
+# surplus must stay above/below 6 A before charging resumes/pauses.
+PV_SURPLUS_FILTER_TIME: Final = 20.0
+PV_SURPLUS_MIN_WRITE_INTERVAL: Final = 10.0
+PV_SURPLUS_START_DELAY: Final = 60.0
+PV_SURPLUS_STOP_DELAY: Final = 300.0
+# Used when the charger does not report a phase voltage.
+NOMINAL_VOLTAGE: Final = 230.0
+# Ceilings (seconds) of the adaptive connect and request timeouts, also used
+# until a client has measured round trips.
 MODBUS_CONNECT_TIMEOUT: Final = 5.0
 MODBUS_READ_TIMEOUT: Final = 3.0
+# Floors (seconds) of the adaptive timeouts, however fast the charger answers.
+MODBUS_MIN_CONNECT_TIMEOUT: Final = 1.0
+MODBUS_MIN_READ_TIMEOUT: Final = 0.5
+# Circuit breaker: consecutive failed connects before it opens, and the
+# first and longest wait (seconds) before a probe connect; jitter spreads
+# the probes of several offline chargers.
+CIRCUIT_BREAKER_THRESHOLD: Final = 2
+CIRCUIT_BREAKER_BASE_DELAY: Final = 10.0
+CIRCUIT_BREAKER_MAX_DELAY: Final = 300.0
+# OS-level TCP keepalive on every Modbus socket: first probe after this many
+# idle seconds, then one per interval; the socket is closed after the last
+# unanswered probe, so the next poll reconnects instead of timing out.
+TCP_KEEPALIVE_IDLE: Final = 30
+TCP_KEEPALIVE_INTERVAL: Final = 10
+TCP_KEEPALIVE_COUNT: Final = 3
+# Upper bound on poll transactions in flight across all configured chargers.
+MAX_CONCURRENT_POLLS: Final = 4
 
 PLATFORMS: Final[list[Platform]] = [
     Platform.SENSOR,
@@ -30,6 +81,42 @@ PLATFORMS: Final[list[Platform]] = [
 CONF_HOST: Final = "host"
 CONF_PORT: Final = "port"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_IDLE_SCAN_INTERVAL: Final = "idle_scan_interval"
+CONF_UNIT_ID: Final = "unit_id"
+CONF_WRITE_COALESCE_WINDOW: Final = "write_coalesce_window"
+CONF_AGGREGATION_WINDOWS: Final = "aggregation_windows"
+CONF_GRID_POWER_ENTITY: Final = "grid_power_entity"
+CONF_MAIN_FUSE_LIMIT: Final = "main_fuse_limit"
+CONF_GRID_PHASES: Final = "grid_phases"
+CONF_GRID_EXPORT_ENTITY: Final = "grid_export_entity"
+CONF_FLEET_CURRENT_BUDGET: Final = "fleet_current_budget"
+CONF_CHARGING_PRIORITY: Final = "charging_priority"
+CONF_PIPELINE_DEPTH: Final = "pipeline_depth"
+CONF_CONNECTION_IDLE_TIMEOUT: Final = "connection_idle_timeout"
+
+# Modbus unit (slave) id; only differs when several chargers share a gateway.
+DEFAULT_UNIT_ID: Final = 1
+# Load balancing is off until a meter entity and a main fuse limit are set.
+DEFAULT_GRID_PHASES: Final = 3
+MAX_MAIN_FUSE_LIMIT: Final = 200
+# Fleet current budget: off (0) until set; priorities weigh the shares.
+MAX_FLEET_CURRENT_BUDGET: Final = 1000
+DEFAULT_CHARGING_PRIORITY: Final = 1
+MAX_CHARGING_PRIORITY: Final = 10
+# Modbus requests in flight per gateway, each on its own TCP session
+# (1: one session, requests one at a time).
+DEFAULT_PIPELINE_DEPTH: Final = 1
+MAX_PIPELINE_DEPTH: Final = 4
+# Consecutive requests an extra session failed while the primary one
+# answered, after which the gateway is used with one session only.
+PIPELINE_FALLBACK_FAILURES: Final = 3
+# Seconds after which the gateway drops an idle connection (0: never).
+DEFAULT_CONNECTION_IDLE_TIMEOUT: Final = 0
+MAX_CONNECTION_IDLE_TIMEOUT: Final = 3600
+
+
+# Pseudo data key published in ``changed_keys`` when last_command changes.
+KEY_LAST_COMMAND: Final = "last_command"
 
 
 class AbbTerraAcData(TypedDict):
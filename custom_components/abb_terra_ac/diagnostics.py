@@ -10,11 +10,14 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 
 from . import AbbTerraAcRuntimeData
-from .const import AbbTerraAcData, CONF_SCAN_INTERVAL
+from .const import AbbTerraAcData, CONF_IDLE_SCAN_INTERVAL, CONF_SCAN_INTERVAL
+from .modbus import modbus_client_stats
 
 # Config entry data and client host are PII (network identity; treat as sensitive).
 _REDACT_CONFIG = {CONF_HOST}
 _REDACT_RUNTIME = {"serial_number"}
+# Finished charging sessions included in diagnostics.
+_RECENT_SESSIONS = 5
 
 
 async def async_get_config_entry_diagnostics(
@@ -39,15 +42,26 @@ async def async_get_config_entry_diagnostics(
             "data": entry_data,
             "options": {
                 CONF_SCAN_INTERVAL: entry.options.get(CONF_SCAN_INTERVAL),
+                CONF_IDLE_SCAN_INTERVAL: entry.options.get(CONF_IDLE_SCAN_INTERVAL),
             },
         },
         "client": {
             "connected": client.connected,
             "host": "**REDACTED**",
             "port": entry.data[CONF_PORT],
+            "unit_id": coordinator.unit_id,
+            "shared_by_entries": len(coordinator.connection.entry_ids),
+            "request_queue": coordinator.connection.queue.as_dict(),
+            "keepalive": (
+                keepalive.as_dict()
+                if (keepalive := coordinator.connection.keepalive) is not None
+                else None
+            ),
+            "transactions": modbus_client_stats(client).as_dict(),
         },
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.poll_interval.total_seconds(),
             "is_available": coordinator._is_available,
             "serial_number_cached": coordinator.serial_number is not None,
             "last_command": coordinator.last_command,
@@ -56,6 +70,40 @@ async def async_get_config_entry_diagnostics(
             "fallback_fix_attempted": coordinator._fallback_fix_attempted,
             "last_valid_current_limit": coordinator._last_valid_current_limit,
             "current_limit_fix_attempted": coordinator._current_limit_fix_attempted,
+            "limit_writes": coordinator.limit_writer.as_dict(),
+            "polls": coordinator.poll_stats.as_dict(),
+            "warm_started": coordinator.warm_started,
+            "load_balancing": (
+                coordinator.load_balancer.as_dict()
+                if coordinator.load_balancer is not None
+                else None
+            ),
+            "pv_surplus": (
+                coordinator.pv_surplus.as_dict()
+                if coordinator.pv_surplus is not None
+                else None
+            ),
             "data": async_redact_data(dict(coordinator_data), _REDACT_RUNTIME),
         },
+        "sessions": {
+            "current": (
+                current.as_dict()
+                if (current := coordinator.session_recorder.current) is not None
+                else None
+            ),
+            "recent": await coordinator.async_get_sessions(_RECENT_SESSIONS),
+        },
+        "fleet": (
+            {
+                **coordinator.scheduler.as_dict(),
+                "phase": round(coordinator.scheduler.phase(entry.entry_id), 3),
+                "current_budget": (
+                    coordinator.current_allocator.as_dict()
+                    if coordinator.current_allocator is not None
+                    else None
+                ),
+            }
+            if coordinator.scheduler is not None
+            else None
+        ),
     }
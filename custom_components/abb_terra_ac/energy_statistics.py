@@ -0,0 +1,169 @@
+"""Hourly energy and power aggregates imported as external statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfPower
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, AbbTerraAcData
+from .session_state import vehicle_connected_from_socket_lock
+from .sessions import LifetimeEnergy
+
+_LOGGER = logging.getLogger(__name__)
+
+# Closed hours kept while the recorder is unavailable (two days).
+_MAX_PENDING_HOURS = 48
+
+
+@dataclass
+class HourlyBucket:
+    """Energy and power seen during one clock hour."""
+
+    start: datetime
+    energy_wh: float = 0.0
+    power_min: float | None = None
+    power_max: float | None = None
+    power_total: float = 0.0
+    samples: int = 0
+
+    def add(self, energy_wh: float, power: float) -> None:
+        """Fold one poll into the hour."""
+        self.energy_wh += energy_wh
+        if self.power_min is None or power < self.power_min:
+            self.power_min = power
+        if self.power_max is None or power > self.power_max:
+            self.power_max = power
+        self.power_total += power
+        self.samples += 1
+
+
+class HourlyEnergyStatistics:
+    """Aggregate polls per hour and import closed hours into the recorder.
+
+    Two external series are kept per charger: ``<domain>:<entry>_energy``
+    (hourly energy as a running sum) and ``<domain>:<entry>_power`` (mean,
+    min and max power). Hours are imported in one batch when they close, so
+    billing-grade history does not depend on the state rows of the sensors.
+    The hour in progress at shutdown is not imported.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, name: str) -> None:
+        """Initialize the series of one charger."""
+        self._hass = hass
+        object_id = entry_id.lower()
+        self.energy_metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{name} energy",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{object_id}_energy",
+            unit_class="energy",
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        self.power_metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=f"{name} power",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{object_id}_power",
+            unit_class="power",
+            unit_of_measurement=UnitOfPower.WATT,
+        )
+        self._lifetime = LifetimeEnergy()
+        self._bucket: HourlyBucket | None = None
+        self.pending: list[HourlyBucket] = []
+        # Running energy sum and last imported hour, read from the recorder
+        # before the first import.
+        self._energy_sum: float | None = None
+        self._last_start: datetime | None = None
+
+    @callback
+    def async_add(self, now: datetime, data: AbbTerraAcData) -> bool:
+        """Fold one poll; return True when an hour closed and can be imported."""
+        before = self._lifetime.total_wh
+        self._lifetime.update(
+            float(data["energy_delivered"]),
+            vehicle_connected_from_socket_lock(data["socket_lock_state"]),
+        )
+        hour = dt_util.as_utc(now).replace(minute=0, second=0, microsecond=0)
+        closed = False
+        if self._bucket is not None and self._bucket.start != hour:
+            self.pending.append(self._bucket)
+            del self.pending[:-_MAX_PENDING_HOURS]
+            self._bucket = None
+            closed = True
+        if self._bucket is None:
+            self._bucket = HourlyBucket(start=hour)
+        self._bucket.add(
+            self._lifetime.total_wh - before, float(data["active_power"])
+        )
+        return closed
+
+    async def async_flush(self) -> None:
+        """Import every closed hour in one batch per series."""
+        if not self.pending or "recorder" not in self._hass.config.components:
+            return
+        if self._energy_sum is None:
+            await self._async_load_last_sum()
+        pending, self.pending = self.pending, []
+        if self._last_start is not None:
+            pending = [b for b in pending if b.start > self._last_start]
+        if not pending:
+            return
+
+        energy_sum = self._energy_sum or 0.0
+        energy: list[StatisticData] = []
+        power: list[StatisticData] = []
+        for bucket in pending:
+            energy_sum += bucket.energy_wh / 1000
+            energy.append(
+                StatisticData(
+                    start=bucket.start,
+                    state=round(bucket.energy_wh / 1000, 3),
+                    sum=round(energy_sum, 3),
+                )
+            )
+            if bucket.samples:
+                power.append(
+                    StatisticData(
+                        start=bucket.start,
+                        mean=bucket.power_total / bucket.samples,
+                        min=bucket.power_min or 0.0,
+                        max=bucket.power_max or 0.0,
+                    )
+                )
+        self._energy_sum = energy_sum
+        self._last_start = pending[-1].start
+        async_add_external_statistics(self._hass, self.energy_metadata, energy)
+        if power:
+            async_add_external_statistics(self._hass, self.power_metadata, power)
+
+    async def _async_load_last_sum(self) -> None:
+        """Continue the energy sum from the last imported hour."""
+        statistic_id = self.energy_metadata["statistic_id"]
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, statistic_id, False, {"sum"}
+        )
+        if rows := last.get(statistic_id):
+            self._energy_sum = rows[0].get("sum") or 0.0
+            self._last_start = dt_util.utc_from_timestamp(rows[0]["start"])
+        else:
+            self._energy_sum = 0.0
+        _LOGGER.debug(
+            "Energy statistics for %s resume at %s kWh", statistic_id, self._energy_sum
+        )
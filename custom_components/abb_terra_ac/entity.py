@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
@@ -23,6 +24,9 @@ class AbbTerraAcEntity(CoordinatorEntity):
     """Coordinator entity with device_info updated when firmware or identity changes."""
 
     _attr_has_entity_name = True
+    # Coordinator data keys the entity state is rendered from; the state is
+    # only written when one of them changed (None: write on every update).
+    _coordinator_keys: frozenset[str] | None = None
 
     def __init__(
         self,
@@ -41,3 +45,12 @@ class AbbTerraAcEntity(CoordinatorEntity):
             info["sw_version"] = data.get("firmware_version")
             info["serial_number"] = data.get("serial_number")
         return info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a coordinator key this entity reads changed."""
+        keys = self._coordinator_keys
+        changed = self.coordinator.changed_keys
+        if keys is not None and changed is not None and keys.isdisjoint(changed):
+            return
+        super()._handle_coordinator_update()
@@ -0,0 +1,225 @@
+"""Closed-loop load balancing against the household main fuse."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, UnitOfPower
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    LOAD_BALANCING_INCREASE_DELAY,
+    LOAD_BALANCING_MARGIN,
+    LOAD_BALANCING_MIN_CHANGE,
+    NOMINAL_VOLTAGE,
+)
+from .modbus import RequestPriority
+from .modbus_write import async_write_registers
+from .registers import REGISTER_GROUP_CONFIG
+
+if TYPE_CHECKING:
+    from . import AbbTerraAcDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# IEC 61851-1 minimum charging current; below it the charger is paused (0 A).
+MIN_CHARGING_CURRENT = 6
+
+
+def allowed_charging_current(
+    *,
+    import_power: float,
+    charger_power: float,
+    voltage: float,
+    phases: int,
+    fuse_limit: float,
+    ceiling: float,
+) -> int:
+    """Charging current (A) that keeps every phase below the main fuse.
+
+    ``import_power`` is the site's grid import (W) including the charger's
+    ``charger_power``. The rest of the household is assumed balanced over
+    ``phases``; the charger may draw on any of them, so each phase it uses
+    gets what the fuse leaves above the household's share. Subtracting the
+    charger's power rather than its current keeps this right for a
+    single-phase vehicle on a three-phase supply.
+    """
+    household = max(import_power - charger_power, 0.0) / (
+        phases * (voltage or NOMINAL_VOLTAGE)
+    )
+    allowed = math.floor(fuse_limit - LOAD_BALANCING_MARGIN - household)
+    allowed = min(allowed, math.floor(ceiling))
+    return allowed if allowed >= MIN_CHARGING_CURRENT else 0
+
+
+def power_from_state(state: State | None) -> float | None:
+    """Reading of a power sensor in W, or None when it has no usable value."""
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        power = float(state.state)
+    except ValueError:
+        return None
+    if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+        power *= 1000
+    return power
+
+
+async def async_write_current_limit(
+    coordinator: AbbTerraAcDataUpdateCoordinator, current: int
+) -> None:
+    """Write the current limit (4100h/4101h) without read-back or burst refresh.
+
+    Used by the controllers, which evaluate every meter sample and would
+    otherwise flood the charger with confirmation reads. The next regular
+    poll re-reads the config group, so the reported limit catches up then.
+    """
+    value = current * 1000
+    await async_write_registers(
+        coordinator.client,
+        16640,
+        [value >> 16, value & 0xFFFF],
+        lock=coordinator.modbus_lock,
+        unit_id=coordinator.unit_id,
+        priority=RequestPriority.USER_WRITE,
+    )
+    coordinator.invalidate_register_groups(REGISTER_GROUP_CONFIG)
+
+
+@dataclass
+class LoadBalancerStats:
+    """Counters for diagnostics."""
+
+    samples: int = 0
+    writes: int = 0
+    failed_writes: int = 0
+    last_allowed: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+            "last_allowed": self.last_allowed,
+        }
+
+
+class AbbTerraAcLoadBalancer:
+    """Drive the current limit (4100h/4101h) from a grid power meter.
+
+    Every meter sample is evaluated at once. Reductions are written
+    immediately; increases need at least ``LOAD_BALANCING_MIN_CHANGE`` of
+    headroom held for ``LOAD_BALANCING_INCREASE_DELAY`` seconds, so a noisy
+    meter cannot make the limit oscillate. Writes skip the read-back and
+    burst refresh used for changes made from the UI.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: AbbTerraAcDataUpdateCoordinator,
+        power_entity_id: str,
+        fuse_limit: float,
+        phases: int,
+    ) -> None:
+        """Initialize the controller; ``async_start`` subscribes to the meter."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.power_entity_id = power_entity_id
+        self.fuse_limit = fuse_limit
+        self.phases = phases
+        self.target: int | None = None
+        self._headroom_since: float | None = None
+        self._pending: float | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.stats = LoadBalancerStats()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the meter; return the callback that stops the controller."""
+        return async_track_state_change_event(
+            self._hass, [self.power_entity_id], self._async_meter_changed
+        )
+
+    @callback
+    def _async_meter_changed(self, event: Event[EventStateChangedData]) -> None:
+        if (power := power_from_state(event.data["new_state"])) is None:
+            return
+        self._pending = power
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(),
+                f"{DOMAIN} load balancing {self._coordinator.entry_id}",
+            )
+
+    async def _async_run(self) -> None:
+        """Evaluate samples until none arrived during the last write."""
+        while (power := self._pending) is not None:
+            self._pending = None
+            await self._async_evaluate(power)
+
+    async def _async_evaluate(self, import_power: float) -> None:
+        data = self._coordinator.data
+        self.stats.samples += 1
+        allowed = allowed_charging_current(
+            import_power=import_power,
+            charger_power=float(data["active_power"]),
+            voltage=float(data["voltage_l1"]),
+            phases=self.phases,
+            fuse_limit=self.fuse_limit,
+            ceiling=float(data["user_settable_max_current"]),
+        )
+        self.stats.last_allowed = allowed
+        target = self.target
+        if target is None:
+            target = self.target = int(data["charging_current_limit_modbus"])
+
+        if allowed < target:
+            self._headroom_since = None
+            await self._async_write(allowed)
+            return
+        if allowed - target < LOAD_BALANCING_MIN_CHANGE:
+            self._headroom_since = None
+            return
+        now = monotonic()
+        if self._headroom_since is None:
+            self._headroom_since = now
+        if now - self._headroom_since >= LOAD_BALANCING_INCREASE_DELAY:
+            self._headroom_since = None
+            await self._async_write(allowed)
+
+    async def _async_write(self, current: int) -> None:
+        try:
+            await async_write_current_limit(self._coordinator, current)
+        except HomeAssistantError as err:
+            self.stats.failed_writes += 1
+            # The next meter sample tries again.
+            _LOGGER.warning("Load balancing could not set %sA: %s", current, err)
+            return
+        self.stats.writes += 1
+        self.target = current
+        _LOGGER.debug("Load balancing set the current limit to %sA", current)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Configuration and counters for diagnostics."""
+        return {
+            "fuse_limit": self.fuse_limit,
+            "phases": self.phases,
+            "target": self.target,
+            **self.stats.as_dict(),
+        }
@@ -2,15 +2,44 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import IntEnum, StrEnum
+from functools import partial
+import heapq
 import inspect
+import itertools
 import logging
+import random
+import socket
+from time import monotonic
 from typing import Any
+from weakref import WeakKeyDictionary
 
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusIOException
 
-from .const import MODBUS_CONNECT_TIMEOUT
+from .const import (
+    CIRCUIT_BREAKER_BASE_DELAY,
+    CIRCUIT_BREAKER_MAX_DELAY,
+    CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_UNIT_ID,
+    DOMAIN,
+    MODBUS_CONNECT_TIMEOUT,
+    MODBUS_MIN_CONNECT_TIMEOUT,
+    MODBUS_MIN_READ_TIMEOUT,
+    MODBUS_READ_TIMEOUT,
+    PIPELINE_FALLBACK_FAILURES,
+    TCP_KEEPALIVE_COUNT,
+    TCP_KEEPALIVE_IDLE,
+    TCP_KEEPALIVE_INTERVAL,
+)
+from .registers import REGISTER_BLOCK_ADDRESS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,18 +64,638 @@ async def _async_null_lock():
     yield
 
 
-async def async_ensure_client_connected(client: AsyncModbusTcpClient) -> None:
-    """Open the TCP connection if needed."""
+class RequestPriority(IntEnum):
+    """Order in which queued Modbus requests get the connection (lowest first)."""
+
+    USER_WRITE = 0
+    FIRMWARE_FIX = 1
+    FAST_POLL = 2
+    SLOW_POLL = 3
+
+
+class ModbusRequestDropped(Exception):
+    """A queued request waited longer than its ``max_wait`` and was dropped."""
+
+
+@dataclass
+class RequestWaitStats:
+    """Queue wait counters for one request priority."""
+
+    requests: int = 0
+    dropped: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    total_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        """Record the queue wait of one request that got the connection."""
+        self.requests += 1
+        self.last_wait = wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_wait += wait
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics (seconds rounded to ms)."""
+        return {
+            "requests": self.requests,
+            "dropped": self.dropped,
+            "last_wait": round(self.last_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "mean_wait": (
+                round(self.total_wait / self.requests, 3) if self.requests else None
+            ),
+        }
+
+
+class ModbusRequestQueue:
+    """Serialize requests on one connection, granting it by priority.
+
+    Works like an ``asyncio.Lock`` except that a released connection goes to
+    the waiting request with the best :class:`RequestPriority` (FIFO within a
+    priority), so a user write never waits behind queued polls.
+
+    With a ``capacity`` above one the queue grants that many requests at
+    once, each on its own lane: lane 0 is the connection's own client, the
+    other lanes are extra TCP sessions to the same gateway opened on first
+    use by ``lane_factory``. pymodbus keeps one transaction in flight per
+    session, so lanes are how requests overlap on a high-latency link. Only
+    reads use extra lanes; writes wait for lane 0 in priority order.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1,
+        lane_factory: Callable[[], AsyncModbusTcpClient] | None = None,
+    ) -> None:
+        """Initialize an idle queue."""
+        self._capacity = capacity
+        self._lane_factory = lane_factory
+        self._lane_clients: dict[int, AsyncModbusTcpClient] = {}
+        self._lanes_in_use: set[int] = set()
+        self._waiters: list[tuple[int, int, asyncio.Future[int], bool]] = []
+        self._sequence = itertools.count()
+        self.peak_depth = 0
+        self.peak_in_flight = 0
+        self.serial_fallback = False
+        self.lane_failures = 0
+        self.stats = {priority: RequestWaitStats() for priority in RequestPriority}
+
+    @property
+    def capacity(self) -> int:
+        """Requests granted at the same time (1: serial)."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        self._capacity = 1 if self.serial_fallback else max(capacity, 1)
+        self._grant()
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting for the connection."""
+        return sum(not future.done() for _, _, future, _ in self._waiters)
+
+    def locked(self) -> bool:
+        """True while no further request can be granted."""
+        return self._free_lane() is None
+
+    def lane_client(
+        self, lane: int, default: AsyncModbusTcpClient
+    ) -> AsyncModbusTcpClient:
+        """Client of ``lane``; lane 0 (and any lane without a factory) uses ``default``."""
+        if lane == 0 or self._lane_factory is None:
+            return default
+        if (client := self._lane_clients.get(lane)) is None:
+            client = self._lane_clients[lane] = self._lane_factory()
+        return client
+
+    def record_lane_success(self) -> None:
+        """Reset the failure count after an extra lane answered."""
+        self.lane_failures = 0
+
+    def record_lane_failure(self) -> bool:
+        """Count a lane failure the primary session then answered.
+
+        Return True once ``PIPELINE_FALLBACK_FAILURES`` happened in a row, so
+        a single lost packet does not turn parallel sessions off.
+        """
+        self.lane_failures += 1
+        return self.lane_failures >= PIPELINE_FALLBACK_FAILURES
+
+    def fall_back_to_serial(self) -> list[AsyncModbusTcpClient]:
+        """Stop granting parallel requests; return the lane clients to close."""
+        if not self.serial_fallback:
+            _LOGGER.warning(
+                "Modbus device does not handle parallel sessions, using one"
+            )
+        self.serial_fallback = True
+        self._capacity = 1
+        return self.pop_lane_clients()
+
+    def pop_lane_clients(self) -> list[AsyncModbusTcpClient]:
+        """Forget every extra lane; return their clients to close."""
+        clients = list(self._lane_clients.values())
+        self._lane_clients.clear()
+        return clients
+
+    def pop_idle_lane_clients(self, since: float) -> list[AsyncModbusTcpClient]:
+        """Forget the free lanes unused since ``since``; return their clients."""
+        idle = [
+            lane
+            for lane, client in self._lane_clients.items()
+            if lane not in self._lanes_in_use
+            and (modbus_client_stats(client).last_activity or 0) < since
+        ]
+        return [self._lane_clients.pop(lane) for lane in idle]
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: RequestPriority,
+        *,
+        max_wait: float | None = None,
+        primary: bool = False,
+    ) -> AsyncIterator[int]:
+        """Hold the connection for one request; yield the granted lane.
+
+        ``primary`` waits for lane 0, the connection's own client, as writes
+        and multi-request sequences (write, then read back) must. Raise
+        :class:`ModbusRequestDropped` instead if the connection was not
+        granted within ``max_wait`` seconds (a poll that is already stale).
+        """
+        queued_at = monotonic()
+        lane = await self._async_wait_turn(priority, max_wait, primary)
+        self.stats[priority].record(monotonic() - queued_at)
+        try:
+            yield lane
+        finally:
+            self._release(lane)
+
+    async def _async_wait_turn(
+        self, priority: RequestPriority, max_wait: float | None, primary: bool
+    ) -> int:
+        """Queue up and return the lane once the connection was handed over."""
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (priority, next(self._sequence), future, primary)
+        )
+        self._grant()
+        if future.done():
+            return future.result()
+        self.peak_depth = max(self.peak_depth, self.depth)
+        try:
+            await asyncio.wait((future,), timeout=max_wait)
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled right after being granted: pass the turn on.
+                self._release(future.result())
+            else:
+                future.cancel()
+            raise
+        if not future.done():
+            future.cancel()
+            self.stats[priority].dropped += 1
+            msg = f"Request waited more than {max_wait}s for the connection"
+            raise ModbusRequestDropped(msg)
+        return future.result()
+
+    def _free_lane(self, primary: bool = False) -> int | None:
+        for lane in range(1 if primary else self._capacity):
+            if lane not in self._lanes_in_use:
+                return lane
+        return None
+
+    def _take(self, lane: int) -> None:
+        self._lanes_in_use.add(lane)
+        self.peak_in_flight = max(self.peak_in_flight, len(self._lanes_in_use))
+
+    def _release(self, lane: int) -> None:
+        """Hand the freed lane to the best waiting request, if any."""
+        self._lanes_in_use.discard(lane)
+        self._grant()
+
+    def _grant(self) -> None:
+        """Grant free lanes in priority order; lane-0 requests may be skipped."""
+        skipped = []
+        while self._waiters and self._free_lane() is not None:
+            waiter = heapq.heappop(self._waiters)
+            _, _, future, primary = waiter
+            if future.done():
+                continue
+            if (lane := self._free_lane(primary)) is None:
+                skipped.append(waiter)
+                continue
+            self._take(lane)
+            future.set_result(lane)
+        for waiter in skipped:
+            heapq.heappush(self._waiters, waiter)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Queue depth and per-priority wait times for diagnostics."""
+        return {
+            "depth": self.depth,
+            "peak_depth": self.peak_depth,
+            "capacity": self._capacity,
+            "peak_in_flight": self.peak_in_flight,
+            "serial_fallback": self.serial_fallback,
+            "lane_failures": self.lane_failures,
+            "wait": {
+                priority.name.lower(): stats.as_dict()
+                for priority, stats in self.stats.items()
+            },
+        }
+
+
+def request_slot(
+    lock: ModbusRequestQueue | asyncio.Lock | None,
+    priority: RequestPriority,
+    max_wait: float | None,
+    *,
+    primary: bool = False,
+) -> AbstractAsyncContextManager[Any]:
+    """Context manager that serializes one request on ``lock``."""
+    if lock is None:
+        return _async_null_lock()
+    if isinstance(lock, ModbusRequestQueue):
+        return lock.slot(priority, max_wait=max_wait, primary=primary)
+    return lock
+
+
+# Client methods that may run on an extra lane. Writes stay on the primary
+# session, in order with whatever the caller sends next on it.
+_LANE_METHODS = frozenset({"read_holding_registers"})
+
+# Upper bounds (seconds) of the latency histogram buckets; one more bucket
+# counts everything slower.
+LATENCY_BUCKETS: tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Modbus function code of each client method used by the integration.
+_FUNCTION_CODES = {
+    "read_holding_registers": 3,
+    "write_register": 6,
+    "write_registers": 16,
+}
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations; recording is a bisect and adds."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Count one duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float | None:
+        """Mean duration in seconds, if anything was recorded."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics (seconds rounded to ms)."""
+        bounds = [f"le_{round(bound * 1000)}ms" for bound in LATENCY_BUCKETS]
+        return {
+            "count": self.count,
+            "last": round(self.last, 3),
+            "max": round(self.max, 3),
+            "mean": round(self.mean, 3) if self.mean is not None else None,
+            "buckets": dict(zip([*bounds, "slower"], self.counts, strict=True)),
+        }
+
+
+class RttEstimator:
+    """Smoothed round trip and its variation, as TCP derives its RTO (RFC 6298).
+
+    The timeout is ``srtt + 4 * rttvar`` kept within ``floor`` and
+    ``ceiling``; until the first sample it is the ceiling. Each timeout
+    doubles it (up to the ceiling) until the next answer arrives, so a
+    slow but healthy link still gets through while a charger that normally
+    answers in milliseconds is declared dead quickly.
+    """
+
+    _ALPHA = 1 / 8
+    _BETA = 1 / 4
+    _K = 4
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize without samples."""
+        self.floor = floor
+        self.ceiling = ceiling
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self._backoff = 1
+
+    @property
+    def timeout(self) -> float:
+        """Seconds to wait for the next answer."""
+        if self.srtt is None:
+            return self.ceiling
+        timeout = max(self.srtt + self._K * self.rttvar, self.floor) * self._backoff
+        return min(timeout, self.ceiling)
+
+    def record(self, rtt: float) -> None:
+        """Fold in the round trip of one answered request."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += self._BETA * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += self._ALPHA * (rtt - self.srtt)
+        self._backoff = 1
+
+    def back_off(self) -> None:
+        """Double the timeout after a request went unanswered."""
+        if self.timeout < self.ceiling:
+            self._backoff *= 2
+
+    def as_dict(self) -> dict[str, Any]:
+        """Estimator state for diagnostics (seconds rounded to ms)."""
+        return {
+            "timeout": round(self.timeout, 3),
+            "srtt": round(self.srtt, 3) if self.srtt is not None else None,
+            "rttvar": round(self.rttvar, 3),
+        }
+
+
+class CircuitState(StrEnum):
+    """State of a client's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ConnectionException):
+    """A connect attempt was refused because the charger is known to be down."""
+
+
+class CircuitBreaker:
+    """Stop connecting to a charger that is down, probing it with backoff.
+
+    ``CIRCUIT_BREAKER_THRESHOLD`` consecutive failed connects open the
+    circuit: connects fail at once, without touching the network, until a
+    jittered delay has passed that doubles with every failed probe. Then
+    the circuit is half-open and a single connect is let through as a
+    probe; its success closes the circuit, its failure opens it again.
+    Listeners are called with the breaker on every transition.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        base_delay: float = CIRCUIT_BREAKER_BASE_DELAY,
+        max_delay: float = CIRCUIT_BREAKER_MAX_DELAY,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.threshold = threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.retry_at = 0.0
+        self._open_streak = 0
+        self._listeners: list[Callable[[CircuitBreaker], None]] = []
+
+    def add_listener(
+        self, listener: Callable[[CircuitBreaker], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` on every state change; return its remover."""
+        self._listeners.append(listener)
+        return partial(self._listeners.remove, listener)
+
+    def _transition(self, state: CircuitState) -> None:
+        self.state = state
+        for listener in list(self._listeners):
+            listener(self)
+
+    def before_connect(self, now: float) -> None:
+        """Raise :class:`CircuitOpenError` unless a connect may be attempted."""
+        if self.state is CircuitState.CLOSED:
+            return
+        if self.state is CircuitState.OPEN and now >= self.retry_at:
+            _LOGGER.debug("Circuit half-open, probing the charger")
+            self._transition(CircuitState.HALF_OPEN)
+            return
+        if self.state is CircuitState.HALF_OPEN:
+            msg = "Charger unreachable, a probe connect is in progress"
+        else:
+            msg = f"Charger unreachable, next attempt in {self.retry_at - now:.0f}s"
+        raise CircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful connect."""
+        self.failures = 0
+        self._open_streak = 0
+        if self.state is not CircuitState.CLOSED:
+            _LOGGER.debug("Circuit closed, the charger answered")
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed connect; open the circuit when it is one too many."""
+        self.failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failures >= self.threshold
+        ):
+            delay = min(self.base_delay * 2**self._open_streak, self.max_delay)
+            self._open_streak += 1
+            self.trips += 1
+            self.retry_at = now + random.uniform(delay / 2, delay)
+            _LOGGER.debug("Circuit open, next probe in %.0fs", self.retry_at - now)
+            self._transition(CircuitState.OPEN)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Breaker state for diagnostics."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+        }
+
+
+@dataclass
+class ModbusClientStats:
+    """Transaction timings and failure counters of one Modbus client."""
+
+    lock_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # Request round trips keyed by function code.
+    requests: dict[int, LatencyHistogram] = field(default_factory=dict)
+    # Adaptive timeouts derived from the round trips above.
+    connect_rtt: RttEstimator = field(
+        default_factory=lambda: RttEstimator(
+            MODBUS_MIN_CONNECT_TIMEOUT, MODBUS_CONNECT_TIMEOUT
+        )
+    )
+    request_rtt: RttEstimator = field(
+        default_factory=lambda: RttEstimator(
+            MODBUS_MIN_READ_TIMEOUT, MODBUS_READ_TIMEOUT
+        )
+    )
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    # Monotonic time of the last connect or answered request.
+    last_activity: float | None = None
+    connects: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+    @property
+    def reconnects(self) -> int:
+        """Connections opened after the first one."""
+        return max(self.connects - 1, 0)
+
+    def request(self, method_name: str) -> LatencyHistogram:
+        """Round-trip histogram of one client method's function code."""
+        code = _FUNCTION_CODES.get(method_name, 0)
+        if (histogram := self.requests.get(code)) is None:
+            histogram = self.requests[code] = LatencyHistogram()
+        return histogram
+
+    def record_request(self, method_name: str, seconds: float) -> None:
+        """Count one answered request and feed its round trip to the timeout."""
+        self.request(method_name).record(seconds)
+        self.request_rtt.record(seconds)
+        self.last_activity = monotonic()
+
+    def record_failure(self, err: BaseException) -> None:
+        """Count a failed connect or request as a timeout or an error."""
+        if isinstance(err, (asyncio.TimeoutError, ModbusIOException)):
+            self.timeouts += 1
+        else:
+            self.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters and histograms for diagnostics."""
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "lock_wait": self.lock_wait.as_dict(),
+            "connect": self.connect.as_dict(),
+            "connect_timeout": self.connect_rtt.as_dict(),
+            "request_timeout": self.request_rtt.as_dict(),
+            "circuit": self.breaker.as_dict(),
+            "requests": {
+                f"fc{code:02d}": histogram.as_dict()
+                for code, histogram in sorted(self.requests.items())
+            },
+        }
+
+
+@dataclass
+class ModbusPollStats:
+    """Round trips and failures of one charger's register polls.
+
+    Kept per coordinator: chargers behind one gateway share a client, whose
+    :class:`ModbusClientStats` also count keepalive reads and write
+    read-backs.
+    """
+
+    round_trip: LatencyHistogram = field(default_factory=LatencyHistogram)
+    timeouts: int = 0
+    errors: int = 0
+    reconnects: int = 0
+
+    def record_failure(self, err: BaseException) -> None:
+        """Count a failed poll request as a timeout or an error."""
+        if isinstance(err, (asyncio.TimeoutError, ModbusIOException)):
+            self.timeouts += 1
+        else:
+            self.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters and the round-trip histogram for diagnostics."""
+        return {
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "reconnects": self.reconnects,
+            "round_trip": self.round_trip.as_dict(),
+        }
+
+
+_CLIENT_STATS: WeakKeyDictionary[AsyncModbusTcpClient, ModbusClientStats] = (
+    WeakKeyDictionary()
+)
+
+
+def modbus_client_stats(client: AsyncModbusTcpClient) -> ModbusClientStats:
+    """Return the transaction statistics of ``client``, created on first use."""
+    if (stats := _CLIENT_STATS.get(client)) is None:
+        stats = _CLIENT_STATS[client] = ModbusClientStats()
+    return stats
+
+
+async def async_ensure_client_connected(
+    client: AsyncModbusTcpClient, poll_stats: ModbusPollStats | None = None
+) -> None:
+    """Open the TCP connection if needed; count a reconnect in ``poll_stats``."""
     if client.connected:
         return
 
-    connected = await asyncio.wait_for(
-        client.connect(),
-        timeout=MODBUS_CONNECT_TIMEOUT,
-    )
-    if not connected:
-        msg = "connect() returned False"
-        raise ConnectionException(msg)
+    stats = modbus_client_stats(client)
+    stats.breaker.before_connect(monotonic())
+    started_at = monotonic()
+    try:
+        connected = await asyncio.wait_for(
+            client.connect(),
+            timeout=stats.connect_rtt.timeout,
+        )
+        if not connected:
+            msg = "connect() returned False"
+            raise ConnectionException(msg)
+    except (ConnectionException, OSError, asyncio.TimeoutError) as err:
+        stats.record_failure(err)
+        if isinstance(err, asyncio.TimeoutError):
+            stats.connect_rtt.back_off()
+        stats.breaker.record_failure(monotonic())
+        raise
+    except BaseException:
+        # A cancelled or crashed probe must not leave the circuit half-open,
+        # or every later connect would be refused as "probe in progress".
+        stats.breaker.record_failure(monotonic())
+        raise
+    stats.breaker.record_success()
+    duration = monotonic() - started_at
+    stats.connects += 1
+    if poll_stats is not None and stats.connects > 1:
+        poll_stats.reconnects += 1
+    stats.last_activity = monotonic()
+    stats.connect.record(duration)
+    stats.connect_rtt.record(duration)
+    _enable_tcp_keepalive(client)
+
+
+def _enable_tcp_keepalive(client: AsyncModbusTcpClient) -> None:
+    """Let the OS probe the idle socket and close it once the peer is gone."""
+    transport = getattr(getattr(client, "ctx", None), "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Not every platform lets the probe timing be set per socket.
+        for name, value in (
+            ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+        ):
+            if (option := getattr(socket, name, None)) is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+    except OSError:
+        _LOGGER.debug("Could not enable TCP keepalive", exc_info=True)
 
 
 async def async_reset_client(client: AsyncModbusTcpClient) -> None:
@@ -60,22 +709,381 @@ async def async_modbus_call(
     client: AsyncModbusTcpClient,
     method_name: str,
     *,
-    lock: asyncio.Lock | None = None,
+    lock: ModbusRequestQueue | asyncio.Lock | None = None,
+    priority: RequestPriority = RequestPriority.USER_WRITE,
+    max_wait: float | None = None,
     retry: bool = False,
+    transaction: AbstractAsyncContextManager[None] | None = None,
+    poll_stats: ModbusPollStats | None = None,
     **kwargs: Any,
 ) -> Any:
-    """Run one Modbus call under a shared lock with optional reconnect+retry."""
-    async with lock or _async_null_lock():
-        await async_ensure_client_connected(client)
-        method = getattr(client, method_name)
+    """Run one Modbus call under a shared lock with optional reconnect+retry.
+
+    With a :class:`ModbusRequestQueue`, ``priority`` decides the call's place
+    in the queue and ``max_wait`` how long it may wait before being dropped.
+    ``transaction`` is entered only once the connection was granted (e.g. a
+    fleet poll slot), so a busy gateway cannot hold it while queueing.
+    ``poll_stats`` additionally records the call's round trip, failures and
+    reconnects for the calling charger alone.
+    """
+    queued_at = monotonic()
+    async with AsyncExitStack() as stack:
+        lane = await stack.enter_async_context(
+            request_slot(
+                lock,
+                priority,
+                max_wait,
+                primary=method_name not in _LANE_METHODS,
+            )
+        )
+        if transaction is not None:
+            await stack.enter_async_context(transaction)
+        stats = modbus_client_stats(client)
+        stats.lock_wait.record(monotonic() - queued_at)
+        if not lane or not isinstance(lock, ModbusRequestQueue):
+            return await _async_serial_call(
+                client, stats, method_name, kwargs, retry, poll_stats
+            )
 
+        queue = lock
+        lane_client = queue.lane_client(lane, client)
         try:
-            return await method(**kwargs)
+            await async_ensure_client_connected(lane_client, poll_stats)
+            result = await _async_timed_request(
+                lane_client,
+                modbus_client_stats(lane_client),
+                method_name,
+                kwargs,
+                poll_stats,
+            )
         except (ConnectionException, ModbusIOException, asyncio.TimeoutError):
-            await async_reset_client(client)
-            if not retry:
-                raise
+            await async_reset_client(lane_client)
+        else:
+            queue.record_lane_success()
+            return result
+
+    # Retry on the primary session only after the lane and the transaction
+    # were released, so a request holding lane 0 never waits for either.
+    async with queue.slot(priority, max_wait=max_wait, primary=True):
+        result = await _async_serial_call(
+            client, stats, method_name, kwargs, retry, poll_stats
+        )
+    if queue.record_lane_failure():
+        # The device keeps answering on its primary session but not on the
+        # others: it cannot be trusted with parallel requests.
+        for lane_client in queue.fall_back_to_serial():
+            await async_close_client(lane_client)
+    return result
+
+
+async def _async_serial_call(
+    client: AsyncModbusTcpClient,
+    stats: ModbusClientStats,
+    method_name: str,
+    kwargs: dict[str, Any],
+    retry: bool,
+    poll_stats: ModbusPollStats | None = None,
+) -> Any:
+    """Send one request on ``client`` with optional reconnect+retry."""
+    await async_ensure_client_connected(client, poll_stats)
+    try:
+        return await _async_timed_request(
+            client, stats, method_name, kwargs, poll_stats
+        )
+    except (ConnectionException, ModbusIOException, asyncio.TimeoutError):
+        await async_reset_client(client)
+        if not retry:
+            raise
+
+    stats.retries += 1
+    await async_ensure_client_connected(client, poll_stats)
+    return await _async_timed_request(
+        client, stats, method_name, kwargs, poll_stats
+    )
+
+
+async def _async_timed_request(
+    client: AsyncModbusTcpClient,
+    stats: ModbusClientStats,
+    method_name: str,
+    kwargs: dict[str, Any],
+    poll_stats: ModbusPollStats | None = None,
+) -> Any:
+    """Send one request within the client's adaptive timeout.
+
+    The timeout bounds the whole call, including pymodbus' own retries, so
+    an unanswered request releases the connection after a few smoothed
+    round trips instead of the full ``MODBUS_READ_TIMEOUT``.
+    """
+    method = getattr(client, method_name)
+    started_at = monotonic()
+    try:
+        result = await asyncio.wait_for(
+            method(**kwargs), timeout=stats.request_rtt.timeout
+        )
+    except (ConnectionException, ModbusIOException, asyncio.TimeoutError) as err:
+        stats.record_failure(err)
+        if poll_stats is not None:
+            poll_stats.record_failure(err)
+        if not isinstance(err, ConnectionException):
+            stats.request_rtt.back_off()
+        raise
+    duration = monotonic() - started_at
+    stats.record_request(method_name, duration)
+    if poll_stats is not None:
+        poll_stats.round_trip.record(duration)
+    return result
+
+
+@dataclass
+class PooledModbusConnection:
+    """One TCP session and request queue shared by every entry on a host:port."""
+
+    client: AsyncModbusTcpClient
+    queue: ModbusRequestQueue = field(default_factory=ModbusRequestQueue)
+    entry_ids: set[str] = field(default_factory=set)
+    # Requested parallel sessions per entry; the smallest one applies.
+    pipeline_depths: dict[str, int] = field(default_factory=dict)
+    # Unit id and gateway idle timeout (0: none) per entry; one keepalive
+    # runs at the shortest timeout for the whole connection.
+    unit_ids: dict[str, int] = field(default_factory=dict)
+    idle_timeouts: dict[str, float] = field(default_factory=dict)
+    keepalive: ModbusConnectionKeepalive | None = None
+    stop_keepalive: CALLBACK_TYPE | None = None
+
+    @property
+    def generation(self) -> int:
+        """Sessions opened so far on the client, whoever opened them.
+
+        Every connect bumps it, including reconnects in the retry path of
+        another entry's request, so every entry sharing the connection
+        notices the new session (charger or gateway reboot or swap).
+        """
+        return modbus_client_stats(self.client).connects
+
+
+class ModbusConnectionPool:
+    """Refcounted Modbus TCP connections keyed by ``host:port``.
+
+    Chargers behind one Modbus TCP gateway differ only in unit id; they share
+    a single socket and serialize their requests on the connection's queue,
+    unless pipelining gives the queue extra sessions.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty pool."""
+        self._hass = hass
+        self._connections: dict[str, PooledModbusConnection] = {}
+
+    def __len__(self) -> int:
+        """Number of open pool keys."""
+        return len(self._connections)
+
+    @staticmethod
+    def key(host: str, port: int) -> str:
+        """Pool key for a gateway or charger address."""
+        return f"{host}:{port}"
+
+    def get(self, host: str, port: int) -> PooledModbusConnection | None:
+        """Return the pooled connection for ``host:port``, if any."""
+        return self._connections.get(self.key(host, port))
+
+    @callback
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        entry_id: str,
+        client_factory: Callable[[], AsyncModbusTcpClient],
+        *,
+        unit_id: int = DEFAULT_UNIT_ID,
+        pipeline_depth: int = 1,
+        idle_timeout: float = 0,
+    ) -> PooledModbusConnection:
+        """Return the connection for ``host:port``, creating it on first use.
+
+        ``pipeline_depth`` above one asks for that many requests in flight,
+        on extra sessions made by ``client_factory``; every entry on the
+        connection must ask for it, as the smallest depth applies.
+        ``idle_timeout`` (seconds) is the gateway's idle timeout; the
+        connection's keepalive follows the shortest one configured.
+        """
+        key = self.key(host, port)
+        connection = self._connections.get(key)
+        if connection is None:
+            connection = self._connections[key] = PooledModbusConnection(
+                client_factory(),
+                ModbusRequestQueue(lane_factory=client_factory),
+            )
+        connection.entry_ids.add(entry_id)
+        connection.pipeline_depths[entry_id] = pipeline_depth
+        connection.unit_ids[entry_id] = unit_id
+        connection.idle_timeouts[entry_id] = idle_timeout
+        connection.queue.capacity = min(connection.pipeline_depths.values())
+        self._async_update_keepalive(connection)
+        return connection
+
+    async def async_release(self, host: str, port: int, entry_id: str) -> None:
+        """Drop ``entry_id`` from its connection; close it after the last user."""
+        key = self.key(host, port)
+        connection = self._connections.get(key)
+        if connection is None:
+            return
+        connection.entry_ids.discard(entry_id)
+        connection.pipeline_depths.pop(entry_id, None)
+        connection.unit_ids.pop(entry_id, None)
+        connection.idle_timeouts.pop(entry_id, None)
+        self._async_update_keepalive(connection)
+        if connection.entry_ids:
+            connection.queue.capacity = min(connection.pipeline_depths.values())
+            return
+        del self._connections[key]
+        connection.queue.capacity = 1
+        async with connection.queue.slot(RequestPriority.USER_WRITE):
+            for lane_client in connection.queue.pop_lane_clients():
+                await async_close_client(lane_client)
+            if connection.client.connected:
+                await async_close_client(connection.client)
+
+    @callback
+    def _async_update_keepalive(self, connection: PooledModbusConnection) -> None:
+        """Run one keepalive at the shortest idle timeout, or none at all."""
+        idle_timeout = min(
+            (timeout for timeout in connection.idle_timeouts.values() if timeout),
+            default=0,
+        )
+        current = connection.keepalive
+        if (current.idle_timeout if current is not None else 0) == idle_timeout:
+            return
+        if connection.stop_keepalive is not None:
+            connection.stop_keepalive()
+        connection.keepalive = connection.stop_keepalive = None
+        if idle_timeout:
+            connection.keepalive = ModbusConnectionKeepalive(
+                self._hass, connection, idle_timeout
+            )
+            connection.stop_keepalive = connection.keepalive.async_start()
+
+
+@dataclass
+class KeepaliveStats:
+    """Counters for diagnostics."""
+
+    heartbeats: int = 0
+    reconnects: int = 0
+    failures: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "heartbeats": self.heartbeats,
+            "reconnects": self.reconnects,
+            "failures": self.failures,
+        }
+
+
+class ModbusConnectionKeepalive:
+    """Keep a pooled connection open across the gateway's idle timeout.
+
+    Some gateways silently drop a socket that carried no request for a
+    while, so the first poll after a quiet period would time out and pay
+    for the reconnect. The connection is checked every quarter of
+    ``idle_timeout``: once idle for half of it, a one-register read is sent
+    at the lowest priority, and a socket found closed is reopened at once
+    rather than by the next poll. Extra lanes idle that long are closed
+    instead, so no request lands on a session the gateway already dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: PooledModbusConnection,
+        idle_timeout: float,
+    ) -> None:
+        """Initialize the keepalive; ``async_start`` schedules the checks."""
+        self._hass = hass
+        self._connection = connection
+        self.idle_timeout = idle_timeout
+        self._task: asyncio.Task[None] | None = None
+        self.stats = KeepaliveStats()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Check the connection periodically; return the callback that stops."""
+        unsubscribe = async_track_time_interval(
+            self._hass,
+            self._async_tick,
+            timedelta(seconds=self.idle_timeout / 4),
+            name=f"{DOMAIN} connection keepalive",
+        )
+
+        @callback
+        def _async_stop() -> None:
+            unsubscribe()
+            if self._task is not None:
+                self._task.cancel()
+
+        return _async_stop
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self.async_check(), f"{DOMAIN} connection keepalive"
+            )
+
+    async def async_check(self) -> None:
+        """Close idle lanes and refresh the primary session if it went idle."""
+        connection = self._connection
+        idle_since = monotonic() - self.idle_timeout / 2
+        for lane_client in connection.queue.pop_idle_lane_clients(idle_since):
+            await async_close_client(lane_client)
+
+        client = connection.client
+        stats = modbus_client_stats(client)
+        if not stats.connects:
+            # Never connected: the first poll reports why.
+            return
+        if client.connected and (stats.last_activity or 0) >= idle_since:
+            return
+        if not client.connected:
+            self.stats.reconnects += 1
+        try:
+            # Any answer, even an exception response, proves the link alive.
+            await async_modbus_call(
+                client,
+                "read_holding_registers",
+                lock=connection.queue,
+                priority=RequestPriority.SLOW_POLL,
+                max_wait=self.idle_timeout / 4,
+                retry=True,
+                address=REGISTER_BLOCK_ADDRESS,
+                count=1,
+                # Any charger behind the gateway will do.
+                device_id=next(
+                    iter(connection.unit_ids.values()), DEFAULT_UNIT_ID
+                ),
+            )
+        except ModbusRequestDropped:
+            # The connection is busy, hence not idle.
+            return
+        except (ConnectionException, ModbusIOException, asyncio.TimeoutError) as err:
+            self.stats.failures += 1
+            _LOGGER.debug("Modbus keepalive failed: %s", err)
+            return
+        self.stats.heartbeats += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Configuration and counters for diagnostics."""
+        return {"idle_timeout": self.idle_timeout, **self.stats.as_dict()}
+
+
+_DATA_CONNECTION_POOL = f"{DOMAIN}_connection_pool"
+
 
-        await async_ensure_client_connected(client)
-        method = getattr(client, method_name)
-        return await method(**kwargs)
+@callback
+def async_get_connection_pool(hass: HomeAssistant) -> ModbusConnectionPool:
+    """Return the integration-wide Modbus connection pool."""
+    pool: ModbusConnectionPool | None = hass.data.get(_DATA_CONNECTION_POOL)
+    if pool is None:
+        pool = hass.data[_DATA_CONNECTION_POOL] = ModbusConnectionPool(hass)
+    return pool
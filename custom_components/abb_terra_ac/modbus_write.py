@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+import logging
+from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
 from pymodbus.client import AsyncModbusTcpClient
 
+from .const import DEFAULT_UNIT_ID, DOMAIN
 from .errors import build_service_error
-from .modbus import async_modbus_call
+from .modbus import (
+    ModbusRequestQueue,
+    RequestPriority,
+    async_modbus_call,
+    request_slot,
+)
+from .registers import REGISTER_BLOCK_ADDRESS
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_write_register(
@@ -15,7 +29,9 @@ async def async_write_register(
     address: int,
     value: int,
     *,
-    lock: asyncio.Lock | None = None,
+    lock: ModbusRequestQueue | asyncio.Lock | None = None,
+    unit_id: int = DEFAULT_UNIT_ID,
+    priority: RequestPriority = RequestPriority.USER_WRITE,
 ) -> None:
     """Write a single holding register; raise translated errors on failure."""
     try:
@@ -23,8 +39,10 @@ async def async_write_register(
             client,
             "write_register",
             lock=lock,
+            priority=priority,
             address=address,
             value=value,
+            device_id=unit_id,
         )
     except Exception as err:
         raise build_service_error("charger_unavailable") from err
@@ -38,7 +56,9 @@ async def async_write_registers(
     address: int,
     values: list[int],
     *,
-    lock: asyncio.Lock | None = None,
+    lock: ModbusRequestQueue | asyncio.Lock | None = None,
+    unit_id: int = DEFAULT_UNIT_ID,
+    priority: RequestPriority = RequestPriority.USER_WRITE,
 ) -> None:
     """Write multiple holding registers; raise translated errors on failure."""
     try:
@@ -46,11 +66,161 @@ async def async_write_registers(
             client,
             "write_registers",
             lock=lock,
+            priority=priority,
             address=address,
             values=values,
+            device_id=unit_id,
         )
     except Exception as err:
         raise build_service_error("charger_unavailable") from err
 
     if result.isError():
         raise build_service_error("write_failed")
+
+
+async def async_write_and_read_back(
+    client: AsyncModbusTcpClient,
+    address: int,
+    values: list[int],
+    readback: tuple[int, int],
+    *,
+    lock: ModbusRequestQueue | asyncio.Lock | None = None,
+    unit_id: int = DEFAULT_UNIT_ID,
+    priority: RequestPriority = RequestPriority.USER_WRITE,
+) -> list[int] | None:
+    """Write ``values`` at ``address``, then read back the status registers.
+
+    ``readback`` is the ``(offset, count)`` slice of the 4000h status block
+    that mirrors the written control register. Write and read share one
+    queue slot, so no poll runs in between. Write failures raise translated
+    errors. A failed read-back returns ``None``, because the write itself
+    went through.
+    """
+    # The read-back goes out on the session the write used.
+    async with request_slot(lock, priority, None, primary=True):
+        if len(values) == 1:
+            await async_write_register(client, address, values[0], unit_id=unit_id)
+        else:
+            await async_write_registers(client, address, values, unit_id=unit_id)
+
+        offset, count = readback
+        try:
+            result = await async_modbus_call(
+                client,
+                "read_holding_registers",
+                address=REGISTER_BLOCK_ADDRESS + offset,
+                count=count,
+                device_id=unit_id,
+            )
+        except Exception:
+            _LOGGER.debug("Read-back after writing %s failed", address, exc_info=True)
+            return None
+        if result.isError():
+            _LOGGER.debug("Read-back after writing %s failed: %s", address, result)
+            return None
+        return list(result.registers[:count])
+
+
+class CoalescingRegisterWriter:
+    """Coalesce bursts of writes to the same holding registers.
+
+    Writes requested within ``window`` seconds of the first pending one are
+    merged: only the latest value per register is written and read back
+    (see :func:`async_write_and_read_back`), instead of once per request.
+    Every caller waits for the write of its register and sees only that
+    register's error. The flush runs as a background task of the config
+    entry, so unloading the entry cancels it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client: AsyncModbusTcpClient,
+        *,
+        lock: ModbusRequestQueue | asyncio.Lock | None,
+        unit_id: int,
+        window: float,
+        readback: Mapping[int, tuple[int, int]],
+        on_readback: Callable[[int, list[int] | None], Awaitable[None]],
+    ) -> None:
+        """Initialize the writer for one charger.
+
+        ``readback`` maps each writable address to the status block slice
+        mirroring it; ``on_readback`` receives that slice's offset and the
+        registers read back after the write.
+        """
+        self._hass = hass
+        self._entry = entry
+        self.client = client
+        self.window = window
+        self._lock = lock
+        self._unit_id = unit_id
+        self._readback = readback
+        self._on_readback = on_readback
+        self._pending: dict[int, list[int]] = {}
+        self._results: dict[int, asyncio.Future[None]] = {}
+        self._flush: asyncio.Task[None] | None = None
+        self.requested = 0
+        self.written = 0
+        self.coalesced = 0
+
+    async def async_write(self, address: int, values: list[int]) -> None:
+        """Queue ``values`` for ``address`` and wait until they were written."""
+        self.requested += 1
+        if address in self._pending:
+            self.coalesced += 1
+        self._pending[address] = values
+        if (result := self._results.get(address)) is None:
+            result = self._results[address] = self._hass.loop.create_future()
+        if self._flush is None:
+            self._flush = self._entry.async_create_background_task(
+                self._hass,
+                self._async_flush_after_window(),
+                f"{DOMAIN} limit write {self._entry.entry_id}",
+            )
+        # Shielded: one caller giving up must not cancel the others' write.
+        await asyncio.shield(result)
+
+    async def _async_flush_after_window(self) -> None:
+        """Write and read back the latest pending value of every register."""
+        results = self._results
+        try:
+            await asyncio.sleep(self.window)
+            pending, self._pending = self._pending, {}
+            # Requests from now on start the next window.
+            self._results = {}
+            self._flush = None
+            for address, values in pending.items():
+                try:
+                    await self._async_write(address, values)
+                except Exception as err:
+                    results[address].set_exception(err)
+                else:
+                    results[address].set_result(None)
+        finally:
+            # Cancelled (entry unloaded): release the callers still waiting.
+            for result in results.values():
+                result.cancel()
+
+    async def _async_write(self, address: int, values: list[int]) -> None:
+        readback = self._readback[address]
+        registers = await async_write_and_read_back(
+            self.client,
+            address,
+            values,
+            readback,
+            lock=self._lock,
+            unit_id=self._unit_id,
+        )
+        self.written += 1
+        await self._on_readback(readback[0], registers)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Write counters for diagnostics."""
+        return {
+            "window": self.window,
+            "requested": self.requested,
+            "written": self.written,
+            "coalesced": self.coalesced,
+        }
@@ -12,7 +12,6 @@ from pymodbus.client import AsyncModbusTcpClient
 
 from . import AbbTerraAcDataUpdateCoordinator, AbbTerraAcRuntimeData
 from .entity import AbbTerraAcEntity
-from .modbus_write import async_write_register, async_write_registers
 
 PARALLEL_UPDATES = 0
 
@@ -52,6 +51,13 @@ class AbbTerraAcBaseNumber(AbbTerraAcEntity, NumberEntity):
 class AbbTerraAcChargingCurrentLimit(AbbTerraAcBaseNumber):
     """Number entity for setting the charging current limit."""
 
+    _coordinator_keys = frozenset(
+        {
+            "charging_current_limit_modbus",
+            "user_settable_max_current",
+        }
+    )
+
     _attr_entity_category = None
 
     def __init__(
@@ -85,18 +91,19 @@ class AbbTerraAcChargingCurrentLimit(AbbTerraAcBaseNumber):
         value_to_send = int(value * 1000)
         high_word = value_to_send >> 16
         low_word = value_to_send & 0xFFFF
-        await async_write_registers(
-            self.client,
-            16640,
-            [high_word, low_word],
-            lock=self.coordinator.modbus_lock,
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.limit_writer.async_write(16640, [high_word, low_word])
 
 
 class AbbTerraAcFallbackLimit(AbbTerraAcBaseNumber):
     """Number entity for setting the fallback current limit."""
 
+    _coordinator_keys = frozenset(
+        {
+            "fallback_limit",
+            "user_settable_max_current",
+        }
+    )
+
     _attr_entity_category = None
 
     def __init__(
@@ -126,10 +133,4 @@ class AbbTerraAcFallbackLimit(AbbTerraAcBaseNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new fallback limit."""
-        await async_write_register(
-            self.client,
-            16649,
-            int(value),
-            lock=self.coordinator.modbus_lock,
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.limit_writer.async_write(16649, [int(value)])
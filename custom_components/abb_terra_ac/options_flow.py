@@ -2,24 +2,59 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigFlowResult
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
+    AGGREGATION_WINDOW_CHOICES,
+    CONF_AGGREGATION_WINDOWS,
+    CONF_CHARGING_PRIORITY,
+    CONF_CONNECTION_IDLE_TIMEOUT,
+    CONF_FLEET_CURRENT_BUDGET,
+    CONF_GRID_EXPORT_ENTITY,
+    CONF_GRID_PHASES,
+    CONF_GRID_POWER_ENTITY,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAIN_FUSE_LIMIT,
+    CONF_PIPELINE_DEPTH,
     CONF_SCAN_INTERVAL,
+    CONF_WRITE_COALESCE_WINDOW,
+    DEFAULT_AGGREGATION_WINDOWS,
+    DEFAULT_CHARGING_PRIORITY,
+    DEFAULT_CONNECTION_IDLE_TIMEOUT,
+    DEFAULT_GRID_PHASES,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_PIPELINE_DEPTH,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WRITE_COALESCE_WINDOW,
+    MAX_CHARGING_PRIORITY,
+    MAX_CONNECTION_IDLE_TIMEOUT,
+    MAX_FLEET_CURRENT_BUDGET,
     MAX_SCAN_INTERVAL,
+    MAX_MAIN_FUSE_LIMIT,
+    MAX_PIPELINE_DEPTH,
+    MAX_WRITE_COALESCE_WINDOW,
     MIN_SCAN_INTERVAL,
 )
 
 
 class AbbTerraAcOptionsFlow(config_entries.OptionsFlow):
-    """Options flow: polling interval and future runtime-only settings."""
+    """Options flow: polling intervals and future runtime-only settings."""
 
     async def async_step_init(
-        self, user_input: dict[str, int] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Offer options form."""
         if user_input is not None:
@@ -28,6 +63,23 @@ class AbbTerraAcOptionsFlow(config_entries.OptionsFlow):
         current = int(
             self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         )
+        current_idle = int(
+            self.config_entry.options.get(
+                CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+            )
+        )
+        current_window = int(
+            self.config_entry.options.get(
+                CONF_WRITE_COALESCE_WINDOW, DEFAULT_WRITE_COALESCE_WINDOW
+            )
+        )
+        current_windows = [
+            str(window)
+            for window in self.config_entry.options.get(
+                CONF_AGGREGATION_WINDOWS, DEFAULT_AGGREGATION_WINDOWS
+            )
+        ]
+        options = self.config_entry.options
         schema = self.add_suggested_values_to_schema(
             vol.Schema(
                 {
@@ -35,9 +87,87 @@ class AbbTerraAcOptionsFlow(config_entries.OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                     ),
+                    vol.Optional(
+                        CONF_IDLE_SCAN_INTERVAL, default=current_idle
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_WRITE_COALESCE_WINDOW, default=current_window
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_WRITE_COALESCE_WINDOW),
+                    ),
+                    vol.Optional(
+                        CONF_AGGREGATION_WINDOWS, default=current_windows
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[str(w) for w in AGGREGATION_WINDOW_CHOICES],
+                            multiple=True,
+                            mode=SelectSelectorMode.LIST,
+                            translation_key=CONF_AGGREGATION_WINDOWS,
+                        )
+                    ),
+                    vol.Optional(CONF_GRID_POWER_ENTITY): EntitySelector(
+                        EntitySelectorConfig(
+                            domain="sensor", device_class=SensorDeviceClass.POWER
+                        )
+                    ),
+                    vol.Optional(CONF_MAIN_FUSE_LIMIT, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_MAIN_FUSE_LIMIT)
+                    ),
+                    vol.Optional(
+                        CONF_GRID_PHASES, default=DEFAULT_GRID_PHASES
+                    ): vol.All(vol.Coerce(int), vol.In([1, 3])),
+                    vol.Optional(CONF_GRID_EXPORT_ENTITY): EntitySelector(
+                        EntitySelectorConfig(
+                            domain="sensor", device_class=SensorDeviceClass.POWER
+                        )
+                    ),
+                    vol.Optional(CONF_FLEET_CURRENT_BUDGET, default=0): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_FLEET_CURRENT_BUDGET),
+                    ),
+                    vol.Optional(
+                        CONF_CHARGING_PRIORITY, default=DEFAULT_CHARGING_PRIORITY
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_CHARGING_PRIORITY)
+                    ),
+                    vol.Optional(
+                        CONF_PIPELINE_DEPTH, default=DEFAULT_PIPELINE_DEPTH
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_PIPELINE_DEPTH)
+                    ),
+                    vol.Optional(
+                        CONF_CONNECTION_IDLE_TIMEOUT,
+                        default=DEFAULT_CONNECTION_IDLE_TIMEOUT,
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_CONNECTION_IDLE_TIMEOUT),
+                    ),
                 }
             ),
-            {CONF_SCAN_INTERVAL: current},
+            {
+                CONF_SCAN_INTERVAL: current,
+                CONF_IDLE_SCAN_INTERVAL: current_idle,
+                CONF_WRITE_COALESCE_WINDOW: current_window,
+                CONF_AGGREGATION_WINDOWS: current_windows,
+                CONF_GRID_POWER_ENTITY: options.get(CONF_GRID_POWER_ENTITY),
+                CONF_MAIN_FUSE_LIMIT: options.get(CONF_MAIN_FUSE_LIMIT, 0),
+                CONF_GRID_PHASES: options.get(CONF_GRID_PHASES, DEFAULT_GRID_PHASES),
+                CONF_GRID_EXPORT_ENTITY: options.get(CONF_GRID_EXPORT_ENTITY),
+                CONF_FLEET_CURRENT_BUDGET: options.get(CONF_FLEET_CURRENT_BUDGET, 0),
+                CONF_CHARGING_PRIORITY: options.get(
+                    CONF_CHARGING_PRIORITY, DEFAULT_CHARGING_PRIORITY
+                ),
+                CONF_PIPELINE_DEPTH: options.get(
+                    CONF_PIPELINE_DEPTH, DEFAULT_PIPELINE_DEPTH
+                ),
+                CONF_CONNECTION_IDLE_TIMEOUT: options.get(
+                    CONF_CONNECTION_IDLE_TIMEOUT, DEFAULT_CONNECTION_IDLE_TIMEOUT
+                ),
+            },
         )
 
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -0,0 +1,263 @@
+"""Solar surplus charging: follow the net grid export with the current limit."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    NOMINAL_VOLTAGE,
+    PV_SURPLUS_FILTER_TIME,
+    PV_SURPLUS_MIN_WRITE_INTERVAL,
+    PV_SURPLUS_START_DELAY,
+    PV_SURPLUS_STOP_DELAY,
+    AbbTerraAcData,
+)
+from .load_balancing import (
+    MIN_CHARGING_CURRENT,
+    async_write_current_limit,
+    power_from_state,
+)
+from .session_state import vehicle_connected_from_socket_lock
+
+if TYPE_CHECKING:
+    from . import AbbTerraAcDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# A phase carrying more than this is counted as used by the vehicle.
+_PHASE_IN_USE_CURRENT = 1.0
+
+
+class SurplusControl:
+    """Turn export samples into current limits without cycling the relay.
+
+    The surplus the charger may use is the net export (negative while the
+    site imports) plus the charger's own draw, smoothed by a first-order low-pass filter. Above 6 A the limit
+    follows it at most once per ``PV_SURPLUS_MIN_WRITE_INTERVAL``. Below 6 A
+    the charger is held at 6 A and only paused (0 A) once the deficit has
+    lasted ``PV_SURPLUS_STOP_DELAY``; a paused charger resumes once enough
+    surplus has lasted ``PV_SURPLUS_START_DELAY``. Timestamps are monotonic
+    seconds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without a filtered value."""
+        self.filtered: float | None = None
+        self._last_sample: float | None = None
+        self._last_write: float | None = None
+        self._above_since: float | None = None
+        self._below_since: float | None = None
+
+    def update(
+        self,
+        now: float,
+        *,
+        export_power: float,
+        charger_power: float,
+        voltage: float,
+        phases: int,
+        ceiling: float,
+        limit: int,
+    ) -> int | None:
+        """Fold one sample; return the limit (A) to write, if it should change."""
+        available = export_power + charger_power
+        if self.filtered is None or self._last_sample is None:
+            self.filtered = available
+        else:
+            alpha = 1 - math.exp(-(now - self._last_sample) / PV_SURPLUS_FILTER_TIME)
+            self.filtered += alpha * (available - self.filtered)
+        self._last_sample = now
+
+        current = math.floor(self.filtered / (phases * (voltage or NOMINAL_VOLTAGE)))
+        current = min(current, math.floor(ceiling))
+        charging = limit >= MIN_CHARGING_CURRENT
+        if current < MIN_CHARGING_CURRENT:
+            self._above_since = None
+            if not charging:
+                return None
+            if self._below_since is None:
+                self._below_since = now
+            if now - self._below_since < PV_SURPLUS_STOP_DELAY:
+                current = MIN_CHARGING_CURRENT
+            else:
+                current = 0
+        else:
+            self._below_since = None
+            if not charging:
+                if self._above_since is None:
+                    self._above_since = now
+                if now - self._above_since < PV_SURPLUS_START_DELAY:
+                    return None
+
+        if current == limit:
+            return None
+        if (
+            self._last_write is not None
+            and now - self._last_write < PV_SURPLUS_MIN_WRITE_INTERVAL
+        ):
+            return None
+        self._last_write = now
+        self._above_since = self._below_since = None
+        return current
+
+
+@dataclass
+class PvSurplusStats:
+    """Counters for diagnostics."""
+
+    samples: int = 0
+    writes: int = 0
+    pauses: int = 0
+    failed_writes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "writes": self.writes,
+            "pauses": self.pauses,
+            "failed_writes": self.failed_writes,
+        }
+
+
+class AbbTerraAcPvSurplus:
+    """Drive the current limit from the grid meter (solar surplus mode).
+
+    Without an import sensor the export sensor must be signed (negative
+    while the site imports); with one, the import is subtracted from the
+    export. Samples are only acted on while a vehicle is plugged in. The charger's
+    phase count is taken from the phases that carried current last, so a
+    single-phase vehicle gets three times the current of a three-phase one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: AbbTerraAcDataUpdateCoordinator,
+        export_entity_id: str,
+        phases: int,
+        import_entity_id: str | None = None,
+    ) -> None:
+        """Initialize the controller; ``async_start`` subscribes to the meter."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.export_entity_id = export_entity_id
+        self.import_entity_id = import_entity_id
+        self.phases = phases
+        self.target: int | None = None
+        self.control = SurplusControl()
+        self._pending = False
+        self._task: asyncio.Task[None] | None = None
+        self.stats = PvSurplusStats()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the meter; return the callback that stops the controller."""
+        entity_ids = [self.export_entity_id]
+        if self.import_entity_id:
+            entity_ids.append(self.import_entity_id)
+        return async_track_state_change_event(
+            self._hass, entity_ids, self._async_meter_changed
+        )
+
+    @callback
+    def _async_meter_changed(self, event: Event[EventStateChangedData]) -> None:
+        if power_from_state(event.data["new_state"]) is None:
+            return
+        self._pending = True
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(),
+                f"{DOMAIN} solar surplus {self._coordinator.entry_id}",
+            )
+
+    async def _async_run(self) -> None:
+        """Evaluate samples until none arrived during the last write."""
+        while self._pending:
+            self._pending = False
+            if (export_power := self._net_export()) is not None:
+                await self._async_evaluate(export_power)
+
+    def _net_export(self) -> float | None:
+        """Export minus import in W, or None while a meter has no reading."""
+        export_power = power_from_state(self._hass.states.get(self.export_entity_id))
+        if export_power is None or not self.import_entity_id:
+            return export_power
+        import_power = power_from_state(self._hass.states.get(self.import_entity_id))
+        if import_power is None:
+            return None
+        return max(export_power, 0) - max(import_power, 0)
+
+    def _vehicle_phases(self, data: AbbTerraAcData) -> int:
+        in_use = sum(
+            float(current) > _PHASE_IN_USE_CURRENT
+            for current in (
+                data["charging_current_l1"],
+                data["charging_current_l2"],
+                data["charging_current_l3"],
+            )
+        )
+        if in_use:
+            self.phases = in_use
+        return self.phases
+
+    async def _async_evaluate(self, export_power: float) -> None:
+        data = self._coordinator.data
+        if not vehicle_connected_from_socket_lock(data["socket_lock_state"]):
+            # Start from a fresh filter with the next vehicle.
+            self.control = SurplusControl()
+            self.target = None
+            return
+        self.stats.samples += 1
+        if self.target is None:
+            self.target = int(data["charging_current_limit_modbus"])
+        current = self.control.update(
+            monotonic(),
+            export_power=export_power,
+            charger_power=float(data["active_power"]),
+            voltage=float(data["voltage_l1"]),
+            phases=self._vehicle_phases(data),
+            ceiling=float(data["user_settable_max_current"]),
+            limit=self.target,
+        )
+        if current is None:
+            return
+        try:
+            await async_write_current_limit(self._coordinator, current)
+        except HomeAssistantError as err:
+            self.stats.failed_writes += 1
+            _LOGGER.warning("Solar surplus mode could not set %sA: %s", current, err)
+            return
+        self.stats.writes += 1
+        if current == 0:
+            self.stats.pauses += 1
+        self.target = current
+        _LOGGER.debug("Solar surplus mode set the current limit to %sA", current)
+
+    def as_dict(self) -> dict[str, Any]:
+        """State and counters for diagnostics."""
+        return {
+            "phases": self.phases,
+            "target": self.target,
+            "filtered_surplus": (
+                round(self.control.filtered, 1)
+                if self.control.filtered is not None
+                else None
+            ),
+            **self.stats.as_dict(),
+        }
@@ -0,0 +1,256 @@
+"""Holding-register layout and decoder of the ABB Terra AC 4000h status block."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+import logging
+import struct
+from typing import Any, Final, cast
+
+from .const import AbbTerraAcData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Base of the status block read by the coordinator (4000h).
+REGISTER_BLOCK_ADDRESS: Final = 16384
+REGISTER_BLOCK_COUNT: Final = 37
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterGroup:
+    """Contiguous slice of the status block polled at its own cadence.
+
+    ``interval`` is the minimum number of seconds between two reads of the
+    group: ``None`` means the group is only read once per connection,
+    ``0`` means it is read on every coordinator tick.
+    """
+
+    name: str
+    offset: int
+    count: int
+    interval: float | None
+
+    @property
+    def end(self) -> int:
+        """Offset just past the last register of the group."""
+        return self.offset + self.count
+
+
+# Serial number (4000h-4003h), firmware version (4004h-4005h) and
+# user-settable max current (4006h-4007h): only change on re-commissioning or
+# a firmware update, both of which reboot the charger and drop the connection.
+REGISTER_GROUP_IDENTITY: Final = RegisterGroup("identity", 0, 8, None)
+
+# Error code, socket lock, charging state, actual limit, phase currents and
+# voltages, active power and session energy (4008h-401Fh).
+REGISTER_GROUP_MEASUREMENT: Final = RegisterGroup("measurement", 8, 24, 0)
+
+# Communication timeout, Modbus current limit and fallback limit (4020h-4024h):
+# only change when written by Home Assistant or after a charger reboot.
+REGISTER_GROUP_CONFIG: Final = RegisterGroup("config", 32, 5, 60)
+
+REGISTER_GROUPS: Final[tuple[RegisterGroup, ...]] = (
+    REGISTER_GROUP_IDENTITY,
+    REGISTER_GROUP_MEASUREMENT,
+    REGISTER_GROUP_CONFIG,
+)
+
+
+def register_span(groups: list[RegisterGroup]) -> tuple[int, int]:
+    """Return ``(offset, count)`` of the smallest read covering ``groups``.
+
+    The groups tile the block without gaps, so covering them with one request
+    never costs more than the registers in between and saves a round trip per
+    extra group.
+    """
+    start = min(group.offset for group in groups)
+    end = max(group.end for group in groups)
+    return start, end - start
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterField:
+    """One value of the status block.
+
+    ``code`` is the big-endian ``struct`` code of the raw value: ``H`` for one
+    16-bit register, ``I`` for a 32-bit value spread over two registers
+    (high word first) and ``B`` for the high byte of one register.
+    ``scale`` converts raw counts to engineering units (``None`` keeps the
+    raw integer) and ``mask`` is applied to the decoded value (only used on
+    unscaled fields).
+    """
+
+    name: str
+    offset: int
+    code: str
+    scale: float | None = None
+    mask: int | None = None
+
+
+# Declarative map of every numeric field (TAC Modbus Communication v1.11,
+# section 5). Serial number and firmware version are decoded separately.
+REGISTER_FIELDS: Final[tuple[RegisterField, ...]] = (
+    RegisterField("user_settable_max_current", 6, "I", 0.001),
+    RegisterField("error_code", 8, "H"),
+    RegisterField("socket_lock_state", 10, "I"),
+    # Per testing the state lives in the high byte of 400Dh (low nibble);
+    # the documented 400Ch always returns 0.
+    RegisterField("charging_state", 13, "B", mask=0x0F),
+    RegisterField("charging_current_limit", 14, "I", 0.001),
+    RegisterField("charging_current_l1", 16, "I", 0.001),
+    RegisterField("charging_current_l2", 18, "I", 0.001),
+    RegisterField("charging_current_l3", 20, "I", 0.001),
+    RegisterField("voltage_l1", 22, "I", 0.1),
+    RegisterField("voltage_l2", 24, "I", 0.1),
+    RegisterField("voltage_l3", 26, "I", 0.1),
+    RegisterField("active_power", 28, "I"),
+    RegisterField("energy_delivered", 30, "I"),
+    RegisterField("communication_timeout", 32, "H"),
+    RegisterField("charging_current_limit_modbus", 34, "I", 0.001),
+    RegisterField("fallback_limit", 36, "H"),
+)
+
+_IDENTITY_WORDS = struct.Struct(">6H")
+
+
+@lru_cache(maxsize=None)
+def field_span(name: str) -> tuple[int, int]:
+    """Return ``(offset, count)`` of the registers holding field ``name``."""
+    for field in REGISTER_FIELDS:
+        if field.name == name:
+            return field.offset, max(1, struct.calcsize(f">{field.code}") // 2)
+    msg = f"unknown register field {name}"
+    raise KeyError(msg)
+
+
+@lru_cache(maxsize=None)
+def fields_in_span(offset: int, count: int) -> tuple[str, ...]:
+    """Names of the fields stored entirely within ``count`` registers at ``offset``."""
+    return tuple(
+        field.name
+        for field in REGISTER_FIELDS
+        if offset <= field.offset
+        and sum(field_span(field.name)) <= offset + count
+    )
+
+
+class RegisterBlockDecoder:
+    """Decode the raw status block with one precompiled ``struct`` unpack."""
+
+    def __init__(self, fields: Sequence[RegisterField]) -> None:
+        """Compile ``fields`` into a single big-endian ``struct.Struct``."""
+        fmt = [">"]
+        position = 0
+        ordered = sorted(fields, key=lambda f: f.offset)
+        for field in ordered:
+            start = field.offset * 2
+            if start < position:
+                msg = f"register field {field.name} overlaps the previous field"
+                raise ValueError(msg)
+            if start > position:
+                fmt.append(f"{start - position}x")
+            fmt.append(field.code)
+            position = start + struct.calcsize(f">{field.code}")
+        self._struct = struct.Struct("".join(fmt))
+        self._names = tuple(field.name for field in ordered)
+        self._masked = tuple(
+            (field.name, field.mask) for field in ordered if field.mask is not None
+        )
+        # Unscaled fields multiply by the int 1 so they stay integers.
+        self._scales = tuple(
+            field.scale if field.scale is not None else 1 for field in ordered
+        )
+
+    def decode(self, raw: bytes | bytearray) -> dict[str, Any]:
+        """Return every field of ``raw`` (the packed block) in engineering units."""
+        decoded: dict[str, Any] = {
+            name: value * scale
+            for name, value, scale in zip(
+                self._names, self._struct.unpack_from(raw), self._scales
+            )
+        }
+        for name, mask in self._masked:
+            decoded[name] &= mask
+        return decoded
+
+
+REGISTER_DECODER: Final = RegisterBlockDecoder(REGISTER_FIELDS)
+
+
+@lru_cache(maxsize=REGISTER_BLOCK_COUNT)
+def _register_words(count: int) -> struct.Struct:
+    """Precompiled packer for ``count`` consecutive 16-bit registers."""
+    return struct.Struct(f">{count}H")
+
+
+def pack_registers_into(
+    raw: bytearray, offset: int, registers: Sequence[int]
+) -> None:
+    """Store ``registers`` read from ``offset`` into the packed block ``raw``."""
+    _register_words(len(registers)).pack_into(raw, offset * 2, *registers)
+
+
+def decode_register_block(
+    raw: bytes | bytearray, serial_number: str | None = None
+) -> AbbTerraAcData:
+    """Decode the packed status block into coordinator data.
+
+    ``serial_number`` short-circuits decoding of the serial when the caller
+    already knows it; the firmware version is memoized on its raw registers.
+    """
+    words = _IDENTITY_WORDS.unpack_from(raw)
+    data = REGISTER_DECODER.decode(raw)
+    if serial_number is None:
+        serial_number = decode_serial_number(*words[:4])
+    data["serial_number"] = serial_number
+    data["firmware_version"] = decode_firmware_version(words[4], words[5])
+    return cast(AbbTerraAcData, data)
+
+
+@lru_cache(maxsize=8)
+def decode_serial_number(reg0: int, reg1: int, reg2: int, reg3: int) -> str:
+    """Decode serial number from registers 4000h-4003h."""
+    try:
+        connector_type = {0x47: "G", 0x50: "P", 0x53: "S", 0x54: "T"}
+        rated_power_map = {0x07: "7", 0x11: "11", 0x22: "22"}
+
+        byte7 = (reg0 >> 8) & 0xFF
+        byte6 = reg0 & 0xFF
+        byte5 = (reg1 >> 8) & 0xFF
+        byte3 = (reg2 >> 8) & 0xFF
+        byte2 = reg2 & 0xFF
+        byte1 = (reg3 >> 8) & 0xFF
+        byte0 = reg3 & 0xFF
+
+        connector = connector_type.get(byte7, f"Unknown (0x{byte7:02X})")
+        rated_power = rated_power_map.get(byte6, str(byte6))
+        plant_id = byte5
+        prod_week = ((byte3 >> 4) & 0xF) * 10 + (byte3 & 0xF)
+        prod_year = ((byte2 >> 4) & 0xF) * 10 + (byte2 & 0xF)
+        serial_num = (
+            ((byte1 >> 4) & 0xF) * 1000 +
+            (byte1 & 0xF) * 100 +
+            ((byte0 >> 4) & 0xF) * 10 +
+            (byte0 & 0xF)
+        )
+
+        return f"TACW{rated_power}-{plant_id}-{prod_week:02d}{prod_year:02d}-{connector}{serial_num:04d}"
+    except Exception as err:
+        _LOGGER.warning("Failed to decode serial number: %s", err)
+        return f"Decode error: {[reg0, reg1, reg2, reg3]}"
+
+
+@lru_cache(maxsize=8)
+def decode_firmware_version(reg0: int, reg1: int) -> str:
+    """Decode firmware version from registers 4004h-4005h."""
+    try:
+        major = (reg0 >> 8) & 0xFF
+        minor = reg0 & 0xFF
+        patch = (reg1 >> 8) & 0xFF
+        patch_bcd = ((patch >> 4) & 0xF) * 10 + (patch & 0xF)
+        return f"v{major}.{minor}.{patch_bcd}"
+    except Exception as err:
+        _LOGGER.warning("Failed to decode firmware version: %s", err)
+        return f"Decode error: {[reg0, reg1]}"
@@ -0,0 +1,162 @@
+"""Domain-level poll scheduler shared by every ABB Terra AC config entry."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import math
+from time import monotonic
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MAX_CONCURRENT_POLLS
+
+
+@dataclass
+class FleetPollStats:
+    """Poll timing counters aggregated over every charger in the fleet."""
+
+    polls: int = 0
+    failed_polls: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics (seconds rounded to ms)."""
+        return {
+            "polls": self.polls,
+            "failed_polls": self.failed_polls,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "last_wait": round(self.last_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "last_duration": round(self.last_duration, 3),
+            "max_duration": round(self.max_duration, 3),
+            "mean_duration": (
+                round(self.total_duration / self.polls, 3) if self.polls else None
+            ),
+        }
+
+
+class AbbTerraAcPollScheduler:
+    """Stagger poll phases across chargers and cap concurrent Modbus polls.
+
+    Each registered entry owns a phase, an even fraction of the poll interval,
+    so N chargers on the same interval poll one after the other instead of in
+    one burst. Poll transactions from all entries share one semaphore.
+    """
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize an empty fleet."""
+        self._entry_ids: list[str] = []
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.stats = FleetPollStats()
+
+    @property
+    def entry_ids(self) -> tuple[str, ...]:
+        """Registered entries in phase order."""
+        return tuple(self._entry_ids)
+
+    @callback
+    def async_register(self, entry_id: str) -> Callable[[], None]:
+        """Add an entry to the fleet; return a callback that removes it."""
+        if entry_id not in self._entry_ids:
+            self._entry_ids.append(entry_id)
+
+        @callback
+        def _async_unregister() -> None:
+            if entry_id in self._entry_ids:
+                self._entry_ids.remove(entry_id)
+
+        return _async_unregister
+
+    def phase(self, entry_id: str) -> float:
+        """Fraction of the poll interval (0..1) at which ``entry_id`` polls."""
+        try:
+            index = self._entry_ids.index(entry_id)
+        except ValueError:
+            return 0.0
+        return index / len(self._entry_ids)
+
+    def next_poll_at(self, entry_id: str, now: float, interval: float) -> float:
+        """Next slot of ``entry_id`` at least half an ``interval`` after ``now``.
+
+        Slots lie on the grid ``k * interval + phase * interval``, so entries
+        sharing an interval stay evenly spread whatever time they started.
+        """
+        offset = self.phase(entry_id) * interval
+        slot = math.floor((now - offset) / interval) + 1
+        next_at = slot * interval + offset
+        # Keep a phase change (entry added or removed) from polling twice in
+        # quick succession.
+        if next_at - now < interval / 2:
+            next_at += interval
+        return next_at
+
+    @asynccontextmanager
+    async def async_poll_transaction(self) -> AsyncIterator[None]:
+        """Hold one of the fleet's poll slots for the duration of a poll."""
+        stats = self.stats
+        queued_at = monotonic()
+        async with self._semaphore:
+            started_at = monotonic()
+            stats.last_wait = started_at - queued_at
+            stats.max_wait = max(stats.max_wait, stats.last_wait)
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            failed = True
+            try:
+                yield
+                failed = False
+            finally:
+                duration = monotonic() - started_at
+                stats.in_flight -= 1
+                stats.polls += 1
+                stats.failed_polls += failed
+                stats.last_duration = duration
+                stats.max_duration = max(stats.max_duration, duration)
+                stats.total_duration += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Fleet layout and poll timing for diagnostics."""
+        return {
+            "chargers": len(self._entry_ids),
+            "max_concurrent_polls": self.max_concurrent,
+            **self.stats.as_dict(),
+        }
+
+
+_DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+
+
+@callback
+def async_join_fleet(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AbbTerraAcPollScheduler:
+    """Register ``entry`` with the domain's poll scheduler until it unloads."""
+    scheduler: AbbTerraAcPollScheduler | None = hass.data.get(_DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[_DATA_POLL_SCHEDULER] = AbbTerraAcPollScheduler()
+    unregister = scheduler.async_register(entry.entry_id)
+
+    @callback
+    def _async_leave_fleet() -> None:
+        unregister()
+        if (
+            not scheduler.entry_ids
+            and hass.data.get(_DATA_POLL_SCHEDULER) is scheduler
+        ):
+            hass.data.pop(_DATA_POLL_SCHEDULER)
+
+    entry.async_on_unload(_async_leave_fleet)
+    return scheduler
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorEntity,
     SensorDeviceClass,
+    SensorExtraStoredData,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -15,21 +19,26 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
 from . import AbbTerraAcDataUpdateCoordinator, AbbTerraAcRuntimeData
+from .aggregation import PHASE_KEYS, WindowStats
 from .const import (
     CHARGING_STATES,
     ERROR_CODES,
+    KEY_LAST_COMMAND,
     LAST_COMMAND_OPTIONS,
     SESSION_STATE_OPTIONS,
     SOCKET_LOCK_STATES,
 )
 from .entity import AbbTerraAcEntity
 from .session_state import SESSION_STATE_ICONS, vehicle_connected_from_socket_lock
+from .sessions import LifetimeEnergy
 
 PARALLEL_UPDATES = 0
 
@@ -54,6 +63,7 @@ async def async_setup_entry(
         AbbTerraAcSocketLockStateSensor(coordinator, entry),
         AbbTerraAcActivePowerSensor(coordinator, entry),
         AbbTerraAcEnergyDeliveredSensor(coordinator, entry),
+        AbbTerraAcLifetimeEnergySensor(coordinator, entry),
         AbbTerraAcCurrentL1Sensor(coordinator, entry),
         AbbTerraAcCurrentL2Sensor(coordinator, entry),
         AbbTerraAcCurrentL3Sensor(coordinator, entry),
@@ -62,6 +72,18 @@ async def async_setup_entry(
         AbbTerraAcVoltageL3Sensor(coordinator, entry),
         AbbTerraAcCurrentLimitSensor(coordinator, entry),
     ]
+    sensors.extend(
+        [
+            AbbTerraAcModbusRoundTripSensor(coordinator, entry),
+            AbbTerraAcModbusCounterSensor(coordinator, entry, "timeouts"),
+            AbbTerraAcModbusCounterSensor(coordinator, entry, "reconnects"),
+        ]
+    )
+    sensors.extend(
+        AbbTerraAcPhaseWindowSensor(coordinator, entry, key, window)
+        for window in coordinator.aggregation_windows
+        for key in PHASE_KEYS
+    )
     async_add_entities(sensors, True)
 
 
@@ -78,6 +100,8 @@ class AbbTerraAcBaseSensor(AbbTerraAcEntity, SensorEntity):
 class AbbTerraAcChargingStateRawSensor(AbbTerraAcBaseSensor):
     """Raw charging state nibble from the ABB register (IEC 61851-1)."""
 
+    _coordinator_keys = frozenset({"charging_state"})
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_translation_key = "charging_state_raw"
 
@@ -95,6 +119,8 @@ class AbbTerraAcChargingStateRawSensor(AbbTerraAcBaseSensor):
 class AbbTerraAcChargingStateSensor(AbbTerraAcBaseSensor):
     """Charging state decoded per IEC 61851-1."""
 
+    _coordinator_keys = frozenset({"charging_state"})
+
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_translation_key = "charging_state"
     _attr_options = list(dict.fromkeys([*CHARGING_STATES.values(), "Unknown"]))
@@ -116,6 +142,18 @@ class AbbTerraAcChargingStateSensor(AbbTerraAcBaseSensor):
 class AbbTerraAcSessionStateSensor(AbbTerraAcBaseSensor):
     """Derived session state (idle, active, paused by current vs command, etc.)."""
 
+    _coordinator_keys = frozenset(
+        {
+            "charging_state",
+            "charging_current_limit_modbus",
+            "charging_current_l1",
+            "charging_current_l2",
+            "charging_current_l3",
+            "socket_lock_state",
+            KEY_LAST_COMMAND,
+        }
+    )
+
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = list(SESSION_STATE_OPTIONS)
     _attr_translation_key = "session_state"
@@ -153,6 +191,8 @@ class AbbTerraAcSessionStateSensor(AbbTerraAcBaseSensor):
 class AbbTerraAcLastCommandSensor(AbbTerraAcBaseSensor):
     """Last start/stop command issued from Home Assistant (not mixed into session state)."""
 
+    _coordinator_keys = frozenset({KEY_LAST_COMMAND})
+
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = list(LAST_COMMAND_OPTIONS)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -171,6 +211,7 @@ class AbbTerraAcLastCommandSensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcSerialNumberSensor(AbbTerraAcBaseSensor):
     """Sensor for serial number."""
+    _coordinator_keys = frozenset({"serial_number"})
     _attr_entity_registry_enabled_default = False
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -188,6 +229,7 @@ class AbbTerraAcSerialNumberSensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcFirmwareSensor(AbbTerraAcBaseSensor):
     """Sensor for firmware version."""
+    _coordinator_keys = frozenset({"firmware_version"})
     _attr_entity_registry_enabled_default = False
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -205,6 +247,7 @@ class AbbTerraAcFirmwareSensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcErrorCodeSensor(AbbTerraAcBaseSensor):
     """Sensor for error code."""
+    _coordinator_keys = frozenset({"error_code"})
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -227,6 +270,7 @@ class AbbTerraAcErrorCodeSensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcSocketLockStateSensor(AbbTerraAcBaseSensor):
     """Sensor for socket lock state."""
+    _coordinator_keys = frozenset({"socket_lock_state"})
     _attr_device_class = SensorDeviceClass.ENUM
 
     def __init__(
@@ -248,6 +292,7 @@ class AbbTerraAcSocketLockStateSensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcActivePowerSensor(AbbTerraAcBaseSensor):
     """Sensor for active power."""
+    _coordinator_keys = frozenset({"active_power"})
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfPower.WATT
@@ -279,6 +324,8 @@ class AbbTerraAcEnergyDeliveredSensor(AbbTerraAcBaseSensor):
       and never sees a negative delta.
     """
 
+    _coordinator_keys = frozenset({"energy_delivered"})
+
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
@@ -322,8 +369,85 @@ class AbbTerraAcEnergyDeliveredSensor(AbbTerraAcBaseSensor):
         return self._last_reset
 
 
+class AbbTerraAcLifetimeEnergyExtraStoredData(SensorExtraStoredData):
+    """Sensor state plus the accumulator that produced it."""
+
+    def __init__(
+        self, sensor_data: SensorExtraStoredData, lifetime: LifetimeEnergy
+    ) -> None:
+        super().__init__(
+            sensor_data.native_value, sensor_data.native_unit_of_measurement
+        )
+        self.lifetime = lifetime
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**super().as_dict(), "lifetime": self.lifetime.as_dict()}
+
+
+class AbbTerraAcLifetimeEnergySensor(AbbTerraAcBaseSensor, RestoreSensor):
+    """Lifetime energy accumulated across sessions (TOTAL_INCREASING).
+
+    Built from the per-session register 401Eh (see
+    ``AbbTerraAcEnergyDeliveredSensor``), so the Energy Dashboard reads one
+    monotonic series. The accumulator is saved with the restore state and
+    picked up again after a restart. Only polled readings are folded in: a
+    warm-start snapshot may be older than the restored accumulator.
+    """
+
+    _coordinator_keys = frozenset({"energy_delivered", "socket_lock_state"})
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.WATT_HOUR
+    _attr_suggested_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_translation_key = "lifetime_energy"
+
+    def __init__(
+        self, coordinator: AbbTerraAcDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{self._entry_id}_lifetime_energy"
+        self._lifetime = LifetimeEnergy()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the accumulator, then fold in the latest poll, if any."""
+        await super().async_added_to_hass()
+        if (last := await self.async_get_last_extra_data()) is not None:
+            restored = last.as_dict().get("lifetime")
+            if isinstance(restored, dict):
+                self._lifetime = LifetimeEnergy.from_dict(restored)
+        self._fold_latest()
+
+    @property
+    def extra_restore_state_data(self) -> AbbTerraAcLifetimeEnergyExtraStoredData:
+        return AbbTerraAcLifetimeEnergyExtraStoredData(
+            super().extra_restore_state_data, self._lifetime
+        )
+
+    def _fold_latest(self) -> None:
+        data = self.coordinator.data
+        if data and self.coordinator.polled:
+            self._lifetime.update(
+                float(data["energy_delivered"]),
+                vehicle_connected_from_socket_lock(data["socket_lock_state"]),
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Fold the new reading before the state is written."""
+        self._fold_latest()
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | None:
+        if self._lifetime.last_register_wh is None:
+            return None
+        return round(self._lifetime.total_wh, 1)
+
+
 class AbbTerraAcCurrentL1Sensor(AbbTerraAcBaseSensor):
     """Sensor for charging current L1."""
+    _coordinator_keys = frozenset({"charging_current_l1"})
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
@@ -343,6 +467,7 @@ class AbbTerraAcCurrentL1Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcCurrentL2Sensor(AbbTerraAcBaseSensor):
     """Sensor for charging current L2."""
+    _coordinator_keys = frozenset({"charging_current_l2"})
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
@@ -362,6 +487,7 @@ class AbbTerraAcCurrentL2Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcCurrentL3Sensor(AbbTerraAcBaseSensor):
     """Sensor for charging current L3."""
+    _coordinator_keys = frozenset({"charging_current_l3"})
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
@@ -381,6 +507,7 @@ class AbbTerraAcCurrentL3Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcVoltageL1Sensor(AbbTerraAcBaseSensor):
     """Sensor for voltage L1."""
+    _coordinator_keys = frozenset({"voltage_l1"})
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
@@ -400,6 +527,7 @@ class AbbTerraAcVoltageL1Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcVoltageL2Sensor(AbbTerraAcBaseSensor):
     """Sensor for voltage L2."""
+    _coordinator_keys = frozenset({"voltage_l2"})
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
@@ -419,6 +547,7 @@ class AbbTerraAcVoltageL2Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcVoltageL3Sensor(AbbTerraAcBaseSensor):
     """Sensor for voltage L3."""
+    _coordinator_keys = frozenset({"voltage_l3"})
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
@@ -438,6 +567,7 @@ class AbbTerraAcVoltageL3Sensor(AbbTerraAcBaseSensor):
 
 class AbbTerraAcCurrentLimitSensor(AbbTerraAcBaseSensor):
     """Sensor for actual current limit chosen by the charger."""
+    _coordinator_keys = frozenset({"charging_current_limit"})
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
@@ -453,3 +583,124 @@ class AbbTerraAcCurrentLimitSensor(AbbTerraAcBaseSensor):
     @property
     def native_value(self) -> float | None:
         return self.coordinator.data.get("charging_current_limit")
+
+
+class AbbTerraAcPhaseWindowSensor(AbbTerraAcBaseSensor):
+    """Mean of one phase voltage or current over a trailing window.
+
+    Min, max and standard deviation are attributes. The state is written
+    once per window from the coordinator's in-memory aggregator, never on a
+    poll, so raw per-poll values need not be recorded to keep the insight.
+    """
+
+    # Only availability changes write state between window ends.
+    _coordinator_keys: frozenset[str] | None = frozenset()
+
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: AbbTerraAcDataUpdateCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        window: int,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._key = key
+        self._window = timedelta(minutes=window)
+        self._stats: WindowStats | None = None
+        name = key.removeprefix("charging_")
+        self._attr_translation_key = f"{name}_window"
+        self._attr_translation_placeholders = {"window": str(window)}
+        self._attr_unique_id = f"{self._entry_id}_{name}_{window}m"
+        if key.startswith("voltage"):
+            self._attr_device_class = SensorDeviceClass.VOLTAGE
+            self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+        else:
+            self._attr_device_class = SensorDeviceClass.CURRENT
+            self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+
+    async def async_added_to_hass(self) -> None:
+        """Publish at the end of every window."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_publish, self._window)
+        )
+
+    @callback
+    def _async_publish(self, _now: datetime) -> None:
+        self._stats = self.coordinator.phase_aggregator.stats(
+            self._key, self._window.total_seconds(), monotonic()
+        )
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        return round(self._stats.mean, 2) if self._stats else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return self._stats.as_dict() if self._stats else None
+
+
+class AbbTerraAcModbusRoundTripSensor(AbbTerraAcBaseSensor):
+    """Round trip of this charger's last register poll, with mean and max.
+
+    Taken from the coordinator's own poll statistics, so chargers sharing a
+    gateway each report their polls, without keepalive reads or read-backs.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self, coordinator: AbbTerraAcDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_translation_key = "modbus_round_trip"
+        self._attr_unique_id = f"{self._entry_id}_modbus_round_trip"
+
+    @property
+    def native_value(self) -> float | None:
+        polls = self.coordinator.poll_stats.round_trip
+        return round(polls.last * 1000, 1) if polls.count else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        polls = self.coordinator.poll_stats.round_trip
+        if polls.mean is None:
+            return None
+        return {
+            "mean": round(polls.mean * 1000, 1),
+            "max": round(polls.max * 1000, 1),
+            "count": polls.count,
+        }
+
+
+class AbbTerraAcModbusCounterSensor(AbbTerraAcBaseSensor):
+    """Timeouts or reconnects of this charger's register polls since startup."""
+
+    _attr_entity_registry_enabled_default = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(
+        self,
+        coordinator: AbbTerraAcDataUpdateCoordinator,
+        entry: ConfigEntry,
+        counter: str,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._counter = counter
+        self._attr_translation_key = f"modbus_{counter}"
+        self._attr_unique_id = f"{self._entry_id}_modbus_{counter}"
+
+    @property
+    def native_value(self) -> int:
+        return int(getattr(self.coordinator.poll_stats, self._counter))
@@ -0,0 +1,260 @@
+"""Charging sessions: recorder, lifetime energy and an append-only history."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, AbbTerraAcData
+from .session_state import SessionState
+
+_LOGGER = logging.getLogger(__name__)
+
+# Same rule as the energy sensor: a drop of more than 100 Wh is a new session.
+_ENERGY_RESET_THRESHOLD_WH = 100.0
+# Pause periods kept per record; longer sessions only add to paused_seconds.
+_MAX_PAUSES = 20
+
+_PAUSED_STATES = frozenset(
+    {SessionState.PAUSED_BY_CURRENT, SessionState.PAUSED_BY_COMMAND}
+)
+
+
+@dataclass
+class SessionRecord:
+    """One charging session, built incrementally from coordinator updates."""
+
+    start: datetime
+    end: datetime | None = None
+    energy_wh: float = 0.0
+    peak_power_w: float = 0.0
+    max_current_a: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    pauses: list[tuple[datetime, datetime]] = field(default_factory=list)
+    paused_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Readable form for diagnostics and callers of the query API."""
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "energy_wh": self.energy_wh,
+            "peak_power_w": self.peak_power_w,
+            "max_current_a": list(self.max_current_a),
+            "pauses": [[s.isoformat(), e.isoformat()] for s, e in self.pauses],
+            "paused_seconds": self.paused_seconds,
+        }
+
+    def to_line(self) -> str:
+        """Compact one-line JSON form used in the session log."""
+        return json.dumps(
+            {
+                "s": int(self.start.timestamp()),
+                "e": int(self.end.timestamp()) if self.end else None,
+                "wh": round(self.energy_wh, 1),
+                "pw": round(self.peak_power_w, 1),
+                "a": [round(a, 2) for a in self.max_current_a],
+                "p": [[int(s.timestamp()), int(e.timestamp())] for s, e in self.pauses],
+                "ps": round(self.paused_seconds),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> SessionRecord:
+        """Parse a line written by ``to_line``."""
+        raw = json.loads(line)
+        return cls(
+            start=dt_util.utc_from_timestamp(raw["s"]),
+            end=dt_util.utc_from_timestamp(raw["e"]) if raw["e"] is not None else None,
+            energy_wh=float(raw["wh"]),
+            peak_power_w=float(raw["pw"]),
+            max_current_a=[float(a) for a in raw["a"]],
+            pauses=[
+                (dt_util.utc_from_timestamp(s), dt_util.utc_from_timestamp(e))
+                for s, e in raw["p"]
+            ],
+            paused_seconds=float(raw["ps"]),
+        )
+
+
+class SessionRecorder:
+    """Track the session in progress and emit a record when it ends.
+
+    A session opens on the first poll that shows the vehicle charging and
+    closes when the cable is unplugged, the charger returns to idle, or the
+    session energy register resets. Energy is integrated from positive deltas
+    of that register, so small read glitches never count twice.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without a session in progress."""
+        self.current: SessionRecord | None = None
+        self._last_energy = 0.0
+        self._pause_started: datetime | None = None
+
+    def update(
+        self, now: datetime, data: AbbTerraAcData, state: SessionState
+    ) -> list[SessionRecord]:
+        """Fold one poll into the session; return the sessions it completed."""
+        completed: list[SessionRecord] = []
+        energy = float(data["energy_delivered"])
+
+        if self.current is not None and (
+            data["socket_lock_state"] == 0
+            or state is SessionState.IDLE
+            or self._last_energy - energy > _ENERGY_RESET_THRESHOLD_WH
+        ):
+            completed.append(self._close(self.current, now))
+
+        if self.current is None:
+            if state is not SessionState.ACTIVE or data["socket_lock_state"] == 0:
+                return completed
+            self.current = SessionRecord(start=now)
+            self._last_energy = 0.0
+
+        session = self.current
+        if energy > self._last_energy:
+            session.energy_wh += energy - self._last_energy
+            self._last_energy = energy
+        session.peak_power_w = max(session.peak_power_w, float(data["active_power"]))
+        currents = (
+            data["charging_current_l1"],
+            data["charging_current_l2"],
+            data["charging_current_l3"],
+        )
+        session.max_current_a = [
+            max(peak, float(current))
+            for peak, current in zip(session.max_current_a, currents, strict=True)
+        ]
+
+        if state in _PAUSED_STATES:
+            if self._pause_started is None:
+                self._pause_started = now
+        else:
+            self._end_pause(session, now)
+        return completed
+
+    def _end_pause(self, session: SessionRecord, now: datetime) -> None:
+        """Close the open pause period of ``session``, if any."""
+        if self._pause_started is None:
+            return
+        session.paused_seconds += (now - self._pause_started).total_seconds()
+        if len(session.pauses) < _MAX_PAUSES:
+            session.pauses.append((self._pause_started, now))
+        self._pause_started = None
+
+    def _close(self, session: SessionRecord, now: datetime) -> SessionRecord:
+        """End ``session`` at ``now`` and return its record."""
+        self._end_pause(session, now)
+        self.current = None
+        session.end = now
+        return session
+
+
+@dataclass
+class LifetimeEnergy:
+    """Monotonic energy total folded from the per-session energy register.
+
+    Increases of the register are added as they come. A drop means a new
+    session started (the register restarted from 0), so the new value is
+    added in full; a drop of up to 100 Wh is only taken as a new session when
+    one may have started (cable unplugged, or first reading after a restart),
+    otherwise it is a read glitch and is ignored.
+    """
+
+    total_wh: float = 0.0
+    last_register_wh: float | None = None
+    session_may_have_ended: bool = False
+
+    def update(self, register_wh: float, plugged: bool) -> float:
+        """Fold one reading into the total and return it."""
+        last = self.last_register_wh
+        if last is None:
+            # Fresh start: count from the current reading on.
+            self.last_register_wh = register_wh
+        elif register_wh >= last:
+            self.total_wh += register_wh - last
+            self.last_register_wh = register_wh
+            if register_wh > last and plugged:
+                self.session_may_have_ended = False
+        elif (
+            self.session_may_have_ended
+            or last - register_wh > _ENERGY_RESET_THRESHOLD_WH
+        ):
+            self.total_wh += register_wh
+            self.last_register_wh = register_wh
+            self.session_may_have_ended = False
+        if not plugged:
+            self.session_may_have_ended = True
+        return self.total_wh
+
+    def as_dict(self) -> dict[str, Any]:
+        """State to restore after a restart."""
+        return {"total_wh": self.total_wh, "last_register_wh": self.last_register_wh}
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> LifetimeEnergy:
+        """Rebuild from ``as_dict``; any drop on the next reading is a new session."""
+        last = restored.get("last_register_wh")
+        return cls(
+            total_wh=float(restored.get("total_wh", 0.0)),
+            last_register_wh=float(last) if last is not None else None,
+            session_may_have_ended=True,
+        )
+
+
+class SessionLog:
+    """Append-only JSON-lines file of completed sessions for one charger."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the log under Home Assistant's storage directory."""
+        self._hass = hass
+        self.path = Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.sessions"))
+        # Serializes appends and reads so a query sees every finished write.
+        self._lock = asyncio.Lock()
+
+    async def async_append(self, records: list[SessionRecord]) -> None:
+        """Append ``records`` to the log."""
+        lines = "".join(f"{record.to_line()}\n" for record in records)
+        async with self._lock:
+            await self._hass.async_add_executor_job(self._append, lines)
+
+    async def async_get_sessions(self, count: int) -> list[SessionRecord]:
+        """Return the last ``count`` sessions, oldest first."""
+        async with self._lock:
+            lines = await self._hass.async_add_executor_job(self._tail, count)
+        records = []
+        for line in lines:
+            try:
+                records.append(SessionRecord.from_line(line))
+            except (ValueError, KeyError, TypeError):
+                _LOGGER.warning("Skipping unreadable session record in %s", self.path)
+        return records
+
+    async def async_remove(self) -> None:
+        """Delete the log when the config entry is removed."""
+        async with self._lock:
+            await self._hass.async_add_executor_job(self.path.unlink, True)
+
+    def _append(self, lines: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(lines)
+
+    def _tail(self, count: int) -> list[str]:
+        # Stream the file so memory stays bounded by ``count`` lines.
+        try:
+            with self.path.open(encoding="utf-8") as file:
+                return list(deque((line for line in file if line.strip()), count))
+        except FileNotFoundError:
+            return []
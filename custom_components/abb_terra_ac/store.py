@@ -0,0 +1,55 @@
+"""Persistent per-entry state: warm-start snapshot and last valid limits."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LIMITS_SAVE_DELAY, SNAPSHOT_SAVE_DELAY
+
+STORAGE_VERSION = 1
+
+
+class AbbTerraAcStore:
+    """Last decoded data, identity and valid limits of one charger on disk.
+
+    The snapshot changes on nearly every poll and is only needed for a warm
+    start, so it is saved lazily. The last valid limits drive the firmware
+    auto-fix and change rarely; they live in their own small file that is
+    written shortly after a change and never on an unchanged poll.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the stores for ``entry_id``."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._limits_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.limits"
+        )
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the saved snapshot, if any."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, snapshot: Callable[[], dict[str, Any]]) -> None:
+        """Save ``snapshot()`` after the write-behind delay (or at shutdown)."""
+        self._store.async_delay_save(snapshot, SNAPSHOT_SAVE_DELAY)
+
+    async def async_load_limits(self) -> dict[str, Any] | None:
+        """Return the saved last valid limits, if any."""
+        return await self._limits_store.async_load()
+
+    @callback
+    def async_schedule_save_limits(self, limits: Callable[[], dict[str, Any]]) -> None:
+        """Save ``limits()`` after the short limits write-behind delay."""
+        self._limits_store.async_delay_save(limits, LIMITS_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete both files when the config entry is removed."""
+        await self._store.async_remove()
+        await self._limits_store.async_remove()
@@ -11,10 +11,14 @@ from pymodbus.client import AsyncModbusTcpClient
 
 from . import AbbTerraAcDataUpdateCoordinator, AbbTerraAcRuntimeData
 from .entity import AbbTerraAcEntity
-from .modbus_write import async_write_register
+from .modbus_write import async_write_and_read_back
+from .registers import field_span
 
 PARALLEL_UPDATES = 0
 
+REG_LOCK = 16643
+_READBACK_SOCKET_LOCK = field_span("socket_lock_state")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -48,6 +52,8 @@ class AbbTerraAcBaseSwitch(AbbTerraAcEntity, SwitchEntity):
 class AbbTerraAcLockSwitch(AbbTerraAcBaseSwitch):
     """Switch for locking/unlocking the cable."""
 
+    _coordinator_keys = frozenset({"socket_lock_state"})
+
     def __init__(
         self,
         coordinator: AbbTerraAcDataUpdateCoordinator,
@@ -73,20 +79,22 @@ class AbbTerraAcLockSwitch(AbbTerraAcBaseSwitch):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Lock cable (register 4103h, value 1)."""
-        await async_write_register(
-            self.client,
-            16643,
-            1,
-            lock=self.coordinator.modbus_lock,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_write_lock(1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unlock cable (register 4103h, value 0)."""
-        await async_write_register(
+        await self._async_write_lock(0)
+
+    async def _async_write_lock(self, value: int) -> None:
+        """Write the lock register and publish the read-back lock state."""
+        registers = await async_write_and_read_back(
             self.client,
-            16643,
-            0,
+            REG_LOCK,
+            [value],
+            _READBACK_SOCKET_LOCK,
             lock=self.coordinator.modbus_lock,
+            unit_id=self.coordinator.unit_id,
+        )
+        await self.coordinator.async_apply_readback(
+            _READBACK_SOCKET_LOCK[0], registers
         )
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,153 @@
+"""Timing/allocation harness and stored baselines for the benchmark suite.
+
+Every benchmark runs a warmup, a timed pass recording per-iteration latency
+and a separate ``tracemalloc`` pass (tracing slows the timed loop down, so the
+two are never mixed). Results are compared against ``baselines.json``; set
+``ABB_TERRA_AC_BENCHMARK_UPDATE=1`` to record new baselines instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+from statistics import fmean, quantiles
+from time import perf_counter_ns
+import tracemalloc
+from typing import Final
+
+BASELINES_PATH: Final = Path(__file__).with_name("baselines.json")
+
+# A benchmark regresses when its median exceeds the baseline by this factor;
+# generous because baselines are recorded on a different machine than CI.
+REGRESSION_TOLERANCE: Final = float(
+    os.environ.get("ABB_TERRA_AC_BENCHMARK_TOLERANCE", "1.5")
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Latency percentiles (microseconds) and allocations of one benchmark."""
+
+    name: str
+    iterations: int
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    peak_kib: float
+    retained_bytes_per_iter: float
+
+    def report(self) -> str:
+        """One-line human-readable summary."""
+        return (
+            f"{self.name}: p50 {self.p50_us:.1f} us, p90 {self.p90_us:.1f} us, "
+            f"p99 {self.p99_us:.1f} us, mean {self.mean_us:.1f} us "
+            f"({self.iterations} iterations); peak {self.peak_kib:.1f} KiB, "
+            f"retained {self.retained_bytes_per_iter:.1f} B/iter"
+        )
+
+
+def _result(
+    name: str, samples_ns: list[int], peak: int, retained: int, iterations: int
+) -> BenchmarkResult:
+    cuts = quantiles(samples_ns, n=100, method="inclusive")
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples_ns),
+        mean_us=fmean(samples_ns) / 1000,
+        p50_us=cuts[49] / 1000,
+        p90_us=cuts[89] / 1000,
+        p99_us=cuts[98] / 1000,
+        peak_kib=peak / 1024,
+        retained_bytes_per_iter=retained / iterations,
+    )
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    iterations: int = 2000,
+    warmup: int = 200,
+) -> BenchmarkResult:
+    """Benchmark a synchronous callable."""
+    for _ in range(warmup):
+        func()
+    samples: list[int] = []
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        func()
+        samples.append(perf_counter_ns() - start)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(iterations):
+            func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return _result(name, samples, peak - before, after - before, iterations)
+
+
+async def async_measure(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    *,
+    iterations: int = 500,
+    warmup: int = 50,
+) -> BenchmarkResult:
+    """Benchmark a coroutine function; each iteration awaits one call."""
+    for _ in range(warmup):
+        await func()
+    samples: list[int] = []
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        await func()
+        samples.append(perf_counter_ns() - start)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(iterations):
+            await func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return _result(name, samples, peak - before, after - before, iterations)
+
+
+def _load_baselines() -> dict[str, dict[str, float]]:
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+
+
+def check_baseline(result: BenchmarkResult) -> None:
+    """Print ``result`` and fail on a median regression against its baseline.
+
+    With ``ABB_TERRA_AC_BENCHMARK_UPDATE=1`` the result is stored as the new
+    baseline instead; benchmarks without a baseline only report.
+    """
+    print(f"\n{result.report()}")
+    baselines = _load_baselines()
+    if os.environ.get("ABB_TERRA_AC_BENCHMARK_UPDATE"):
+        entry = asdict(result)
+        del entry["name"]
+        baselines[result.name] = {key: round(value, 3) for key, value in entry.items()}
+        BASELINES_PATH.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return
+    baseline = baselines.get(result.name)
+    if baseline is None:
+        return
+    limit = baseline["p50_us"] * REGRESSION_TOLERANCE
+    assert result.p50_us <= limit, (
+        f"{result.name} regressed: p50 {result.p50_us:.1f} us > "
+        f"{limit:.1f} us (baseline {baseline['p50_us']:.1f} us "
+        f"x {REGRESSION_TOLERANCE})"
+    )
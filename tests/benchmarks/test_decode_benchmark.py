@@ -0,0 +1,150 @@
+"""Decode path: struct-based decoder vs the former per-field decoder."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+
+import pytest
+
+from custom_components.abb_terra_ac.registers import (
+    REGISTER_BLOCK_COUNT,
+    decode_register_block,
+    pack_registers_into,
+)
+
+from tests.benchmarks.harness import check_baseline, measure
+from tests.helpers.modbus import make_holding_registers_37
+
+def _decode_32bit_value(regs: list[int], resolution: float = 1) -> float:
+    value = (regs[0] << 16) | regs[1]
+    return value * resolution
+
+
+def _decode_firmware_version(regs: list[int]) -> str:
+    major = (regs[0] >> 8) & 0xFF
+    minor = regs[0] & 0xFF
+    patch = (regs[1] >> 8) & 0xFF
+    patch_bcd = ((patch >> 4) & 0xF) * 10 + (patch & 0xF)
+    return f"v{major}.{minor}.{patch_bcd}"
+
+
+def _legacy_decode(registers: list[int], serial_number: str) -> dict:
+    """Decoder as it ran in the coordinator before the register map existed."""
+    data = {
+        "serial_number": "",
+        "firmware_version": "",
+        "user_settable_max_current": 0.0,
+        "error_code": 0,
+        "socket_lock_state": 0,
+        "charging_state": 0,
+        "charging_current_limit": 0.0,
+        "charging_current_l1": 0.0,
+        "charging_current_l2": 0.0,
+        "charging_current_l3": 0.0,
+        "voltage_l1": 0.0,
+        "voltage_l2": 0.0,
+        "voltage_l3": 0.0,
+        "active_power": 0.0,
+        "energy_delivered": 0.0,
+        "communication_timeout": 0,
+        "charging_current_limit_modbus": 0.0,
+        "fallback_limit": 0,
+    }
+    data["serial_number"] = serial_number
+    data["firmware_version"] = _decode_firmware_version(registers[4:6])
+    data["user_settable_max_current"] = _decode_32bit_value(registers[6:8], 0.001)
+    data["error_code"] = registers[8]
+    data["socket_lock_state"] = int(_decode_32bit_value(registers[10:12]))
+    data["charging_state"] = ((registers[13] >> 8) & 0xFF) & 0x0F
+    data["charging_current_limit"] = _decode_32bit_value(registers[14:16], 0.001)
+    data["charging_current_l1"] = _decode_32bit_value(registers[16:18], 0.001)
+    data["charging_current_l2"] = _decode_32bit_value(registers[18:20], 0.001)
+    data["charging_current_l3"] = _decode_32bit_value(registers[20:22], 0.001)
+    data["voltage_l1"] = _decode_32bit_value(registers[22:24], 0.1)
+    data["voltage_l2"] = _decode_32bit_value(registers[24:26], 0.1)
+    data["voltage_l3"] = _decode_32bit_value(registers[26:28], 0.1)
+    data["active_power"] = _decode_32bit_value(registers[28:30])
+    data["energy_delivered"] = _decode_32bit_value(registers[30:32])
+    data["communication_timeout"] = registers[32]
+    data["charging_current_limit_modbus"] = _decode_32bit_value(registers[34:36], 0.001)
+    data["fallback_limit"] = registers[36]
+    return data
+
+
+def _charging_registers() -> list[int]:
+    registers = make_holding_registers_37(
+        charging_state_nibble=4,
+        socket_lock_raw_32=273,
+        user_max_amps=32.0,
+        charging_current_limit_amps=16.0,
+        charging_l1_amps=15.8,
+        charging_current_modbus_amps=16.0,
+        fallback_limit=6,
+        voltage_l1=231.2,
+        active_power_wh=10900,
+        energy_wh=5230,
+    )
+    registers[4:6] = [0x0102, 0x0300]
+    return registers
+
+
+def _calls_per_poll(func: Callable[[], object]) -> int:
+    """Count the Python and builtin calls one invocation of ``func`` makes."""
+    calls = 0
+
+    def _profile(frame, event, arg) -> None:
+        nonlocal calls
+        if event in ("call", "c_call"):
+            calls += 1
+
+    sys.setprofile(_profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def test_struct_decoder_replaces_legacy_decoder() -> None:
+    """Decode one measurement-group poll both ways and compare the work done."""
+    registers = _charging_registers()
+    raw = bytearray(REGISTER_BLOCK_COUNT * 2)
+    pack_registers_into(raw, 0, registers)
+    serial = "TACW22-1-0124-T0001"
+
+    assert decode_register_block(raw, serial) == pytest.approx(
+        _legacy_decode(registers, serial)
+    )
+
+    def _legacy_poll() -> None:
+        _legacy_decode(registers, serial)
+
+    def _struct_poll() -> None:
+        pack_registers_into(raw, 8, registers[8:32])
+        decode_register_block(raw, serial)
+
+    assert _calls_per_poll(_struct_poll) < _calls_per_poll(_legacy_poll)
+    check_baseline(measure("decode_legacy_poll", _legacy_poll, iterations=20_000))
+
+
+def test_decode_path_benchmark() -> None:
+    """Latency and allocations of packing and decoding one steady-state poll."""
+    registers = _charging_registers()
+    raw = bytearray(REGISTER_BLOCK_COUNT * 2)
+    pack_registers_into(raw, 0, registers)
+    measurement = registers[8:32]
+    serial = "TACW22-1-0124-T0001"
+
+    def _poll() -> None:
+        pack_registers_into(raw, 8, measurement)
+        decode_register_block(raw, serial)
+
+    check_baseline(measure("decode_measurement_poll", _poll, iterations=20_000))
+    check_baseline(
+        measure(
+            "decode_full_block",
+            lambda: decode_register_block(raw),
+            iterations=20_000,
+        )
+    )
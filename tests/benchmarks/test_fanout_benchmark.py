@@ -0,0 +1,61 @@
+"""Cost of dispatching one coordinator update to every platform entity."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from tests.benchmarks.harness import check_baseline, measure
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client, make_holding_registers_37
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+
+
+async def test_entity_fanout_benchmark(hass: HomeAssistant) -> None:
+    """Dispatch updates where every key changed vs only the active power."""
+    registers = make_holding_registers_37(
+        charging_state_nibble=4,
+        socket_lock_raw_32=273,
+        user_max_amps=32.0,
+        charging_current_limit_amps=16.0,
+        charging_l1_amps=15.8,
+        charging_current_modbus_amps=16.0,
+        fallback_limit=6,
+        voltage_l1=231.2,
+        active_power_wh=10900,
+        energy_wh=5230,
+    )
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    mock_client = create_mock_modbus_client(registers=registers)
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    base = dict(coordinator.data)
+    alternate = {
+        key: value + 1 if isinstance(value, (int, float)) else f"{value}-x"
+        for key, value in base.items()
+    }
+    power_only = dict(base, active_power=base["active_power"] + 1)
+
+    def _dispatch(first: dict, second: dict):
+        toggle = [first, second]
+
+        def _run() -> None:
+            toggle.reverse()
+            coordinator.async_set_updated_data(dict(toggle[0]))
+
+        return _run
+
+    check_baseline(measure("fanout_all_keys_changed", _dispatch(base, alternate)))
+    check_baseline(measure("fanout_power_changed", _dispatch(base, power_only)))
+    check_baseline(measure("fanout_nothing_changed", _dispatch(base, base)))
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
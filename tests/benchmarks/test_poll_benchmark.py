@@ -0,0 +1,46 @@
+"""Coordinator poll cycle end to end against the local Modbus TCP simulator."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac.const import DOMAIN
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from tests.benchmarks.harness import async_measure, check_baseline
+from tests.const import MOCK_ENTRY_OPTIONS
+from tests.helpers.simulator import HOST, PROFILE_CHARGING, TerraAcSimulator
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+async def test_poll_cycle_benchmark(hass: HomeAssistant) -> None:
+    """Latency and allocations of ``_async_update_data`` over localhost TCP."""
+    async with TerraAcSimulator() as sim:
+        sim.play(PROFILE_CHARGING)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            data={CONF_HOST: HOST, CONF_PORT: sim.port},
+            options=MOCK_ENTRY_OPTIONS.copy(),
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data.coordinator
+
+        # Steady state: only the measurement group is due.
+        check_baseline(
+            await async_measure("poll_measurement_group", coordinator._async_update_data)
+        )
+
+        async def _full_poll() -> None:
+            coordinator.invalidate_register_groups()
+            await coordinator._async_update_data()
+
+        check_baseline(await async_measure("poll_full_block", _full_poll))
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -1,7 +1,11 @@
 """Shared Modbus TCP mocks for ABB Terra AC tests."""
 
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+REGISTER_BLOCK_ADDRESS = 16384
+
 
 def make_holding_registers_37(
     *,
@@ -41,6 +45,36 @@ def make_holding_registers_37(
     return r
 
 
+def _sliced_read_result(
+    registers: list[int], address: int, count: int, *, error: bool = False
+) -> MagicMock:
+    """Build a read result holding ``count`` registers from ``address`` of the 4000h block."""
+    start = address - REGISTER_BLOCK_ADDRESS
+    result = MagicMock()
+    result.isError.return_value = error
+    result.registers = list(registers[start:start + count])
+    return result
+
+
+def sliced_read_side_effect(
+    *responses: list[int] | BaseException,
+) -> Callable[..., Awaitable[MagicMock]]:
+    """Serve successive 37-register banks (or raise exceptions), sliced per request.
+
+    Use as ``read_holding_registers.side_effect`` so partial register-group
+    reads receive the registers they actually asked for.
+    """
+    queue = list(responses)
+
+    async def _read(*, address: int, count: int, **kwargs: Any) -> MagicMock:
+        response = queue.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return _sliced_read_result(response, address, count)
+
+    return _read
+
+
 def create_mock_modbus_client(
     *,
     connect: bool = True,
@@ -49,8 +83,11 @@ def create_mock_modbus_client(
 ) -> MagicMock:
     """Return a stand-in for pymodbus AsyncModbusTcpClient.
 
-    The coordinator reads 37 holding registers; config flow probes with count=1.
-    A fixed length-37 register list satisfies both call sites.
+    Reads are served from a length-37 register list (base 4000h) sliced by the
+    requested ``address``/``count``, so both the coordinator's register-group
+    reads and the config flow's count=1 probe see the right registers.
+    Replacing ``read_holding_registers.return_value.registers`` changes the
+    registers served by later reads.
     """
     client = MagicMock()
     client.connected = False
@@ -70,7 +107,15 @@ def create_mock_modbus_client(
     read_result = MagicMock()
     read_result.isError.return_value = read_error
     read_result.registers = regs
-    client.read_holding_registers = AsyncMock(return_value=read_result)
+
+    async def _read(*, address: int, count: int, **kwargs: Any) -> MagicMock:
+        return _sliced_read_result(
+            read_result.registers, address, count, error=read_error
+        )
+
+    client.read_holding_registers = AsyncMock(
+        return_value=read_result, side_effect=_read
+    )
 
     write_result = MagicMock()
     write_result.isError.return_value = False
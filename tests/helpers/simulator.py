@@ -0,0 +1,387 @@
+"""Local Modbus TCP server emulating an ABB Terra AC charger.
+
+Unlike :func:`tests.helpers.modbus.create_mock_modbus_client`, the simulator
+speaks real Modbus TCP over a localhost socket, so latency, reconnects and
+lock contention of the integration can be exercised and measured end to end.
+
+It serves the 4000h status block (function code 3) and the 4100h control
+registers (function codes 6 and 16), plays scriptable session profiles and
+can inject latency, dropped requests and the firmware bugs that reset the
+fallback limit to 256 and the Modbus current limit to 32 A after a reboot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import random
+import struct
+from typing import Final
+
+HOST: Final = "127.0.0.1"
+
+REGISTER_BLOCK_ADDRESS: Final = 0x4000
+REGISTER_BLOCK_COUNT: Final = 37
+
+# Control registers (TAC Modbus Communication v1.11, section 6).
+REG_CURRENT_LIMIT: Final = 0x4100  # 32-bit, mA
+REG_LOCK: Final = 0x4103  # 1 = lock, 0 = unlock
+REG_START_STOP: Final = 0x4105  # 0 = start, 1 = stop
+REG_FALLBACK_LIMIT: Final = 0x4109  # A
+
+FC_READ_HOLDING_REGISTERS: Final = 3
+FC_WRITE_REGISTER: Final = 6
+FC_WRITE_REGISTERS: Final = 16
+
+EXC_ILLEGAL_FUNCTION: Final = 1
+EXC_ILLEGAL_ADDRESS: Final = 2
+EXC_ILLEGAL_VALUE: Final = 3
+
+# Values the firmware falls back to after an unexpected reboot.
+FIRMWARE_RESET_FALLBACK_LIMIT: Final = 256
+FIRMWARE_RESET_CURRENT_LIMIT_MA: Final = 32_000
+
+_MBAP = struct.Struct(">HHHB")
+
+# Socket lock bits of 400Ah-400Bh.
+_LOCK_CABLE: Final = 0x001
+_LOCK_LOCKED: Final = 0x010
+_LOCK_EV: Final = 0x100
+
+
+@dataclass(frozen=True, slots=True)
+class SessionStep:
+    """One phase of a session profile.
+
+    On entering the step the simulator switches to ``charging_state`` and
+    ``socket_lock_state`` and the EV draws up to ``ev_current`` amps while
+    charging; control writes may change the state until the next step.
+    """
+
+    duration: float
+    charging_state: int
+    socket_lock_state: int
+    ev_current: float = 16.0
+
+
+# Nothing plugged in.
+PROFILE_IDLE: Final[tuple[SessionStep, ...]] = (SessionStep(0.0, 0, 0),)
+
+# Plug in, wait for authorization, charge, complete and unplug.
+PROFILE_FULL_SESSION: Final[tuple[SessionStep, ...]] = (
+    SessionStep(1.0, 0, 0),
+    SessionStep(1.0, 1, 273),
+    SessionStep(5.0, 4, 273),
+    SessionStep(1.0, 2, 273),
+    SessionStep(0.0, 0, 0),
+)
+
+# Vehicle charging for as long as the simulator runs.
+PROFILE_CHARGING: Final[tuple[SessionStep, ...]] = (SessionStep(0.0, 4, 273),)
+
+
+@dataclass(slots=True)
+class ChargerState:
+    """Mutable charger state backing the register block."""
+
+    serial_registers: tuple[int, int, int, int] = (0x5422, 0x2A00, 0x1224, 0x3456)
+    firmware_registers: tuple[int, int] = (0x0106, 0x0500)
+    user_max_current: float = 16.0
+    error_code: int = 0
+    socket_lock_state: int = 0
+    charging_state: int = 0
+    ev_current: float = 16.0
+    phases: int = 3
+    voltage: float = 230.0
+    communication_timeout: int = 60
+    current_limit_ma: int = 16_000
+    fallback_limit: int = 6
+    energy_wh: float = 0.0
+
+    @property
+    def actual_limit(self) -> float:
+        """Limit the charger applies: Modbus limit capped by the user maximum."""
+        return min(self.current_limit_ma / 1000, self.user_max_current)
+
+    @property
+    def phase_current(self) -> float:
+        """Current drawn on each active phase."""
+        if self.charging_state != 4:
+            return 0.0
+        return min(self.actual_limit, self.ev_current)
+
+    @property
+    def active_power(self) -> int:
+        """Active power in W over all active phases."""
+        return round(self.phase_current * self.voltage * self.phases)
+
+    def registers(self) -> list[int]:
+        """Return the 37 registers of the 4000h block."""
+        regs = [0] * REGISTER_BLOCK_COUNT
+
+        def write_u32(index: int, value: int) -> None:
+            regs[index] = (value >> 16) & 0xFFFF
+            regs[index + 1] = value & 0xFFFF
+
+        regs[0:4] = self.serial_registers
+        regs[4:6] = self.firmware_registers
+        write_u32(6, round(self.user_max_current * 1000))
+        regs[8] = self.error_code & 0xFFFF
+        write_u32(10, self.socket_lock_state)
+        regs[13] = (self.charging_state & 0x0F) << 8
+        write_u32(14, round(self.actual_limit * 1000))
+        current_ma = round(self.phase_current * 1000)
+        voltage_dv = round(self.voltage * 10)
+        for phase in range(3):
+            active = phase < self.phases
+            write_u32(16 + 2 * phase, current_ma if active else 0)
+            write_u32(22 + 2 * phase, voltage_dv if active else 0)
+        write_u32(28, self.active_power)
+        write_u32(30, int(self.energy_wh))
+        regs[32] = self.communication_timeout & 0xFFFF
+        write_u32(34, self.current_limit_ma)
+        regs[36] = self.fallback_limit & 0xFFFF
+        return regs
+
+
+class ModbusError(Exception):
+    """Modbus exception response raised while handling a request."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+@dataclass(slots=True)
+class SimulatorStats:
+    """Counters collected by the simulator."""
+
+    requests: Counter[int] = field(default_factory=Counter)
+    writes: list[tuple[int, list[int]]] = field(default_factory=list)
+    connections: int = 0
+    dropped: int = 0
+    max_in_flight: int = 0
+
+
+class TerraAcSimulator:
+    """Asyncio Modbus TCP server emulating one Terra AC charger.
+
+    Use as an async context manager; ``port`` is assigned by the OS::
+
+        async with TerraAcSimulator() as sim:
+            client = AsyncModbusTcpClient(HOST, port=sim.port)
+    """
+
+    def __init__(
+        self,
+        state: ChargerState | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.state = state or ChargerState()
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.stats = SimulatorStats()
+        self._random = random.Random(seed)
+        self._drop_next = 0
+        self._stall_next = 0
+        self._in_flight = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._profile: tuple[SessionStep, ...] = ()
+        self._profile_started = 0.0
+        self._profile_step = -1
+        self._last_tick: float | None = None
+
+    @property
+    def port(self) -> int:
+        """TCP port the simulator listens on."""
+        if self._server is None:
+            msg = "simulator is not running"
+            raise RuntimeError(msg)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = HOST, port: int = 0) -> None:
+        """Start listening on ``host``:``port`` (``0``: any free port)."""
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+
+    async def stop(self) -> None:
+        """Close every client connection and stop listening."""
+        self.disconnect_clients()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> TerraAcSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    # --- scripting ----------------------------------------------------------
+
+    def play(self, profile: Sequence[SessionStep]) -> None:
+        """Start ``profile`` now; the last step holds until another profile plays."""
+        self._profile = tuple(profile)
+        self._profile_started = asyncio.get_running_loop().time()
+        self._profile_step = -1
+        self._tick()
+
+    def drop_next(self, count: int = 1, *, stall: bool = False) -> None:
+        """Drop the next ``count`` requests.
+
+        A dropped request closes the connection without a response; with
+        ``stall`` the connection stays open and the client runs into its
+        timeout instead.
+        """
+        if stall:
+            self._stall_next += count
+        else:
+            self._drop_next += count
+
+    def disconnect_clients(self) -> None:
+        """Close every client connection (e.g. a network blip)."""
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    def reboot(
+        self, *, reset_fallback_limit: bool = True, reset_current_limit: bool = True
+    ) -> None:
+        """Simulate an unexpected charger reboot.
+
+        Drops every connection and, like the affected firmware, resets the
+        fallback limit to 256 and the Modbus current limit to 32 A.
+        """
+        if reset_fallback_limit:
+            self.state.fallback_limit = FIRMWARE_RESET_FALLBACK_LIMIT
+        if reset_current_limit:
+            self.state.current_limit_ma = FIRMWARE_RESET_CURRENT_LIMIT_MA
+        self.disconnect_clients()
+
+    # --- protocol -----------------------------------------------------------
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.stats.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP.size)
+                transaction_id, protocol_id, length, unit_id = _MBAP.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                if protocol_id != 0:
+                    break
+                if self._drop_next or (
+                    self.drop_rate and self._random.random() < self.drop_rate
+                ):
+                    self._drop_next = max(self._drop_next - 1, 0)
+                    self.stats.dropped += 1
+                    break
+                if self._stall_next:
+                    self._stall_next -= 1
+                    self.stats.dropped += 1
+                    continue
+                response = await self._respond(pdu)
+                writer.write(
+                    _MBAP.pack(transaction_id, 0, len(response) + 1, unit_id)
+                    + response
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, pdu: bytes) -> bytes:
+        function_code = pdu[0]
+        self.stats.requests[function_code] += 1
+        self._in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+        try:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            self._tick()
+            try:
+                return self._execute(function_code, pdu[1:])
+            except ModbusError as err:
+                return bytes((function_code | 0x80, err.code))
+        finally:
+            self._in_flight -= 1
+
+    def _execute(self, function_code: int, body: bytes) -> bytes:
+        if function_code == FC_READ_HOLDING_REGISTERS:
+            address, count = struct.unpack_from(">HH", body)
+            start = address - REGISTER_BLOCK_ADDRESS
+            if count < 1 or start < 0 or start + count > REGISTER_BLOCK_COUNT:
+                raise ModbusError(EXC_ILLEGAL_ADDRESS)
+            values = self.state.registers()[start:start + count]
+            return struct.pack(f">BB{count}H", function_code, count * 2, *values)
+        if function_code == FC_WRITE_REGISTER:
+            address, value = struct.unpack_from(">HH", body)
+            self._write(address, [value])
+            return struct.pack(">BHH", function_code, address, value)
+        if function_code == FC_WRITE_REGISTERS:
+            address, count, _ = struct.unpack_from(">HHB", body)
+            values = list(struct.unpack_from(f">{count}H", body, 5))
+            self._write(address, values)
+            return struct.pack(">BHH", function_code, address, count)
+        raise ModbusError(EXC_ILLEGAL_FUNCTION)
+
+    def _write(self, address: int, values: list[int]) -> None:
+        state = self.state
+        if address == REG_CURRENT_LIMIT and len(values) == 2:
+            state.current_limit_ma = (values[0] << 16) | values[1]
+        elif address == REG_LOCK and len(values) == 1:
+            if values[0] not in (0, 1):
+                raise ModbusError(EXC_ILLEGAL_VALUE)
+            if values[0] and state.socket_lock_state & _LOCK_CABLE:
+                state.socket_lock_state |= _LOCK_LOCKED
+            else:
+                state.socket_lock_state &= ~_LOCK_LOCKED
+        elif address == REG_START_STOP and len(values) == 1:
+            if values[0] not in (0, 1):
+                raise ModbusError(EXC_ILLEGAL_VALUE)
+            if values[0] == 0 and state.socket_lock_state & _LOCK_EV:
+                state.charging_state = 4
+            elif values[0] == 1 and state.charging_state in (3, 4):
+                state.charging_state = 5
+        elif address == REG_FALLBACK_LIMIT and len(values) == 1:
+            state.fallback_limit = values[0]
+        else:
+            raise ModbusError(EXC_ILLEGAL_ADDRESS)
+        self.stats.writes.append((address, values))
+
+    # --- session model ------------------------------------------------------
+
+    def _tick(self) -> None:
+        """Advance the session profile and integrate delivered energy."""
+        now = asyncio.get_running_loop().time()
+        if self._last_tick is not None:
+            self.state.energy_wh += self.state.active_power * (now - self._last_tick) / 3600
+        self._last_tick = now
+        if not self._profile:
+            return
+        elapsed = now - self._profile_started
+        step = 0
+        boundary = self._profile[0].duration
+        while step < len(self._profile) - 1 and elapsed >= boundary:
+            step += 1
+            boundary += self._profile[step].duration
+        if step != self._profile_step:
+            self._profile_step = step
+            current = self._profile[step]
+            self.state.charging_state = current.charging_state
+            self.state.socket_lock_state = current.socket_lock_state
+            self.state.ev_current = current.ev_current
@@ -0,0 +1,55 @@
+"""Tests for the in-memory per-phase window aggregator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.abb_terra_ac.aggregation import PhaseAggregator
+
+
+def _poll(voltage_l1: float, current_l1: float = 0.0) -> Any:
+    return {
+        "voltage_l1": voltage_l1,
+        "voltage_l2": 230.0,
+        "voltage_l3": 230.0,
+        "charging_current_l1": current_l1,
+        "charging_current_l2": 0.0,
+        "charging_current_l3": 0.0,
+    }
+
+
+def test_stats_cover_only_the_requested_window() -> None:
+    """Each window summarizes the samples of its trailing span."""
+    aggregator = PhaseAggregator(horizon=900)
+    for second, voltage in ((0, 200.0), (700, 230.0), (850, 220.0), (880, 240.0)):
+        aggregator.add(second, _poll(voltage, current_l1=voltage / 20))
+
+    minute = aggregator.stats("voltage_l1", 60, 880)
+    assert minute is not None
+    assert (minute.samples, minute.minimum, minute.maximum) == (2, 220.0, 240.0)
+    assert minute.mean == pytest.approx(230.0)
+    assert minute.stddev == pytest.approx(10.0)
+
+    quarter = aggregator.stats("charging_current_l1", 900, 880)
+    assert quarter is not None
+    assert quarter.samples == 4
+    assert quarter.as_dict() == {
+        "min": 10.0,
+        "max": 12.0,
+        "stddev": 0.74,
+        "samples": 4,
+    }
+    assert aggregator.stats("voltage_l1", 60, 2000) is None
+
+
+def test_buffer_is_bounded_by_horizon_and_size() -> None:
+    """Old samples are evicted and the ring never exceeds its size."""
+    aggregator = PhaseAggregator(horizon=60, max_samples=10)
+    for second in range(100):
+        aggregator.add(second, _poll(230.0))
+    assert len(aggregator) == 10
+
+    aggregator.add(500, _poll(230.0))
+    assert len(aggregator) == 1
@@ -0,0 +1,136 @@
+"""Tests for the fleet current budget allocator."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.allocation import ChargerDemand, allocate_current
+from custom_components.abb_terra_ac.const import (
+    CONF_CHARGING_PRIORITY,
+    CONF_FLEET_CURRENT_BUDGET,
+)
+from custom_components.abb_terra_ac.session_state import SessionState
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client, make_holding_registers_37
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+
+_ACTIVE = SessionState.ACTIVE
+
+
+@pytest.mark.parametrize(
+    ("budget", "demands", "expected"),
+    [
+        # Even split between two charging vehicles.
+        (
+            20,
+            [ChargerDemand("a", _ACTIVE, 16), ChargerDemand("b", _ACTIVE, 16)],
+            {"a": 10, "b": 10},
+        ),
+        # Unplugged and completed chargers release their share.
+        (
+            20,
+            [
+                ChargerDemand("a", _ACTIVE, 32),
+                ChargerDemand("b", SessionState.IDLE, 32),
+                ChargerDemand("c", SessionState.COMPLETED, 32),
+            ],
+            {"a": 20, "b": 0, "c": 0},
+        ),
+        # A plugged-in vehicle that has not started gets the minimum to start.
+        (
+            20,
+            [
+                ChargerDemand("a", _ACTIVE, 32),
+                ChargerDemand("b", SessionState.IDLE, 32, vehicle_connected=True),
+            ],
+            {"a": 14, "b": 6},
+        ),
+        # What a capped charger cannot use goes to the others.
+        (
+            40,
+            [ChargerDemand("a", _ACTIVE, 10), ChargerDemand("b", _ACTIVE, 32)],
+            {"a": 10, "b": 30},
+        ),
+        # Priorities weigh the part above the 6 A minimum.
+        (
+            24,
+            [
+                ChargerDemand("a", _ACTIVE, 32, priority=2),
+                ChargerDemand("b", SessionState.PAUSED_BY_CURRENT, 32),
+            ],
+            {"a": 14, "b": 10},
+        ),
+        # 63 A over 11 vehicles: the lowest priority pauses, ten get 6 A.
+        (
+            63,
+            [ChargerDemand(f"c{i}", _ACTIVE, 32, priority=2) for i in range(10)]
+            + [ChargerDemand("low", _ACTIVE, 32)],
+            {**{f"c{i}": 6 for i in range(10)}, "low": 0},
+        ),
+    ],
+)
+def test_allocate_current(
+    budget: float, demands: list[ChargerDemand], expected: dict[str, int]
+) -> None:
+    """Limits never exceed the budget and each charger gets 0 or at least 6 A."""
+    allocation = allocate_current(budget, demands)
+    assert allocation == expected
+    assert sum(allocation.values()) <= budget
+
+
+def _limit_writes(client: MagicMock) -> list[int]:
+    return [
+        (call.kwargs["values"][0] << 16 | call.kwargs["values"][1]) // 1000
+        for call in client.write_registers.await_args_list
+        if call.kwargs["address"] == 16640
+    ]
+
+
+async def test_chargers_share_the_budget(hass: HomeAssistant) -> None:
+    """Both chargers are lowered to fit; the one left takes the whole budget."""
+    entries = []
+    for host in ("192.168.1.50", "192.168.1.51"):
+        kwargs = mock_config_entry_kwargs()
+        kwargs["data"][CONF_HOST] = host
+        kwargs["options"].update(
+            {CONF_FLEET_CURRENT_BUDGET: 20, CONF_CHARGING_PRIORITY: 1}
+        )
+        entry = MockConfigEntry(**kwargs)
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    clients = [
+        create_mock_modbus_client(
+            connect=True,
+            read_error=False,
+            registers=make_holding_registers_37(
+                charging_state_nibble=3,
+                socket_lock_raw_32=17,
+                user_max_amps=16,
+                charging_current_modbus_amps=16,
+                charging_l1_amps=16,
+            ),
+        )
+        for _ in entries
+    ]
+    with patch(_INIT_MODBUS, side_effect=clients):
+        assert await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+
+    assert [_limit_writes(client) for client in clients] == [[10], [10]]
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entries[1])
+    assert result["fleet"]["current_budget"]["budget"] == 20
+    assert result["fleet"]["current_budget"]["allocated"] == 20
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    await hass.async_block_till_done()
+    assert _limit_writes(clients[1]) == [10, 16]
@@ -8,7 +8,11 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pymodbus.exceptions import ModbusIOException
 
 from custom_components.abb_terra_ac.const import (
+    CONF_AGGREGATION_WINDOWS,
+    CONF_IDLE_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL,
+    CONF_UNIT_ID,
+    CONF_WRITE_COALESCE_WINDOW,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
@@ -178,7 +182,11 @@ async def test_successful_flow(hass: HomeAssistant) -> None:
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "ABB Terra AC (192.168.1.50)"
-    assert result["data"] == {CONF_HOST: "192.168.1.50", CONF_PORT: 502}
+    assert result["data"] == {
+        CONF_HOST: "192.168.1.50",
+        CONF_PORT: 502,
+        CONF_UNIT_ID: 1,
+    }
     entries = hass.config_entries.async_entries(DOMAIN)
     assert len(entries) == 1
     assert entries[0].options[CONF_SCAN_INTERVAL] == DEFAULT_SCAN_INTERVAL
@@ -210,6 +218,34 @@ async def test_already_configured(hass: HomeAssistant) -> None:
     assert result["reason"] == "already_configured"
 
 
+async def test_second_charger_behind_same_gateway(hass: HomeAssistant) -> None:
+    """A different unit id on a configured host:port creates its own entry."""
+    MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        unique_id="192.168.1.50:502",
+        data={CONF_HOST: "192.168.1.50", CONF_PORT: 502},
+        options={CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL},
+    ).add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(_FLOW_MODBUS, return_value=mock_client):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={CONF_HOST: "192.168.1.50", CONF_PORT: 502, CONF_UNIT_ID: 3},
+        )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "ABB Terra AC (192.168.1.50, unit 3)"
+    assert result["result"].unique_id == "192.168.1.50:502:3"
+    assert mock_client.read_holding_registers.await_args.kwargs["device_id"] == 3
+
+
 async def test_reconfigure_updates_existing_entry(hass: HomeAssistant) -> None:
     """Reconfigure should update host/port, title, and unique_id."""
     entry = MockConfigEntry(
@@ -243,7 +279,7 @@ async def test_reconfigure_updates_existing_entry(hass: HomeAssistant) -> None:
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "reconfigure_successful"
-    assert entry.data == {CONF_HOST: "192.168.1.60", CONF_PORT: 1502}
+    assert entry.data == {CONF_HOST: "192.168.1.60", CONF_PORT: 1502, CONF_UNIT_ID: 1}
     assert entry.title == "ABB Terra AC (192.168.1.60)"
     assert entry.unique_id == "192.168.1.60:1502"
 
@@ -297,3 +333,48 @@ async def test_options_flow_updates_scan_interval(hass: HomeAssistant) -> None:
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert entry.options[CONF_SCAN_INTERVAL] == 45
+
+
+async def test_options_flow_updates_idle_scan_interval(hass: HomeAssistant) -> None:
+    """Options flow should persist the idle polling interval alongside scan_interval."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 10, CONF_IDLE_SCAN_INTERVAL: 120},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_SCAN_INTERVAL] == 10
+    assert entry.options[CONF_IDLE_SCAN_INTERVAL] == 120
+
+
+async def test_options_flow_updates_write_coalesce_window(hass: HomeAssistant) -> None:
+    """Options flow should persist the limit write coalescing window."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 15, CONF_WRITE_COALESCE_WINDOW: 500},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_WRITE_COALESCE_WINDOW] == 500
+
+
+async def test_options_flow_updates_aggregation_windows(hass: HomeAssistant) -> None:
+    """Options flow should persist the phase statistics windows."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 15, CONF_AGGREGATION_WINDOWS: ["5", "60"]},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_AGGREGATION_WINDOWS] == ["5", "60"]
@@ -0,0 +1,95 @@
+"""Tests for the hourly energy statistics import."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.abb_terra_ac.energy_statistics import HourlyEnergyStatistics
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+
+_T0 = datetime(2026, 1, 5, 18, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, enable_custom_integrations: None
+) -> None:
+    """Start the recorder before ``hass`` (overrides the conftest fixture)."""
+
+
+def _poll(energy: float, power: float) -> Any:
+    return {"energy_delivered": energy, "active_power": power, "socket_lock_state": 17}
+
+
+async def _statistics(hass: HomeAssistant, *ids: str) -> dict[str, list[Any]]:
+    return await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        _T0 - timedelta(hours=1),
+        None,
+        set(ids),
+        "hour",
+        None,
+        {"state", "sum", "mean", "min", "max"},
+    )
+
+
+async def test_closed_hours_are_imported_in_one_batch(hass: HomeAssistant) -> None:
+    """Hourly energy is a running sum; power keeps mean, min and max."""
+    stats = HourlyEnergyStatistics(hass, "01ABCDEF", "Garage")
+    polls = [
+        (_T0 + timedelta(minutes=10), _poll(0, 0)),
+        (_T0 + timedelta(minutes=40), _poll(2000, 7000)),
+        (_T0 + timedelta(hours=1, minutes=10), _poll(5000, 7400)),
+        (_T0 + timedelta(hours=1, minutes=50), _poll(6000, 3000)),
+    ]
+    assert [stats.async_add(now, data) for now, data in polls] == [
+        False,
+        False,
+        True,
+        False,
+    ]
+
+    # Nothing was imported yet; the batch holds every closed hour.
+    assert stats.async_add(_T0 + timedelta(hours=2, minutes=5), _poll(6000, 0))
+    assert len(stats.pending) == 2
+    await stats.async_flush()
+    await async_wait_recording_done(hass)
+
+    energy_id = "abb_terra_ac:01abcdef_energy"
+    power_id = "abb_terra_ac:01abcdef_power"
+    result = await _statistics(hass, energy_id, power_id)
+
+    assert [(row["state"], row["sum"]) for row in result[energy_id]] == [
+        (2.0, 2.0),
+        (4.0, 6.0),
+    ]
+    second_hour = result[power_id][1]
+    assert (second_hour["mean"], second_hour["min"], second_hour["max"]) == (
+        5200.0,
+        3000.0,
+        7400.0,
+    )
+
+    # A restarted integration continues the sum and skips imported hours.
+    restarted = HourlyEnergyStatistics(hass, "01ABCDEF", "Garage")
+    restarted.async_add(_T0 + timedelta(hours=1, minutes=59), _poll(100, 0))
+    restarted.async_add(_T0 + timedelta(hours=2, minutes=30), _poll(1100, 3600))
+    restarted.async_add(_T0 + timedelta(hours=3, minutes=1), _poll(1100, 0))
+    await restarted.async_flush()
+    await async_wait_recording_done(hass)
+
+    result = await _statistics(hass, energy_id)
+    assert [(row["state"], row["sum"]) for row in result[energy_id]] == [
+        (2.0, 2.0),
+        (4.0, 6.0),
+        (1.0, 7.0),
+    ]
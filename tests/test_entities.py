@@ -1,12 +1,19 @@
 """Entity platform tests (sensor / switch / number) for ``abb_terra_ac``."""
 
 import asyncio
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
 
 from custom_components.abb_terra_ac.const import DOMAIN, ERROR_CODES, SOCKET_LOCK_STATES
+from custom_components.abb_terra_ac.modbus_write import CoalescingRegisterWriter
+from custom_components.abb_terra_ac.registers import REGISTER_GROUP_CONFIG
 from custom_components.abb_terra_ac.session_state import LastCommand
 from tests.const import mock_config_entry_kwargs
 from custom_components.abb_terra_ac.number import AbbTerraAcFallbackLimit
@@ -15,14 +22,16 @@ from homeassistant.components.number import ATTR_VALUE, SERVICE_SET_VALUE
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
 from homeassistant.components.button import SERVICE_PRESS
 from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from tests.helpers.modbus import (
     create_mock_modbus_client,
     make_holding_registers_37,
+    sliced_read_side_effect,
 )
 
 _INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
@@ -38,6 +47,7 @@ _EXPECTED_ENTITY_SUFFIXES = frozenset(
         "socket_lock_state",
         "active_power",
         "energy_delivered",
+        "lifetime_energy",
         "current_l1",
         "current_l2",
         "current_l3",
@@ -51,6 +61,16 @@ _EXPECTED_ENTITY_SUFFIXES = frozenset(
         "lock",
         "current_limit",
         "fallback_limit",
+        "modbus_round_trip",
+        "modbus_timeouts",
+        "modbus_reconnects",
+        # Phase statistics over the default 1 and 15 minute windows.
+        *(
+            f"{quantity}_l{phase}_{window}m"
+            for quantity in ("voltage", "current")
+            for phase in (1, 2, 3)
+            for window in (1, 15)
+        ),
     }
 )
 
@@ -77,14 +97,6 @@ def _write_registers_address_values(call) -> tuple[int, list[int]]:
     return int(call.kwargs["address"]), list(call.kwargs["values"])
 
 
-def _read_result_with_registers(registers: list[int]) -> MagicMock:
-    """Build one mocked Modbus read result object."""
-    result = MagicMock()
-    result.isError.return_value = False
-    result.registers = list(registers)
-    return result
-
-
 def _entity_id_for(
     hass: HomeAssistant, config_entry_id: str, suffix: str
 ) -> str:
@@ -347,6 +359,33 @@ async def test_switch_lock_turn_on_and_turn_off_write_modbus(hass: HomeAssistant
     assert (16643, 0) in writes
 
 
+async def test_switch_lock_publishes_read_back_lock_state(hass: HomeAssistant) -> None:
+    """Locking reads back only the socket lock registers and shows the result."""
+    registers = make_holding_registers_37(socket_lock_raw_32=1)
+    entry, mock_client = await _async_setup_with_registers(hass, registers)
+
+    entity_id = _entity_id_for(hass, entry.entry_id, "lock")
+    mock_client.read_holding_registers.reset_mock()
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37(socket_lock_raw_32=17)
+    )
+
+    await hass.services.async_call(
+        "switch",
+        "turn_on",
+        {ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    reads = [
+        (c.kwargs["address"], c.kwargs["count"])
+        for c in mock_client.read_holding_registers.await_args_list
+    ]
+    assert reads == [(16394, 2)]
+    assert hass.states.get(entity_id).state == "on"
+
+
 async def test_number_charging_limit_set_value_writes_registers(hass: HomeAssistant) -> None:
     """Charging current limit number uses 32-bit write to 4100h."""
     registers = make_holding_registers_37(
@@ -399,6 +438,106 @@ async def test_number_fallback_set_value_writes_register(hass: HomeAssistant) ->
     assert match
 
 
+async def test_number_set_value_bursts_are_coalesced(hass: HomeAssistant) -> None:
+    """Rapid limit changes send only the latest value, verified by one read."""
+    registers = make_holding_registers_37(user_max_amps=32.0)
+    entry, mock_client = await _async_setup_with_registers(hass, registers)
+    coordinator = entry.runtime_data.coordinator
+    entity_id = _entity_id_for(hass, entry.entry_id, "current_limit")
+    mock_client.read_holding_registers.reset_mock()
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37(user_max_amps=32.0, charging_current_modbus_amps=14.0)
+    )
+
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                "number",
+                SERVICE_SET_VALUE,
+                {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: value},
+                blocking=True,
+            )
+            for value in (8.0, 10.0, 12.0, 14.0)
+        )
+    )
+
+    writes = [
+        _write_registers_address_values(c)
+        for c in mock_client.write_registers.await_args_list
+    ]
+    assert writes == [(16640, [0, 14000])]
+    reads = [
+        (c.kwargs["address"], c.kwargs["count"])
+        for c in mock_client.read_holding_registers.await_args_list
+    ]
+    assert reads == [(16418, 2)]
+    assert coordinator.data["charging_current_limit_modbus"] == 14
+    # The next poll re-reads the whole config group.
+    assert "config" not in coordinator._register_group_read_at
+    assert coordinator.limit_writer.as_dict() == {
+        "window": 0.25,
+        "requested": 4,
+        "written": 1,
+        "coalesced": 3,
+    }
+
+
+async def test_coalesced_writes_report_each_register_separately(
+    hass: HomeAssistant,
+) -> None:
+    """A failed current limit write neither skips nor fails the fallback limit."""
+    registers = make_holding_registers_37(user_max_amps=32.0)
+    entry, mock_client = await _async_setup_with_registers(hass, registers)
+    current_id = _entity_id_for(hass, entry.entry_id, "current_limit")
+    fallback_id = _entity_id_for(hass, entry.entry_id, "fallback_limit")
+    failed = MagicMock()
+    failed.isError.return_value = True
+    mock_client.write_registers.return_value = failed
+
+    current, fallback = await asyncio.gather(
+        hass.services.async_call(
+            "number",
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: current_id, ATTR_VALUE: 10.0},
+            blocking=True,
+        ),
+        hass.services.async_call(
+            "number",
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: fallback_id, ATTR_VALUE: 8.0},
+            blocking=True,
+        ),
+        return_exceptions=True,
+    )
+
+    assert isinstance(current, HomeAssistantError)
+    assert current.translation_key == "write_failed"
+    assert fallback is None
+    mock_client.write_register.assert_awaited_once()
+    assert mock_client.write_register.await_args.kwargs["address"] == 16649
+
+
+async def test_limit_write_is_cancelled_on_unload(hass: HomeAssistant) -> None:
+    """A write still waiting for its window is dropped when the entry unloads."""
+    registers = make_holding_registers_37(user_max_amps=32.0)
+    entry, mock_client = await _async_setup_with_registers(hass, registers)
+    entity_id = _entity_id_for(hass, entry.entry_id, "current_limit")
+
+    write = hass.async_create_task(
+        hass.services.async_call(
+            "number",
+            SERVICE_SET_VALUE,
+            {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: 10.0},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    with pytest.raises(asyncio.CancelledError):
+        await write
+    mock_client.write_registers.assert_not_awaited()
+
+
 async def test_number_entities_use_dynamic_max_value(hass: HomeAssistant) -> None:
     """Number entities derive their max value from user_settable_max_current."""
     registers = make_holding_registers_37(user_max_amps=20.0)
@@ -466,9 +605,10 @@ async def test_coordinator_restores_invalid_fallback_limit(hass: HomeAssistant)
     coordinator = entry.runtime_data.coordinator
     assert coordinator.data["fallback_limit"] == 10
 
-    mock_client.read_holding_registers.side_effect = [
-        _read_result_with_registers(invalid_registers),
-    ]
+    mock_client.read_holding_registers.side_effect = sliced_read_side_effect(
+        invalid_registers
+    )
+    coordinator.invalidate_register_groups(REGISTER_GROUP_CONFIG)
     updated_data = await coordinator._async_update_data()
     coordinator.async_set_updated_data(updated_data)
     await hass.async_block_till_done()
@@ -496,9 +636,10 @@ async def test_coordinator_restores_invalid_current_limit(hass: HomeAssistant) -
     coordinator = entry.runtime_data.coordinator
     assert coordinator.data["charging_current_limit_modbus"] == 12
 
-    mock_client.read_holding_registers.side_effect = [
-        _read_result_with_registers(invalid_registers),
-    ]
+    mock_client.read_holding_registers.side_effect = sliced_read_side_effect(
+        invalid_registers
+    )
+    coordinator.invalidate_register_groups(REGISTER_GROUP_CONFIG)
     updated_data = await coordinator._async_update_data()
     coordinator.async_set_updated_data(updated_data)
     await hass.async_block_till_done()
@@ -532,7 +673,9 @@ async def test_button_write_exception_raises_translated_error() -> None:
     assert err.value.translation_key == "charger_unavailable"
 
 
-async def test_number_write_error_result_raises_translated_error() -> None:
+async def test_number_write_error_result_raises_translated_error(
+    hass: HomeAssistant,
+) -> None:
     """Modbus error responses should raise translated HA errors."""
     entry = MockConfigEntry(**mock_config_entry_kwargs())
     coordinator = MagicMock()
@@ -543,6 +686,16 @@ async def test_number_write_error_result_raises_translated_error() -> None:
     write_result = MagicMock()
     write_result.isError.return_value = True
     client.write_register = AsyncMock(return_value=write_result)
+    coordinator.limit_writer = CoalescingRegisterWriter(
+        hass,
+        entry,
+        client,
+        lock=coordinator.modbus_lock,
+        unit_id=1,
+        window=0,
+        readback={16649: (36, 1)},
+        on_readback=AsyncMock(),
+    )
 
     entity = AbbTerraAcFallbackLimit(coordinator, entry, client)
 
@@ -573,3 +726,170 @@ async def test_session_state_paused_by_command_after_stop_and_state_five(
 
     session_id = _entity_id_for(hass, entry.entry_id, "session_state")
     assert hass.states.get(session_id).state == "paused_by_command"
+
+
+async def test_entities_skip_state_writes_for_unchanged_keys(
+    hass: HomeAssistant, freezer
+) -> None:
+    """Only entities whose coordinator keys changed write a new state."""
+    registers = make_holding_registers_37(
+        charging_state_nibble=4,
+        charging_current_modbus_amps=16.0,
+        socket_lock_raw_32=273,
+        voltage_l1=230.0,
+        active_power_wh=5000,
+    )
+    entry, _ = await _async_setup_with_registers(hass, registers)
+    coordinator = entry.runtime_data.coordinator
+    voltage_id = _entity_id_for(hass, entry.entry_id, "voltage_l1")
+    power_id = _entity_id_for(hass, entry.entry_id, "active_power")
+    voltage_reported = hass.states.get(voltage_id).last_reported
+    power_reported = hass.states.get(power_id).last_reported
+
+    freezer.tick(10)
+    new_data = dict(coordinator.data)
+    new_data["active_power"] = 7000
+    coordinator.async_set_updated_data(new_data)
+    await hass.async_block_till_done()
+
+    assert coordinator.changed_keys == frozenset({"active_power"})
+    assert hass.states.get(voltage_id).last_reported == voltage_reported
+    assert hass.states.get(power_id).last_reported > power_reported
+    assert float(hass.states.get(power_id).state) == pytest.approx(7000.0)
+
+    # An availability flip writes every entity again.
+    coordinator.async_set_update_error(Exception("offline"))
+    await hass.async_block_till_done()
+    assert coordinator.changed_keys is None
+    assert hass.states.get(voltage_id).state == "unavailable"
+
+
+async def test_lifetime_energy_restores_and_accumulates(hass: HomeAssistant) -> None:
+    """The lifetime sensor resumes from restore data and adds new sessions."""
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State("sensor.abb_terra_ac_charger_lifetime_energy", "5.0"),
+                {
+                    "native_value": 5000.0,
+                    "native_unit_of_measurement": "Wh",
+                    "lifetime": {"total_wh": 5000.0, "last_register_wh": 1200.0},
+                },
+            )
+        ],
+    )
+    registers = make_holding_registers_37(socket_lock_raw_32=17, energy_wh=1500)
+    entry, mock_client = await _async_setup_with_registers(hass, registers)
+
+    entity_id = _entity_id_for(hass, entry.entry_id, "lifetime_energy")
+    state = hass.states.get(entity_id)
+    assert state.attributes["state_class"] == "total_increasing"
+    assert state.attributes["unit_of_measurement"] == "kWh"
+    assert float(state.state) == pytest.approx(5.3)
+
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37(socket_lock_raw_32=17, energy_wh=400)
+    )
+    coordinator = entry.runtime_data.coordinator
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get(entity_id).state) == pytest.approx(5.7)
+
+
+async def test_lifetime_energy_ignores_an_older_warm_start_snapshot(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """A snapshot saved before the restore state is not counted as a session."""
+    entry, _ = await _async_setup_with_registers(
+        hass, make_holding_registers_37(socket_lock_raw_32=17, energy_wh=1000)
+    )
+    snapshot = entry.runtime_data.coordinator._snapshot()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": snapshot,
+    }
+    entity_id = _entity_id_for(hass, entry.entry_id, "lifetime_energy")
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State(entity_id, "5.0"),
+                {
+                    "native_value": 5000.0,
+                    "native_unit_of_measurement": "Wh",
+                    "lifetime": {"total_wh": 5000.0, "last_register_wh": 1200.0},
+                },
+            )
+        ],
+    )
+
+    release = asyncio.Event()
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(socket_lock_raw_32=17, energy_wh=1500),
+    )
+    connect = mock_client.connect.side_effect
+
+    async def _slow_connect() -> bool:
+        await release.wait()
+        return await connect()
+
+    mock_client.connect.side_effect = _slow_connect
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await asyncio.sleep(0)
+        assert entry.runtime_data.coordinator.warm_started
+        assert float(hass.states.get(entity_id).state) == pytest.approx(5.0)
+
+        release.set()
+        await hass.async_block_till_done()
+
+    # Only the live 1200 -> 1500 Wh step is added.
+    assert float(hass.states.get(entity_id).state) == pytest.approx(5.3)
+
+async def test_phase_window_sensor_publishes_once_per_window(
+    hass: HomeAssistant,
+) -> None:
+    """Window sensors summarize buffered polls and skip per-poll state writes."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    registry.async_get_or_create(
+        "sensor", DOMAIN, f"{entry.entry_id}_voltage_l1_1m", config_entry=entry
+    )
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(voltage_l1=230.0),
+    )
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = _entity_id_for(hass, entry.entry_id, "voltage_l1_1m")
+    assert hass.states.get(entity_id).state == "unknown"
+
+    coordinator = entry.runtime_data.coordinator
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37(voltage_l1=220.0)
+    )
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "unknown"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=1))
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert 220.0 < float(state.state) < 230.0
+    assert state.attributes["min"] == 220.0
+    assert state.attributes["max"] == 230.0
+    assert state.attributes["samples"] >= 2
+    assert state.attributes["unit_of_measurement"] == "V"
@@ -1,9 +1,15 @@
 """Setup / unload tests for the ``abb_terra_ac`` custom integration."""
+import asyncio
+from datetime import timedelta
 import logging
-from unittest.mock import MagicMock, patch
+from time import monotonic
+from unittest.mock import patch
 
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.abb_terra_ac import binary_sensor as binary_sensor_platform
 from custom_components.abb_terra_ac import button as button_platform
@@ -13,29 +19,33 @@ from custom_components.abb_terra_ac import sensor as sensor_platform
 from custom_components.abb_terra_ac import switch as switch_platform
 from custom_components.abb_terra_ac import async_migrate_entry
 from custom_components.abb_terra_ac.const import (
+    BURST_SCAN_DURATION,
+    BURST_SCAN_INTERVAL,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CONF_IDLE_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
+from custom_components.abb_terra_ac.modbus import modbus_client_stats
+from custom_components.abb_terra_ac.registers import REGISTER_GROUP_CONFIG
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 from tests.const import mock_config_entry_kwargs
 from tests.helpers.modbus import create_mock_modbus_client
 from tests.helpers.modbus import make_holding_registers_37
+from tests.helpers.modbus import sliced_read_side_effect
 
 _INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
-
-
-def _read_result_with_registers(registers: list[int]) -> MagicMock:
-    """Build one mocked Modbus read result object."""
-    result = MagicMock()
-    result.isError.return_value = False
-    result.registers = list(registers)
-    return result
+_INIT_MONOTONIC = "custom_components.abb_terra_ac.monotonic"
+_MODBUS_MONOTONIC = "custom_components.abb_terra_ac.modbus.monotonic"
 
 
 async def test_setup_entry_and_unload(hass: HomeAssistant) -> None:
@@ -99,6 +109,50 @@ async def test_logs_when_unavailable_and_when_available_again(
     assert "ABB Terra AC charger is available again" in messages
 
 
+async def test_logs_circuit_breaker_transitions(hass: HomeAssistant, caplog) -> None:
+    """Open, half-open and closed circuits are reported by the coordinator."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    caplog.set_level(logging.INFO)
+    async def _refuse() -> bool:
+        return False
+
+    async def _accept() -> bool:
+        mock_client.connected = True
+        return True
+
+    mock_client.connected = False
+    mock_client.connect.side_effect = _refuse
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("connection circuit open" in message for message in messages)
+
+    caplog.clear()
+    breaker = modbus_client_stats(mock_client).breaker
+    mock_client.connect.side_effect = _accept
+    with patch(_MODBUS_MONOTONIC, return_value=breaker.retry_at):
+        await coordinator._async_update_data()
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "ABB Terra AC charger still unavailable: "
+        "connection circuit half-open, probing the charger",
+        "ABB Terra AC charger is available again",
+    ]
+
+    # Unloaded entries no longer listen to the shared breaker.
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not breaker._listeners
+
+
 def test_platforms_define_parallel_updates() -> None:
     """Platforms explicitly opt into coordinator-safe serialized updates."""
     assert sensor_platform.PARALLEL_UPDATES == 0
@@ -161,11 +215,11 @@ async def test_creates_and_clears_repair_issue_for_invalid_fallback_limit(
         read_error=False,
         registers=invalid_registers,
     )
-    mock_client.read_holding_registers.side_effect = [
-        _read_result_with_registers(invalid_registers),
-        _read_result_with_registers(invalid_registers),
-        _read_result_with_registers(valid_registers),
-    ]
+    mock_client.read_holding_registers.side_effect = sliced_read_side_effect(
+        invalid_registers,
+        invalid_registers,
+        valid_registers,
+    )
     failed_write = mock_client.write_register.return_value
     failed_write.isError.return_value = True
 
@@ -271,13 +325,314 @@ async def test_coordinator_reconnects_and_retries_read_once(
     await hass.async_block_till_done()
 
     coordinator = entry.runtime_data.coordinator
-    mock_client.read_holding_registers.side_effect = [
+    mock_client.read_holding_registers.side_effect = sliced_read_side_effect(
         ModbusIOException("Request cancelled outside pymodbus."),
-        _read_result_with_registers(good_registers),
-    ]
+        good_registers,
+    )
 
     updated_data = await coordinator._async_update_data()
 
     assert updated_data["fallback_limit"] == 0
     assert mock_client.connect.await_count >= 2
     assert mock_client.close.call_count >= 1
+
+
+def _read_spans(mock_client) -> list[tuple[int, int]]:
+    """Return ``(address, count)`` of every register read issued so far."""
+    return [
+        (c.kwargs["address"], c.kwargs["count"])
+        for c in mock_client.read_holding_registers.await_args_list
+    ]
+
+
+async def test_coordinator_polls_register_groups_at_their_cadence(
+    hass: HomeAssistant,
+) -> None:
+    """Identity is read once, configuration slowly and measurements every tick."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(fallback_limit=8),
+    )
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    assert _read_spans(mock_client)[0] == (16384, 37)
+    coordinator.invalidate_register_groups(REGISTER_GROUP_CONFIG)
+    start = monotonic()
+
+    mock_client.read_holding_registers.reset_mock()
+    with patch(_INIT_MONOTONIC, return_value=start):
+        data = await coordinator._async_update_data()
+    assert _read_spans(mock_client) == [(16392, 29)]
+    assert data["fallback_limit"] == 8
+
+    mock_client.read_holding_registers.reset_mock()
+    with patch(_INIT_MONOTONIC, return_value=start + 10):
+        data = await coordinator._async_update_data()
+    assert _read_spans(mock_client) == [(16392, 24)]
+    assert data["fallback_limit"] == 8
+
+    mock_client.read_holding_registers.reset_mock()
+    with patch(_INIT_MONOTONIC, return_value=start + 60):
+        await coordinator._async_update_data()
+    assert _read_spans(mock_client) == [(16392, 29)]
+
+
+async def test_coordinator_rereads_identity_after_reconnect(
+    hass: HomeAssistant,
+) -> None:
+    """A dropped connection invalidates every register group."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    mock_client.connected = False
+    mock_client.read_holding_registers.reset_mock()
+
+    await coordinator._async_update_data()
+
+    assert _read_spans(mock_client) == [(16384, 37)]
+
+
+async def test_coordinator_adapts_update_interval_to_session_state(
+    hass: HomeAssistant,
+) -> None:
+    """Idle chargers poll at the idle interval, charging ones at the scan interval."""
+    entry = MockConfigEntry(
+        **{
+            **mock_config_entry_kwargs(),
+            "options": {CONF_SCAN_INTERVAL: 10, CONF_IDLE_SCAN_INTERVAL: 90},
+        }
+    )
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(),
+    )
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.poll_interval == timedelta(seconds=90)
+
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37(
+            charging_state_nibble=4,
+            socket_lock_raw_32=273,
+            charging_current_modbus_amps=16.0,
+        )
+    )
+    coordinator.invalidate_register_groups()
+    await coordinator._async_update_data()
+    assert coordinator.poll_interval == timedelta(seconds=10)
+
+
+async def test_coordinator_burst_refresh_after_control_action(
+    hass: HomeAssistant,
+) -> None:
+    """A control action polls at sub-second cadence until the burst expires."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    await coordinator.async_request_burst_refresh()
+    assert coordinator.poll_interval == BURST_SCAN_INTERVAL
+
+    await coordinator._async_update_data()
+    assert coordinator.poll_interval == BURST_SCAN_INTERVAL
+
+    with patch(_INIT_MONOTONIC, return_value=monotonic() + BURST_SCAN_DURATION):
+        await coordinator._async_update_data()
+    assert coordinator.poll_interval == timedelta(seconds=DEFAULT_IDLE_SCAN_INTERVAL)
+
+
+async def test_coordinator_polls_at_the_sub_second_burst_cadence(
+    hass: HomeAssistant,
+) -> None:
+    """Burst polls come every 0.5 s instead of on whole-second ticks."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.update_interval is None
+    mock_client.read_holding_registers.reset_mock()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.8))
+    await hass.async_block_till_done()
+    mock_client.read_holding_registers.assert_not_awaited()
+
+    await coordinator.async_request_burst_refresh()
+    await hass.async_block_till_done()
+    mock_client.read_holding_registers.reset_mock()
+    # The next slot on the 0.5 s grid is at most 0.75 s away.
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.8))
+    await hass.async_block_till_done()
+    mock_client.read_holding_registers.assert_awaited_once()
+
+    # Unloading stops the polls.
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    mock_client.read_holding_registers.reset_mock()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=120))
+    await hass.async_block_till_done()
+    mock_client.read_holding_registers.assert_not_awaited()
+
+
+async def test_warm_start_from_saved_snapshot(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """A saved snapshot makes entities available before the first poll ends."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    snapshot = entry.runtime_data.coordinator._snapshot()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": snapshot,
+    }
+    release = asyncio.Event()
+    slow_client = create_mock_modbus_client(connect=True, read_error=False)
+    connect = slow_client.connect.side_effect
+
+    async def _slow_connect() -> bool:
+        await release.wait()
+        return await connect()
+
+    slow_client.connect.side_effect = _slow_connect
+
+    with patch(_INIT_MODBUS, return_value=slow_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinator = entry.runtime_data.coordinator
+        assert coordinator.warm_started
+        assert coordinator.data == snapshot["data"]
+        assert coordinator.serial_number == snapshot["serial_number"]
+        slow_client.read_holding_registers.assert_not_awaited()
+
+        release.set()
+        await hass.async_block_till_done()
+
+    slow_client.read_holding_registers.assert_awaited()
+    assert coordinator.last_update_success
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["coordinator"]["warm_started"] is True
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.{entry.entry_id}" not in hass_storage
+
+
+async def test_warm_start_ignores_an_incomplete_snapshot(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """A snapshot missing data keys falls back to a blocking first refresh."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"data": {"serial_number": "stale"}},
+    }
+
+    mock_client = create_mock_modbus_client(connect=False, read_error=False)
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_firmware_fix_uses_limits_saved_before_restart(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """A charger that rebooted while HA was down gets the persisted limits back."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    key = f"{DOMAIN}.{entry.entry_id}.limits"
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": {"fallback_limit": 10, "current_limit": 12},
+    }
+
+    reset_registers = make_holding_registers_37(
+        user_max_amps=16,
+        charging_current_modbus_amps=32,
+        fallback_limit=256,
+    )
+    mock_client = create_mock_modbus_client(
+        connect=True, read_error=False, registers=reset_registers
+    )
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    fallback_write = mock_client.write_register.await_args.kwargs
+    assert (fallback_write["address"], fallback_write["value"]) == (16649, 10)
+    current_write = mock_client.write_registers.await_args.kwargs
+    assert (current_write["address"], current_write["values"]) == (16640, [0, 12000])
+
+
+async def test_last_valid_limits_are_saved_only_when_they_change(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    """Valid limits are written behind after a change, not on every poll."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    key = f"{DOMAIN}.{entry.entry_id}.limits"
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(
+            user_max_amps=16, charging_current_modbus_amps=12, fallback_limit=10
+        ),
+    )
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    assert key not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == {"fallback_limit": 10, "current_limit": 12}
+
+    with patch.object(coordinator._store, "async_schedule_save_limits") as save:
+        await coordinator._async_update_data()
+    save.assert_not_called()
@@ -0,0 +1,117 @@
+"""Tests for the built-in load-balancing controller."""
+
+from __future__ import annotations
+
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.const import (
+    CONF_GRID_POWER_ENTITY,
+    CONF_MAIN_FUSE_LIMIT,
+    LOAD_BALANCING_INCREASE_DELAY,
+)
+from custom_components.abb_terra_ac.load_balancing import allowed_charging_current
+from homeassistant.core import HomeAssistant
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client, make_holding_registers_37
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+_LB_MONOTONIC = "custom_components.abb_terra_ac.load_balancing.monotonic"
+
+
+@pytest.mark.parametrize(
+    ("import_power", "charger_power", "expected"),
+    [
+        # 3 kW of household load on 3 x 230 V: 4.3 A per phase.
+        (3000 + 3 * 230 * 16, 3 * 230 * 16, 19),
+        # Charger idle, heavy household load: only 5 A left, below 6 A.
+        (19 * 3 * 230, 0, 0),
+        # Ceiling is the charger's user-settable maximum.
+        (0, 0, 20),
+        # Export (negative import) never raises the limit above the ceiling.
+        (-5000, 3 * 230 * 10, 20),
+        # Single-phase vehicle at 16 A on L1, household 10 A on every phase:
+        # L1 may carry 14 A more than the household, not 24 A.
+        (3 * 230 * 10 + 230 * 16, 230 * 16, 14),
+    ],
+)
+def test_allowed_charging_current(
+    import_power: float, charger_power: float, expected: int
+) -> None:
+    """The limit keeps a margin below the fuse and respects the ceiling."""
+    assert (
+        allowed_charging_current(
+            import_power=import_power,
+            charger_power=charger_power,
+            voltage=230.0,
+            phases=3,
+            fuse_limit=25,
+            ceiling=20,
+        )
+        == expected
+    )
+
+
+def _limit_writes(mock_client) -> list[int]:
+    return [
+        (call.kwargs["values"][0] << 16 | call.kwargs["values"][1]) // 1000
+        for call in mock_client.write_registers.await_args_list
+        if call.kwargs["address"] == 16640
+    ]
+
+
+async def test_controller_follows_the_meter(hass: HomeAssistant) -> None:
+    """Reductions are written at once; increases wait for lasting headroom."""
+    kwargs = mock_config_entry_kwargs()
+    kwargs["options"].update(
+        {CONF_GRID_POWER_ENTITY: "sensor.grid_power", CONF_MAIN_FUSE_LIMIT: 25}
+    )
+    entry = MockConfigEntry(**kwargs)
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(
+            user_max_amps=32,
+            charging_current_modbus_amps=16,
+            charging_l1_amps=16,
+            voltage_l1=230.0,
+            active_power_wh=3680,
+        ),
+    )
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # 6 A of household load per phase: 18 A allowed, above the 16 A limit.
+    hass.states.async_set("sensor.grid_power", "7800", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    assert _limit_writes(mock_client) == []
+
+    # The household load jumps: the limit drops on this very sample.
+    hass.states.async_set("sensor.grid_power", "14.5", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert _limit_writes(mock_client) == [8]
+    # The next poll reports the new limit.
+    assert "config" not in entry.runtime_data.coordinator._register_group_read_at
+
+    # Load goes away: the increase waits until the headroom has lasted.
+    hass.states.async_set("sensor.grid_power", "3600", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    assert _limit_writes(mock_client) == [8]
+    with patch(_LB_MONOTONIC, return_value=monotonic() + LOAD_BALANCING_INCREASE_DELAY):
+        hass.states.async_set(
+            "sensor.grid_power", "3650", {"unit_of_measurement": "W"}
+        )
+        await hass.async_block_till_done()
+    assert _limit_writes(mock_client) == [8, 24]
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["coordinator"]["load_balancing"]["target"] == 24
+    assert result["coordinator"]["load_balancing"]["writes"] == 2
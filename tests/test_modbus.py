@@ -0,0 +1,607 @@
+"""Tests for the shared Modbus connection pool and request queue."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import socket
+from time import monotonic
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac.const import (
+    CONF_UNIT_ID,
+    MODBUS_MIN_READ_TIMEOUT,
+    PIPELINE_FALLBACK_FAILURES,
+)
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.modbus import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ModbusConnectionKeepalive,
+    ModbusConnectionPool,
+    ModbusRequestDropped,
+    ModbusRequestQueue,
+    RequestPriority,
+    PooledModbusConnection,
+    RttEstimator,
+    async_modbus_call,
+    modbus_client_stats,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pymodbus.exceptions import ModbusIOException
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+
+
+async def test_pool_refcounts_connections_per_host_and_port(
+    hass: HomeAssistant,
+) -> None:
+    """Entries on one host:port share a client that closes after the last one."""
+    pool = ModbusConnectionPool(hass)
+    factory = MagicMock(
+        side_effect=lambda: create_mock_modbus_client(connect=True, read_error=False)
+    )
+
+    first = pool.acquire("10.0.0.2", 502, "a", factory)
+    second = pool.acquire("10.0.0.2", 502, "b", factory)
+    other = pool.acquire("10.0.0.3", 502, "c", factory)
+
+    assert first is second
+    assert other is not first
+    assert factory.call_count == 2
+    assert first.entry_ids == {"a", "b"}
+
+    first.client.connected = True
+    await pool.async_release("10.0.0.2", 502, "a")
+    first.client.close.assert_not_called()
+    assert pool.get("10.0.0.2", 502) is first
+
+    await pool.async_release("10.0.0.2", 502, "b")
+    first.client.close.assert_called_once()
+    assert pool.get("10.0.0.2", 502) is None
+    assert len(pool) == 1
+
+
+async def test_chargers_behind_one_gateway_share_a_socket(
+    hass: HomeAssistant,
+) -> None:
+    """Two unit ids on one gateway poll through one client and one lock."""
+    entries = []
+    for unit_id in (1, 2):
+        kwargs = mock_config_entry_kwargs()
+        kwargs["data"][CONF_UNIT_ID] = unit_id
+        entry = MockConfigEntry(**kwargs)
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client) as client_cls:
+        assert await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+
+    assert client_cls.call_count == 1
+    first, second = (e.runtime_data.coordinator for e in entries)
+    assert first.client is second.client
+    assert first.modbus_lock is second.modbus_lock
+    device_ids = {
+        c.kwargs["device_id"] for c in mock_client.read_holding_registers.await_args_list
+    }
+    assert device_ids == {1, 2}
+
+    # One entry sees the dropped socket and reconnects; the other still
+    # re-reads its identity on its next poll.
+    polls = first.poll_stats.round_trip.count
+    mock_client.connected = False
+    await first._async_update_data()
+    mock_client.read_holding_registers.reset_mock()
+    await second._async_update_data()
+    assert mock_client.read_holding_registers.await_args.kwargs["count"] == 37
+
+    # Each charger counts its own polls; only the first one reconnected,
+    # and reads that are not polls (e.g. a keepalive) are left out.
+    await async_modbus_call(
+        mock_client, "read_holding_registers", address=16384, count=1, device_id=1
+    )
+    assert first.poll_stats.round_trip.count == polls + 1
+    assert (first.poll_stats.reconnects, second.poll_stats.reconnects) == (1, 0)
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entries[1])
+    assert result["coordinator"]["polls"]["reconnects"] == 0
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    mock_client.close.assert_not_called()
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    mock_client.close.assert_called_once()
+
+
+async def test_queue_grants_the_connection_by_priority() -> None:
+    """Writes jump ahead of queued polls; FIFO within one priority."""
+    queue = ModbusRequestQueue()
+    order: list[str] = []
+
+    async def _request(name: str, priority: RequestPriority) -> None:
+        async with queue.slot(priority):
+            order.append(name)
+
+    async with queue.slot(RequestPriority.FAST_POLL):
+        tasks = [
+            asyncio.create_task(_request("slow", RequestPriority.SLOW_POLL)),
+            asyncio.create_task(_request("fast_1", RequestPriority.FAST_POLL)),
+            asyncio.create_task(_request("fix", RequestPriority.FIRMWARE_FIX)),
+            asyncio.create_task(_request("fast_2", RequestPriority.FAST_POLL)),
+            asyncio.create_task(_request("write", RequestPriority.USER_WRITE)),
+        ]
+        await asyncio.sleep(0)
+        assert queue.depth == 5
+
+    await asyncio.gather(*tasks)
+
+    assert order == ["write", "fix", "fast_1", "fast_2", "slow"]
+    assert not queue.locked()
+    stats = queue.as_dict()
+    assert stats["depth"] == 0
+    assert stats["peak_depth"] == 5
+    assert stats["wait"]["fast_poll"]["requests"] == 3
+
+
+async def test_queue_drops_stale_and_cancelled_requests() -> None:
+    """A request past max_wait is dropped; a cancelled one leaves the queue."""
+    queue = ModbusRequestQueue()
+
+    async with queue.slot(RequestPriority.USER_WRITE):
+        with pytest.raises(ModbusRequestDropped):
+            async with queue.slot(RequestPriority.SLOW_POLL, max_wait=0.01):
+                pass
+
+        cancelled = asyncio.create_task(
+            queue.slot(RequestPriority.FAST_POLL).__aenter__()
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert queue.depth == 0
+
+    assert not queue.locked()
+    assert queue.stats[RequestPriority.SLOW_POLL].dropped == 1
+
+
+async def test_queue_grants_parallel_lanes_up_to_its_capacity() -> None:
+    """With capacity 2, two requests run at once on lanes 0 and 1."""
+    queue = ModbusRequestQueue(capacity=2)
+    lanes: list[int] = []
+    release = asyncio.Event()
+
+    async def _request() -> None:
+        async with queue.slot(RequestPriority.FAST_POLL) as lane:
+            lanes.append(lane)
+            await release.wait()
+
+    tasks = [asyncio.create_task(_request()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert sorted(lanes) == [0, 1]
+    assert queue.locked()
+    assert queue.depth == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert not queue.locked()
+    assert queue.peak_in_flight == 2
+
+
+async def test_writes_wait_for_the_primary_session() -> None:
+    """A write is never granted an extra lane; reads may use one."""
+    queue = ModbusRequestQueue(capacity=2)
+
+    async with queue.slot(RequestPriority.FAST_POLL):
+        write = asyncio.create_task(
+            queue.slot(RequestPriority.USER_WRITE, primary=True).__aenter__()
+        )
+        await asyncio.sleep(0)
+        assert not write.done()
+        async with queue.slot(RequestPriority.SLOW_POLL) as lane:
+            assert lane == 1
+    assert await write == 0
+
+
+async def test_lane_failure_retries_on_the_primary_session() -> None:
+    """A failed lane request is retried on lane 0 after releasing its slots."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    lane_client = create_mock_modbus_client(connect=True, read_error=False)
+    lane_client.read_holding_registers.side_effect = ModbusIOException("No response")
+    queue = ModbusRequestQueue(capacity=2, lane_factory=lambda: lane_client)
+    held = []
+
+    @asynccontextmanager
+    async def transaction():
+        held.append(True)
+        try:
+            yield
+        finally:
+            held.pop()
+
+    async with queue.slot(RequestPriority.FAST_POLL):
+        call = asyncio.create_task(
+            async_modbus_call(
+                client,
+                "read_holding_registers",
+                lock=queue,
+                transaction=transaction(),
+                address=16384,
+                count=37,
+            )
+        )
+        await asyncio.sleep(0.01)
+        # The retry waits for the primary session without holding the lane
+        # or the transaction.
+        lane_client.read_holding_registers.assert_awaited_once()
+        client.read_holding_registers.assert_not_awaited()
+        assert not held
+        assert queue.as_dict()["peak_in_flight"] == 2
+    result = await call
+
+    assert not result.isError()
+    client.read_holding_registers.assert_awaited_once()
+    # One lost answer does not turn the parallel sessions off.
+    assert not queue.serial_fallback
+    assert queue.capacity == 2
+    assert queue.lane_failures == 1
+
+
+async def test_repeated_lane_failures_fall_back_to_serial_requests() -> None:
+    """A gateway that only answers its first session gets one request at a time."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    lane_client = create_mock_modbus_client(connect=True, read_error=False)
+    lane_client.read_holding_registers.side_effect = ModbusIOException("No response")
+    queue = ModbusRequestQueue(capacity=2, lane_factory=lambda: lane_client)
+
+    async def read_on_lane() -> None:
+        async with queue.slot(RequestPriority.FAST_POLL):
+            call = asyncio.create_task(
+                async_modbus_call(
+                    client,
+                    "read_holding_registers",
+                    lock=queue,
+                    address=16384,
+                    count=37,
+                )
+            )
+            await asyncio.sleep(0.01)
+        await call
+
+    await read_on_lane()
+    lane_client.read_holding_registers.side_effect = None
+    await read_on_lane()
+    # A lane that answered again resets the count.
+    assert queue.lane_failures == 0
+
+    lane_client.read_holding_registers.side_effect = ModbusIOException("No response")
+    for _ in range(PIPELINE_FALLBACK_FAILURES - 1):
+        await read_on_lane()
+    assert not queue.serial_fallback
+    await read_on_lane()
+
+    lane_client.close.assert_called()
+    assert queue.serial_fallback
+    assert queue.capacity == 1
+    # Later capacity changes cannot re-enable the lanes.
+    queue.capacity = 4
+    assert queue.as_dict()["capacity"] == 1
+
+
+async def test_coordinator_skips_a_dropped_poll(hass: HomeAssistant) -> None:
+    """A poll dropped from the queue keeps the previous data instead of failing."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    previous = coordinator.data
+    mock_client.read_holding_registers.reset_mock()
+
+    with patch.object(coordinator, "_poll_max_wait", return_value=0.01):
+        async with coordinator.modbus_lock.slot(RequestPriority.USER_WRITE):
+            data = await coordinator._async_update_data()
+
+    assert data is previous
+    mock_client.read_holding_registers.assert_not_awaited()
+
+
+async def test_reconnect_in_the_retry_path_rereads_every_group(
+    hass: HomeAssistant,
+) -> None:
+    """A session reopened by a retry makes the next poll read everything."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    mock_client.read_holding_registers.side_effect = [
+        ModbusIOException("No response"),
+        mock_client.read_holding_registers.return_value,
+        mock_client.read_holding_registers.return_value,
+    ]
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+
+    assert mock_client.connect.await_count == 2
+    last_read = mock_client.read_holding_registers.await_args.kwargs
+    assert (last_read["address"], last_read["count"]) == (16384, 37)
+
+
+async def test_modbus_call_records_timings_and_failures() -> None:
+    """Lock wait, connects, round trips, retries and timeouts are counted."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    queue = ModbusRequestQueue()
+
+    await async_modbus_call(
+        client, "read_holding_registers", lock=queue, address=16384, count=37
+    )
+    client.read_holding_registers.side_effect = [
+        ModbusIOException("No response"),
+        client.read_holding_registers.return_value,
+    ]
+    await async_modbus_call(
+        client,
+        "read_holding_registers",
+        lock=queue,
+        retry=True,
+        address=16384,
+        count=37,
+    )
+    await async_modbus_call(client, "write_registers", address=16640, values=[0, 0])
+
+    stats = modbus_client_stats(client).as_dict()
+    assert stats["connects"] == 2
+    assert stats["reconnects"] == 1
+    assert stats["retries"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["errors"] == 0
+    assert stats["lock_wait"]["count"] == 3
+    assert stats["requests"]["fc03"]["count"] == 2
+    assert stats["requests"]["fc16"]["count"] == 1
+    assert sum(stats["requests"]["fc03"]["buckets"].values()) == 2
+    # Every client keeps its own counters.
+    other = create_mock_modbus_client(connect=True, read_error=False)
+    assert modbus_client_stats(other).as_dict()["connects"] == 0
+
+
+def test_rtt_estimator_adapts_within_bounds() -> None:
+    """The timeout follows srtt + 4 * rttvar between the floor and ceiling."""
+    estimator = RttEstimator(floor=0.5, ceiling=3.0)
+    assert estimator.timeout == 3.0
+
+    # A fast charger: the timeout drops to the floor.
+    for _ in range(20):
+        estimator.record(0.03)
+    assert estimator.timeout == 0.5
+
+    # Timeouts double it until the ceiling; an answer resets the backoff.
+    estimator.back_off()
+    assert estimator.timeout == 1.0
+    estimator.back_off()
+    estimator.back_off()
+    assert estimator.timeout == 3.0
+    estimator.record(0.03)
+    assert estimator.timeout == 0.5
+
+    # Slow but healthy Wi-Fi with jitter keeps a longer timeout.
+    slow = RttEstimator(floor=0.5, ceiling=3.0)
+    for rtt in (0.4, 0.9, 0.5, 1.0, 0.45, 0.8):
+        slow.record(rtt)
+    assert 1.0 < slow.timeout < 3.0
+
+
+async def test_unanswered_request_fails_within_the_learned_timeout() -> None:
+    """A charger that answered quickly is given up on well before 3 s."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    for _ in range(10):
+        await async_modbus_call(
+            client, "read_holding_registers", address=16384, count=37
+        )
+    stats = modbus_client_stats(client)
+    assert stats.request_rtt.timeout == MODBUS_MIN_READ_TIMEOUT
+
+    async def _hang(**_: object) -> None:
+        await asyncio.sleep(10)
+
+    client.read_holding_registers.side_effect = _hang
+    started = asyncio.get_running_loop().time()
+    with pytest.raises(asyncio.TimeoutError):
+        await async_modbus_call(
+            client, "read_holding_registers", address=16384, count=37
+        )
+    assert asyncio.get_running_loop().time() - started < 1.0
+    assert stats.timeouts == 1
+    assert stats.request_rtt.timeout == 2 * MODBUS_MIN_READ_TIMEOUT
+
+
+def test_circuit_breaker_backs_off_and_closes_on_a_probe() -> None:
+    """Open after the threshold, one probe per jittered delay, close on success."""
+    breaker = CircuitBreaker(threshold=2, base_delay=10, max_delay=40)
+    with patch("custom_components.abb_terra_ac.modbus.random.uniform", max):
+        breaker.before_connect(0)
+        breaker.record_failure(0)
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure(1)
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_connect(10)
+        # The delay has passed: one probe, others are refused meanwhile.
+        breaker.before_connect(11)
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_connect(11)
+        # A failed probe doubles the delay, up to the maximum.
+        breaker.record_failure(12)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_connect(31)
+        breaker.before_connect(32)
+        breaker.record_failure(32)
+        breaker.before_connect(72)
+        breaker.record_failure(72)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_connect(111)
+        breaker.before_connect(112)
+
+        breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.as_dict() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "trips": 4,
+    }
+
+
+async def test_cancelled_probe_does_not_leave_the_circuit_half_open() -> None:
+    """A probe cancelled mid-connect reopens the circuit for a later probe."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    breaker = modbus_client_stats(client).breaker
+    breaker.state = CircuitState.OPEN
+    connecting = asyncio.Event()
+
+    async def _hang() -> bool:
+        connecting.set()
+        await asyncio.Event().wait()
+        return True
+
+    client.connect.side_effect = _hang
+    probe = asyncio.create_task(
+        async_modbus_call(client, "read_holding_registers", address=16384, count=1)
+    )
+    await connecting.wait()
+    assert breaker.state is CircuitState.HALF_OPEN
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert breaker.state is CircuitState.OPEN
+    breaker.retry_at = 0
+    breaker.before_connect(monotonic())
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+async def test_offline_charger_is_not_reconnected_on_every_poll(
+    hass: HomeAssistant,
+) -> None:
+    """With the circuit open, polls fail without a connect attempt."""
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+    mock_client = create_mock_modbus_client(connect=True, read_error=False)
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    mock_client.connected = False
+    mock_client.connect.side_effect = None
+    mock_client.connect.return_value = False
+    mock_client.connect.reset_mock()
+
+    for _ in range(5):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    assert mock_client.connect.await_count == 2
+    assert modbus_client_stats(mock_client).breaker.state is CircuitState.OPEN
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["client"]["transactions"]["circuit"]["state"] == "open"
+
+
+async def test_connect_enables_tcp_keepalive() -> None:
+    """Every new socket gets OS-level keepalive probes."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+
+    await async_modbus_call(
+        client, "read_holding_registers", address=16384, count=1, device_id=1
+    )
+
+    sock = client.ctx.transport.get_extra_info.return_value
+    sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+async def test_keepalive_refreshes_an_idle_connection(hass: HomeAssistant) -> None:
+    """An idle session gets a heartbeat; a dropped one is reopened at once."""
+    client = create_mock_modbus_client(connect=True, read_error=False)
+    lane_client = create_mock_modbus_client(connect=True, read_error=False)
+    connection = PooledModbusConnection(
+        client, ModbusRequestQueue(capacity=2, lane_factory=lambda: lane_client)
+    )
+    keepalive = ModbusConnectionKeepalive(hass, connection, idle_timeout=60)
+    stats = modbus_client_stats(client)
+
+    # Recently used: nothing to do.
+    await async_modbus_call(
+        client, "read_holding_registers", address=16384, count=1, device_id=1
+    )
+    connection.queue.lane_client(1, client)
+    modbus_client_stats(lane_client).last_activity = monotonic()
+    await keepalive.async_check()
+    assert client.read_holding_registers.await_count == 1
+    lane_client.close.assert_not_called()
+
+    # Idle for half the timeout: one heartbeat read, and the lane is closed.
+    stats.last_activity = modbus_client_stats(lane_client).last_activity = (
+        monotonic() - 31
+    )
+    await keepalive.async_check()
+    assert client.read_holding_registers.await_count == 2
+    assert client.read_holding_registers.await_args.kwargs["count"] == 1
+    lane_client.close.assert_called_once()
+    assert keepalive.stats.heartbeats == 1
+
+    # Dropped by the gateway: reconnected before the next poll, which
+    # still sees a new session.
+    client.connected = False
+    await keepalive.async_check()
+    assert client.connected
+    assert stats.connects == 2
+    assert connection.generation == 2
+    assert keepalive.as_dict() == {
+        "idle_timeout": 60,
+        "heartbeats": 2,
+        "reconnects": 1,
+        "failures": 0,
+    }
+
+
+async def test_one_keepalive_per_shared_connection(hass: HomeAssistant) -> None:
+    """Chargers behind one gateway share a keepalive at the shortest timeout."""
+    pool = ModbusConnectionPool(hass)
+
+    def factory() -> MagicMock:
+        return create_mock_modbus_client(connect=True, read_error=False)
+
+    connection = pool.acquire("10.0.0.2", 502, "a", factory, idle_timeout=60)
+    keepalive = connection.keepalive
+    assert keepalive is not None
+    pool.acquire("10.0.0.2", 502, "b", factory, unit_id=2, idle_timeout=0)
+    assert connection.keepalive is keepalive
+    pool.acquire("10.0.0.2", 502, "c", factory, unit_id=3, idle_timeout=30)
+    assert connection.keepalive is not keepalive
+    assert connection.keepalive.idle_timeout == 30
+
+    await pool.async_release("10.0.0.2", 502, "c")
+    assert connection.keepalive.idle_timeout == 60
+    await pool.async_release("10.0.0.2", 502, "a")
+    assert connection.keepalive is None
+    await pool.async_release("10.0.0.2", 502, "b")
+    assert connection.stop_keepalive is None
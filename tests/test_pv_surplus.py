@@ -0,0 +1,161 @@
+"""Tests for the solar surplus charging mode."""
+
+from __future__ import annotations
+
+from time import monotonic
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.const import (
+    CONF_GRID_EXPORT_ENTITY,
+    CONF_GRID_POWER_ENTITY,
+    CONF_MAIN_FUSE_LIMIT,
+)
+from custom_components.abb_terra_ac.pv_surplus import SurplusControl
+from homeassistant.core import HomeAssistant
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client, make_holding_registers_37
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+_PV_MONOTONIC = "custom_components.abb_terra_ac.pv_surplus.monotonic"
+
+
+def test_surplus_control_filters_and_holds_before_pausing() -> None:
+    """The limit follows the filtered surplus and pauses only after a delay."""
+    control = SurplusControl()
+    limit = 16
+
+    def sample(now: float, export_power: float) -> int | None:
+        nonlocal limit
+        result = control.update(
+            now,
+            export_power=export_power,
+            charger_power=limit * 230,
+            voltage=230.0,
+            phases=1,
+            ceiling=32,
+            limit=limit,
+        )
+        if result is not None:
+            limit = result
+        return result
+
+    # Balanced: the charger already uses exactly the surplus.
+    assert sample(0, 0) is None
+    # A sudden 10 A import is smoothed instead of followed at once.
+    assert sample(1, -2300) == 15
+    # Writes are rate limited.
+    assert sample(5, -2300) is None
+    assert sample(11, -2300) == 11
+
+    # Too little surplus: hold 6 A first, pause (0 A) once it lasted.
+    results = [sample(now, -3000) for now in range(20, 380, 20)]
+    assert [r for r in results if r is not None] == [6, 0]
+    assert results[-1] == 0
+
+    # Surplus returns: resume only after it has lasted a minute.
+    results = [sample(now, 2500) for now in range(400, 480, 10)]
+    assert results[0] is None
+    resumed = next(i for i, r in enumerate(results) if r is not None)
+    assert resumed * 10 >= 60
+    assert results[resumed] >= 6
+
+
+async def test_surplus_mode_follows_the_export_sensor(hass: HomeAssistant) -> None:
+    """The export sensor drives the limit and replaces load balancing."""
+    kwargs = mock_config_entry_kwargs()
+    kwargs["options"].update(
+        {
+            CONF_GRID_EXPORT_ENTITY: "sensor.grid_export",
+            CONF_GRID_POWER_ENTITY: "sensor.grid_power",
+            CONF_MAIN_FUSE_LIMIT: 25,
+        }
+    )
+    entry = MockConfigEntry(**kwargs)
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(
+            socket_lock_raw_32=17,
+            user_max_amps=32,
+            charging_current_modbus_amps=16,
+            charging_l1_amps=16,
+            voltage_l1=230.0,
+            active_power_wh=3680,
+        ),
+    )
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.runtime_data.coordinator.load_balancer is None
+    hass.states.async_set("sensor.grid_power", "0", {"unit_of_measurement": "W"})
+
+    # 5 A more than the charger draws on its single phase.
+    hass.states.async_set("sensor.grid_export", "1150", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    writes = [
+        call.kwargs["values"]
+        for call in mock_client.write_registers.await_args_list
+        if call.kwargs["address"] == 16640
+    ]
+    assert writes == [[0, 21000]]
+
+    # The next sample within the write interval changes nothing.
+    with patch(_PV_MONOTONIC, return_value=monotonic() + 1):
+        hass.states.async_set("sensor.grid_export", "0", {"unit_of_measurement": "W"})
+        await hass.async_block_till_done()
+    assert mock_client.write_registers.await_count == 1
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["coordinator"]["pv_surplus"]["phases"] == 1
+    assert result["coordinator"]["pv_surplus"]["target"] == 21
+    assert result["coordinator"]["load_balancing"] is None
+
+
+async def test_surplus_mode_subtracts_the_grid_import(hass: HomeAssistant) -> None:
+    """An export sensor stuck at 0 while importing still lowers the limit."""
+    kwargs = mock_config_entry_kwargs()
+    kwargs["options"].update(
+        {
+            CONF_GRID_EXPORT_ENTITY: "sensor.grid_export",
+            CONF_GRID_POWER_ENTITY: "sensor.grid_import",
+        }
+    )
+    entry = MockConfigEntry(**kwargs)
+    entry.add_to_hass(hass)
+
+    mock_client = create_mock_modbus_client(
+        connect=True,
+        read_error=False,
+        registers=make_holding_registers_37(
+            socket_lock_raw_32=17,
+            user_max_amps=32,
+            charging_current_modbus_amps=16,
+            charging_l1_amps=16,
+            voltage_l1=230.0,
+            active_power_wh=3680,
+        ),
+    )
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.grid_export", "0", {"unit_of_measurement": "W"})
+    await hass.async_block_till_done()
+    # No import reading yet: the surplus is unknown.
+    assert mock_client.write_registers.await_count == 0
+
+    # The site imports 2.3 kW of the charger's 3.68 kW: 6 A of surplus left.
+    hass.states.async_set("sensor.grid_import", "2.3", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    writes = [
+        call.kwargs["values"]
+        for call in mock_client.write_registers.await_args_list
+        if call.kwargs["address"] == 16640
+    ]
+    assert writes == [[0, 6000]]
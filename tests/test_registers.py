@@ -0,0 +1,144 @@
+"""Unit tests for the register map and the struct-based block decoder."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.abb_terra_ac.registers import (
+    REGISTER_BLOCK_COUNT,
+    REGISTER_FIELDS,
+    REGISTER_GROUP_CONFIG,
+    REGISTER_GROUP_IDENTITY,
+    REGISTER_GROUP_MEASUREMENT,
+    REGISTER_GROUPS,
+    RegisterBlockDecoder,
+    RegisterField,
+    decode_firmware_version,
+    decode_register_block,
+    field_span,
+    fields_in_span,
+    pack_registers_into,
+    register_span,
+)
+
+from tests.helpers.modbus import make_holding_registers_37
+
+
+def _packed(registers: list[int]) -> bytearray:
+    raw = bytearray(REGISTER_BLOCK_COUNT * 2)
+    pack_registers_into(raw, 0, registers)
+    return raw
+
+
+def test_register_groups_tile_the_block() -> None:
+    """Groups cover every register of the 4000h block exactly once."""
+    covered = sorted(
+        offset
+        for group in REGISTER_GROUPS
+        for offset in range(group.offset, group.end)
+    )
+    assert covered == list(range(REGISTER_BLOCK_COUNT))
+
+
+def test_register_span_merges_adjacent_groups() -> None:
+    """Due groups are read with one contiguous request."""
+    assert register_span([REGISTER_GROUP_MEASUREMENT]) == (8, 24)
+    assert register_span([REGISTER_GROUP_MEASUREMENT, REGISTER_GROUP_CONFIG]) == (8, 29)
+    assert register_span(list(REGISTER_GROUPS)) == (0, 37)
+    assert register_span([REGISTER_GROUP_IDENTITY]) == (0, 8)
+
+
+def test_decode_register_block_matches_register_layout() -> None:
+    """Every field decodes to the engineering value it was encoded from."""
+    registers = make_holding_registers_37(
+        charging_state_nibble=4,
+        socket_lock_raw_32=273,
+        error_code=32,
+        user_max_amps=16.0,
+        charging_current_limit_amps=11.0,
+        charging_l1_amps=10.5,
+        charging_current_modbus_amps=12.0,
+        fallback_limit=8,
+        voltage_l1=231.4,
+        active_power_wh=7200,
+        energy_wh=12345,
+    )
+    registers[0:6] = [0x4711, 0x2A00, 0x1224, 0x3456, 0x0102, 0x0300]
+    registers[32] = 60
+    # Unrelated bits in 400Dh (low byte, high nibble) must be ignored.
+    registers[13] |= 0xF0FF
+
+    data = decode_register_block(_packed(registers))
+
+    assert data["serial_number"] == "TACW11-42-1224-G3456"
+    assert data["firmware_version"] == "v1.2.3"
+    assert data["user_settable_max_current"] == pytest.approx(16.0)
+    assert data["error_code"] == 32
+    assert data["socket_lock_state"] == 273
+    assert data["charging_state"] == 4
+    assert data["charging_current_limit"] == pytest.approx(11.0)
+    assert data["charging_current_l1"] == pytest.approx(10.5)
+    assert data["voltage_l1"] == pytest.approx(231.4)
+    assert data["active_power"] == 7200
+    assert data["energy_delivered"] == 12345
+    assert data["communication_timeout"] == 60
+    assert data["charging_current_limit_modbus"] == pytest.approx(12.0)
+    assert data["fallback_limit"] == 8
+    assert set(data) == {f.name for f in REGISTER_FIELDS} | {
+        "serial_number",
+        "firmware_version",
+    }
+
+
+def test_decode_register_block_reuses_known_serial_number() -> None:
+    """A cached serial number is returned without decoding identity registers."""
+    data = decode_register_block(_packed([0] * 37), "TACW22-1-0124-T0001")
+    assert data["serial_number"] == "TACW22-1-0124-T0001"
+
+
+def test_partial_pack_only_touches_its_registers() -> None:
+    """Packing one group leaves the cached values of the other groups intact."""
+    raw = _packed(make_holding_registers_37(fallback_limit=8, energy_wh=100))
+    update = make_holding_registers_37(energy_wh=250)
+    pack_registers_into(
+        raw,
+        REGISTER_GROUP_MEASUREMENT.offset,
+        update[REGISTER_GROUP_MEASUREMENT.offset:REGISTER_GROUP_MEASUREMENT.end],
+    )
+
+    data = decode_register_block(raw)
+    assert data["energy_delivered"] == 250
+    assert data["fallback_limit"] == 8
+
+
+def test_field_span_locates_read_back_registers() -> None:
+    """Read-back slices cover exactly the registers of the mirrored fields."""
+    assert field_span("charging_current_limit_modbus") == (34, 2)
+    assert field_span("fallback_limit") == (36, 1)
+    assert field_span("charging_state") == (13, 1)
+    assert fields_in_span(10, 2) == ("socket_lock_state",)
+    assert fields_in_span(32, 5) == (
+        "communication_timeout",
+        "charging_current_limit_modbus",
+        "fallback_limit",
+    )
+    with pytest.raises(KeyError):
+        field_span("serial_number")
+
+
+def test_firmware_version_is_memoized() -> None:
+    """Repeated polls of the same firmware registers hit the cache."""
+    decode_firmware_version.cache_clear()
+    decode_firmware_version(0x0102, 0x0300)
+    decode_firmware_version(0x0102, 0x0300)
+    info = decode_firmware_version.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_decoder_rejects_overlapping_fields() -> None:
+    """A register map with overlapping fields is a programming error."""
+    with pytest.raises(ValueError, match="overlaps"):
+        RegisterBlockDecoder(
+            [RegisterField("a", 0, "I"), RegisterField("b", 1, "H")]
+        )
@@ -0,0 +1,146 @@
+"""Tests for the fleet-wide poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.modbus import (
+    ModbusRequestQueue,
+    RequestPriority,
+    async_modbus_call,
+)
+from custom_components.abb_terra_ac.scheduler import (
+    _DATA_POLL_SCHEDULER,
+    AbbTerraAcPollScheduler,
+)
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+
+
+def test_phases_spread_evenly_and_follow_the_fleet() -> None:
+    """Each entry owns an even share of the interval; removals re-spread."""
+    scheduler = AbbTerraAcPollScheduler()
+    unregister = [scheduler.async_register(f"entry_{i}") for i in range(4)]
+
+    assert [scheduler.phase(f"entry_{i}") for i in range(4)] == [0, 0.25, 0.5, 0.75]
+
+    unregister[1]()
+    assert scheduler.entry_ids == ("entry_0", "entry_2", "entry_3")
+    assert scheduler.phase("entry_3") == pytest.approx(2 / 3)
+    assert scheduler.phase("unknown") == 0.0
+
+
+def test_next_poll_lands_on_the_entry_slot() -> None:
+    """Next poll times lie on the per-entry grid, at least half an interval out."""
+    scheduler = AbbTerraAcPollScheduler()
+    scheduler.async_register("a")
+    scheduler.async_register("b")
+
+    assert scheduler.next_poll_at("a", 1003.0, 10.0) == 1010.0
+    assert scheduler.next_poll_at("b", 1003.0, 10.0) == 1015.0
+    # Slot 1005 is too close: skip to the following one.
+    assert scheduler.next_poll_at("b", 1001.0, 10.0) == 1015.0
+
+
+async def test_poll_transactions_are_capped_across_the_fleet() -> None:
+    """No more than ``max_concurrent`` polls run at once; stats record waits."""
+    scheduler = AbbTerraAcPollScheduler(max_concurrent=2)
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def _poll() -> None:
+        nonlocal running, peak
+        async with scheduler.async_poll_transaction():
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(_poll()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert running == 2
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    stats = scheduler.as_dict()
+    assert stats["polls"] == 5
+    assert stats["failed_polls"] == 0
+    assert stats["peak_in_flight"] == 2
+    assert stats["in_flight"] == 0
+
+
+async def test_poll_queued_on_a_busy_gateway_holds_no_fleet_slot() -> None:
+    """The fleet slot is taken only once the connection is granted."""
+    scheduler = AbbTerraAcPollScheduler(max_concurrent=1)
+    busy_gateway = ModbusRequestQueue()
+    client = create_mock_modbus_client(connect=True, read_error=False)
+
+    async with busy_gateway.slot(RequestPriority.USER_WRITE):
+        queued = asyncio.create_task(
+            async_modbus_call(
+                client,
+                "read_holding_registers",
+                lock=busy_gateway,
+                priority=RequestPriority.FAST_POLL,
+                transaction=scheduler.async_poll_transaction(),
+                address=16384,
+                count=1,
+            )
+        )
+        await asyncio.sleep(0)
+        # A charger on another gateway still gets the only fleet slot.
+        async with scheduler.async_poll_transaction():
+            assert scheduler.stats.in_flight == 1
+
+    await queued
+    assert scheduler.stats.polls == 2
+
+
+async def test_entries_share_one_scheduler_until_the_last_unloads(
+    hass: HomeAssistant,
+) -> None:
+    """Every entry joins the domain scheduler; it is dropped with the fleet."""
+    entries = []
+    for host in ("192.168.1.50", "192.168.1.51"):
+        kwargs = mock_config_entry_kwargs()
+        kwargs["data"][CONF_HOST] = host
+        entry = MockConfigEntry(**kwargs)
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    with patch(
+        _INIT_MODBUS,
+        side_effect=lambda **_: create_mock_modbus_client(
+            connect=True, read_error=False
+        ),
+    ):
+        # Setting up the integration loads every configured entry.
+        assert await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+
+    scheduler = hass.data[_DATA_POLL_SCHEDULER]
+    assert all(e.runtime_data.coordinator.scheduler is scheduler for e in entries)
+    assert scheduler.entry_ids == tuple(e.entry_id for e in entries)
+    assert scheduler.stats.polls >= 2
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entries[1])
+    assert result["fleet"]["chargers"] == 2
+    assert result["fleet"]["phase"] == 0.5
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    assert scheduler.entry_ids == (entries[1].entry_id,)
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    await hass.async_block_till_done()
+    assert _DATA_POLL_SCHEDULER not in hass.data
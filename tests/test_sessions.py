@@ -0,0 +1,198 @@
+"""Tests for the charging session recorder and its on-disk log."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac import diagnostics
+from custom_components.abb_terra_ac.session_state import SessionState
+from custom_components.abb_terra_ac.sessions import (
+    LifetimeEnergy,
+    SessionLog,
+    SessionRecord,
+    SessionRecorder,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.const import mock_config_entry_kwargs
+from tests.helpers.modbus import create_mock_modbus_client, make_holding_registers_37
+
+_INIT_MODBUS = "custom_components.abb_terra_ac.AsyncModbusTcpClient"
+_T0 = datetime(2026, 1, 5, 18, 0, tzinfo=timezone.utc)
+
+
+def _poll(
+    energy: float, power: float = 0.0, l1: float = 0.0, plugged: bool = True
+) -> Any:
+    return {
+        "energy_delivered": energy,
+        "active_power": power,
+        "charging_current_l1": l1,
+        "charging_current_l2": 0.0,
+        "charging_current_l3": 0.0,
+        "socket_lock_state": 273 if plugged else 0,
+    }
+
+
+def test_recorder_builds_a_session_with_pauses() -> None:
+    """Energy, peaks and pause periods accumulate until the cable is unplugged."""
+    recorder = SessionRecorder()
+    steps = [
+        (_poll(0), SessionState.IDLE),
+        (_poll(50, 3600, 16), SessionState.ACTIVE),
+        (_poll(1200, 7400, 32), SessionState.ACTIVE),
+        (_poll(1200), SessionState.PAUSED_BY_CURRENT),
+        (_poll(1200), SessionState.PAUSED_BY_CURRENT),
+        (_poll(2500, 7000, 30), SessionState.ACTIVE),
+        (_poll(2500), SessionState.COMPLETED),
+    ]
+    for minute, (data, state) in enumerate(steps):
+        assert recorder.update(_T0 + timedelta(minutes=minute), data, state) == []
+
+    assert recorder.current is not None
+    (record,) = recorder.update(
+        _T0 + timedelta(minutes=10), _poll(2500, plugged=False), SessionState.IDLE
+    )
+
+    assert recorder.current is None
+    assert record.start == _T0 + timedelta(minutes=1)
+    assert record.end == _T0 + timedelta(minutes=10)
+    assert record.energy_wh == 2500
+    assert record.peak_power_w == 7400
+    assert record.max_current_a == [32, 0, 0]
+    assert record.pauses == [(_T0 + timedelta(minutes=3), _T0 + timedelta(minutes=5))]
+    assert record.paused_seconds == 120
+
+
+def test_recorder_splits_on_energy_reset_and_ignores_glitches() -> None:
+    """A register reset starts a new session; a small drop is not counted twice."""
+    recorder = SessionRecorder()
+    recorder.update(_T0, _poll(400), SessionState.ACTIVE)
+    recorder.update(_T0 + timedelta(minutes=1), _poll(380), SessionState.ACTIVE)
+    recorder.update(_T0 + timedelta(minutes=2), _poll(500), SessionState.ACTIVE)
+
+    (first,) = recorder.update(
+        _T0 + timedelta(minutes=3), _poll(20), SessionState.ACTIVE
+    )
+
+    assert first.energy_wh == 500
+    assert recorder.current is not None
+    assert recorder.current.start == _T0 + timedelta(minutes=3)
+    assert recorder.current.energy_wh == 20
+
+
+def test_record_round_trips_through_the_compact_line() -> None:
+    """The log line is compact JSON that parses back to the same record."""
+    record = SessionRecord(
+        start=_T0,
+        end=_T0 + timedelta(hours=2),
+        energy_wh=11000.0,
+        peak_power_w=7400.0,
+        max_current_a=[32.0, 31.5, 0.0],
+        pauses=[(_T0 + timedelta(minutes=30), _T0 + timedelta(minutes=40))],
+        paused_seconds=600.0,
+    )
+
+    line = record.to_line()
+
+    assert " " not in line
+    assert SessionRecord.from_line(line) == record
+
+
+def test_lifetime_energy_accumulates_across_sessions() -> None:
+    """Session resets add the new session in full; glitches are ignored."""
+    lifetime = LifetimeEnergy()
+    assert lifetime.update(300, plugged=True) == 0
+    assert lifetime.update(900, plugged=True) == 600
+    # Read glitch: a small drop while the session keeps running.
+    assert lifetime.update(850, plugged=True) == 600
+    assert lifetime.update(1000, plugged=True) == 700
+    # Register reset by a new session seen mid-poll.
+    assert lifetime.update(150, plugged=True) == 850
+    # A short session after an unplug: any drop is a new session.
+    assert lifetime.update(150, plugged=False) == 850
+    assert lifetime.update(60, plugged=True) == 910
+    assert lifetime.update(40, plugged=True) == 910
+
+
+def test_lifetime_energy_resumes_after_a_restart() -> None:
+    """Restored state counts energy delivered while Home Assistant was down."""
+    saved = LifetimeEnergy(total_wh=5000, last_register_wh=1200).as_dict()
+
+    same_session = LifetimeEnergy.from_dict(saved)
+    assert same_session.update(1500, plugged=True) == 5300
+
+    charger_rebooted = LifetimeEnergy.from_dict(saved)
+    assert charger_rebooted.update(1150, plugged=True) == 6150
+
+
+async def test_session_log_appends_and_returns_the_latest(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """The log is append-only and queries return the last N sessions."""
+    hass.config.config_dir = str(tmp_path)
+    log = SessionLog(hass, "entry")
+    records = [
+        SessionRecord(
+            start=_T0 + timedelta(days=day), end=_T0 + timedelta(days=day, hours=1)
+        )
+        for day in range(5)
+    ]
+
+    assert await log.async_get_sessions(3) == []
+    await log.async_append(records[:2])
+    await log.async_append(records[2:])
+
+    assert len(log.path.read_text().splitlines()) == 5
+    assert await log.async_get_sessions(3) == records[2:]
+
+    await log.async_remove()
+    assert not log.path.exists()
+
+
+async def test_coordinator_logs_finished_sessions(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Polls feed the recorder; a finished session is queryable and in diagnostics."""
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(**mock_config_entry_kwargs())
+    entry.add_to_hass(hass)
+
+    charging = make_holding_registers_37(
+        charging_state_nibble=4,
+        socket_lock_raw_32=273,
+        charging_l1_amps=16,
+        charging_current_modbus_amps=16,
+        active_power_wh=3600,
+        energy_wh=800,
+    )
+    mock_client = create_mock_modbus_client(
+        connect=True, read_error=False, registers=charging
+    )
+
+    with patch(_INIT_MODBUS, return_value=mock_client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.session_recorder.current is not None
+
+    mock_client.read_holding_registers.return_value.registers = (
+        make_holding_registers_37()
+    )
+    coordinator.invalidate_register_groups()
+    await coordinator._async_update_data()
+    await hass.async_block_till_done()
+
+    (session,) = await coordinator.async_get_sessions(10)
+    assert session["energy_wh"] == 800
+    assert session["peak_power_w"] == 3600
+
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["sessions"]["current"] is None
+    assert result["sessions"]["recent"] == [session]
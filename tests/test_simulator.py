@@ -0,0 +1,115 @@
+"""End-to-end tests against the local Modbus TCP charger simulator."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pymodbus.client import AsyncModbusTcpClient
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abb_terra_ac.const import DOMAIN
+from custom_components.abb_terra_ac.registers import (
+    REGISTER_BLOCK_COUNT,
+    REGISTER_GROUP_CONFIG,
+    decode_register_block,
+    pack_registers_into,
+)
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from tests.const import MOCK_ENTRY_OPTIONS
+from tests.helpers.simulator import (
+    FIRMWARE_RESET_FALLBACK_LIMIT,
+    HOST,
+    PROFILE_CHARGING,
+    REG_CURRENT_LIMIT,
+    REG_FALLBACK_LIMIT,
+    REG_START_STOP,
+    REGISTER_BLOCK_ADDRESS,
+    ChargerState,
+    TerraAcSimulator,
+)
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+async def _read_block(client: AsyncModbusTcpClient) -> dict:
+    result = await client.read_holding_registers(
+        address=REGISTER_BLOCK_ADDRESS, count=REGISTER_BLOCK_COUNT
+    )
+    assert not result.isError()
+    raw = bytearray(REGISTER_BLOCK_COUNT * 2)
+    pack_registers_into(raw, 0, result.registers)
+    return dict(decode_register_block(raw))
+
+
+async def test_simulator_serves_block_and_control_registers() -> None:
+    """Reads decode like a real charger and writes show up in the mirrors."""
+    async with TerraAcSimulator(ChargerState(user_max_current=32.0)) as sim:
+        sim.play(PROFILE_CHARGING)
+        client = AsyncModbusTcpClient(HOST, port=sim.port, timeout=1)
+        await client.connect()
+        try:
+            data = await _read_block(client)
+            assert data["serial_number"].startswith("TACW22-")
+            assert data["charging_state"] == 4
+            assert data["charging_current_l1"] == pytest.approx(16.0)
+
+            result = await client.write_registers(
+                address=REG_CURRENT_LIMIT, values=[0, 10_000]
+            )
+            assert not result.isError()
+            result = await client.write_register(address=REG_FALLBACK_LIMIT, value=8)
+            assert not result.isError()
+            result = await client.write_register(address=REG_START_STOP, value=1)
+            assert not result.isError()
+
+            data = await _read_block(client)
+            assert data["charging_current_limit_modbus"] == pytest.approx(10.0)
+            assert data["fallback_limit"] == 8
+            assert data["charging_state"] == 5
+
+            result = await client.read_holding_registers(address=0x3000, count=1)
+            assert result.isError()
+        finally:
+            client.close()
+
+
+async def test_integration_polls_simulator_and_fixes_firmware_reset(
+    hass: HomeAssistant,
+) -> None:
+    """A reboot resetting both limits is detected and repaired over the wire."""
+    async with TerraAcSimulator(
+        ChargerState(current_limit_ma=10_000, fallback_limit=6)
+    ) as sim:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            data={CONF_HOST: HOST, CONF_PORT: sim.port},
+            options=MOCK_ENTRY_OPTIONS.copy(),
+        )
+        entry.add_to_hass(hass)
+        # A request the charger drops is only failed by the client timeout.
+        with patch("custom_components.abb_terra_ac.MODBUS_READ_TIMEOUT", 0.2):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data.coordinator
+        assert coordinator.data["charging_current_limit_modbus"] == pytest.approx(10.0)
+
+        sim.reboot()
+        assert sim.state.fallback_limit == FIRMWARE_RESET_FALLBACK_LIMIT
+        coordinator.invalidate_register_groups(REGISTER_GROUP_CONFIG)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert sim.state.fallback_limit == 6
+        assert sim.state.current_limit_ma == 10_000
+        assert sim.stats.connections == 2
+
+        sim.drop_next()
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert sim.stats.dropped == 1
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()